@@ -4,11 +4,15 @@ Thin, stateless HTTP wrapper over the FastAPI backend.
 Both hr_app.py and candidate_app.py import from here.
 
 Env vars / Streamlit secrets:
-  TALENTOS_API_URL — backend base URL (default: http://localhost:8000)
+  TALENTOS_API_URL   — backend base URL (default: http://localhost:8000)
+  TALENTOS_ASSET_URL — backend URL as the browser sees it, for the theme
+                       stylesheet (default: TALENTOS_API_URL; "inline"
+                       sends the CSS with every rerun instead)
 """
 
 from __future__ import annotations
 
+import base64
 import os
 from typing import Any, Optional
 
@@ -28,6 +32,7 @@ def _env(key: str, default: str = "") -> str:
 
 
 _BASE    = _env("TALENTOS_API_URL", "http://localhost:8000").rstrip("/")
+_ASSETS  = _env("TALENTOS_ASSET_URL", "").rstrip("/")   # browser-reachable API URL; unset = inline CSS
 _TIMEOUT = 8   # seconds
 
 
@@ -107,6 +112,16 @@ def create_job(
     })
 
 
+def get_job_embedding(job_id: str) -> Optional[dict]:
+    """Return {job_id, model, dim, dtype, vector_b64} or None if not computed yet."""
+    try:
+        return _get(f"/jobs/{job_id}/embedding")
+    except requests.HTTPError as e:
+        if e.response.status_code == 404:
+            return None
+        raise
+
+
 def update_job_status(job_id: str, new_status: str) -> dict:
     """Set job status to live | draft | closed."""
     return _patch(f"/jobs/{job_id}/status", {"status": new_status})
@@ -128,15 +143,23 @@ def submit_report(
     skill_match_score: int,
     final_report: str,
     transcript: list[dict],
+    profile_text: str = "",
+    skill_breakdown: Optional[list[dict]] = None,
+    assessment_id: str = "",
+    candidate_email: str = "",
 ) -> dict:
     """Submit a completed candidate report. Returns the saved report dict."""
     return _post(f"/reports/{job_id}", {
         "candidate_name":    candidate_name,
+        "candidate_email":   candidate_email,
         "ats_score":         ats_score,
         "interview_score":   interview_score,
         "skill_match_score": skill_match_score,
         "final_report":      final_report,
         "transcript":        transcript,
+        "profile_text":      profile_text,
+        "skill_breakdown":   skill_breakdown or [],
+        "assessment_id":     assessment_id,
     })
 
 
@@ -156,10 +179,77 @@ def get_all_reports() -> dict:
         return {}
 
 
+# ─────────────────────────────────────────────────────────────
+# CANDIDATE SEARCH
+# ─────────────────────────────────────────────────────────────
+
+def rank_candidates(
+    job_id: str, texts: list[str], ids: Optional[list[str]] = None, top_k: Optional[int] = None,
+) -> list[dict]:
+    """Hybrid ATS ranking of many resumes against one job, best first."""
+    payload: dict = {"texts": texts, "ids": ids or []}
+    if top_k is not None:
+        payload["top_k"] = top_k
+    return _post(f"/jobs/{job_id}/rank", payload)
+
+
+def search_candidates(query: str = "", job_id: str = "", k: int = 10) -> list[dict]:
+    """Past applicants ranked by profile similarity to free text or a job."""
+    return _post("/search/candidates", {"query": query, "job_id": job_id, "k": k})
+
+
+# ─────────────────────────────────────────────────────────────
+# ASSESSMENT JOBS
+# ─────────────────────────────────────────────────────────────
+
+def create_assessment(
+    job_id: str,
+    candidate_name: str,
+    resume_bytes: bytes,
+    content_type: str,
+    links: list[str] | None = None,
+    candidate_email: str = "",
+    reuse_duplicate: bool = False,
+) -> dict:
+    """
+    Queue the resume pipeline on the backend. Returns the assessment dict.
+    reuse_duplicate reuses the same candidate's earlier near-duplicate result.
+    """
+    return _post("/assessments", {
+        "job_id":          job_id,
+        "candidate_name":  candidate_name,
+        "candidate_email": candidate_email,
+        "resume_b64":      base64.b64encode(resume_bytes).decode("ascii"),
+        "content_type":    content_type,
+        "links":           links or [],
+        "reuse_duplicate": reuse_duplicate,
+    })
+
+
+def get_assessment(assessment_id: str) -> Optional[dict]:
+    """Return assessment status/progress/result, or None if not found."""
+    try:
+        return _get(f"/assessments/{assessment_id}")
+    except requests.HTTPError as e:
+        if e.response.status_code == 404:
+            return None
+        raise
+
+
 # ─────────────────────────────────────────────────────────────
 # HEALTH CHECK
 # ─────────────────────────────────────────────────────────────
 
+def asset_base_url() -> str:
+    """
+    Base URL the browser loads /theme/... from; "" (inline the CSS) unless
+    TALENTOS_ASSET_URL is set. TALENTOS_API_URL is not used as a default: it
+    is often only reachable server-to-server, and a <link> the browser
+    cannot load drops the styling without any error.
+    """
+    return "" if _ASSETS == "inline" else _ASSETS
+
+
 def health_check() -> bool:
     """Returns True if API is reachable."""
     try:
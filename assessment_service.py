@@ -0,0 +1,394 @@
+"""
+TalentOS · Assessment Pipeline
+Streamlit-free implementation of the candidate assessment stages so the same
+code runs inside candidate_app.py and in the FastAPI worker pool (main.py).
+
+Stages (run_assessment):
+  extract → crawl → profile → ats → questions
+
+Interview evaluation helpers (evaluate_answer, score_interview,
+generate_report) also live here; they only depend on the LLM client.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+from crawl_cleaning import clean_sources
+from keyword_index import build_job_index
+from pdf_service import HAS_FITZ as HAS_PDF, LinkPlan, extract_hyperlinks, extract_text as extract_pdf_text, triage_links
+from context_packing import Section, condense, pack_profile_context, pack_sections
+from lazy_imports import has_module
+from llm_scheduler import Priority, estimate_tokens, get_scheduler
+from tracing import in_context, span
+
+# ── Optional imports (graceful fallback) ─────────────────────────────────────
+# openai (~1 s to import) loads on the first get_llm() call, not here.
+HAS_OPENAI = has_module("openai")
+
+try:
+    from firecrawl_service import CrawlBudget, FirecrawlService, ScrapeMode
+    HAS_FIRECRAWL = True
+except ImportError:
+    HAS_FIRECRAWL = False
+
+try:
+    from config import Config
+    HAS_CONFIG = True
+except ImportError:
+    HAS_CONFIG = False
+
+try:
+    from openrouter_service import chat_with_reasoning_followup
+    HAS_OR = True
+except ImportError:
+    HAS_OR = False
+
+try:
+    from transformer_service import calculate_match_score, compose_job_text, fuse_scores, skill_match
+    HAS_TRANSFORMER = True
+except ImportError:
+    HAS_TRANSFORMER = False
+
+
+def _key(name: str) -> str:
+    if HAS_CONFIG and getattr(Config, name, None):
+        return getattr(Config, name)
+    return os.getenv(name, "")
+
+
+# ─────────────────────────────────────────────────────────────
+# CONSTANTS & CONFIG
+# ─────────────────────────────────────────────────────────────
+MODEL              = os.getenv("OPENROUTER_MODEL", "arcee-ai/trinity-large-preview:free")
+NUM_QUESTIONS      = 4
+OPENROUTER_API_KEY = _key("OPENROUTER_API_KEY")
+FIRECRAWL_API_KEY  = _key("FIRECRAWL_API_KEY")
+OPENROUTER_BASE_URL = _key("OPENROUTER_BASE_URL") or "https://openrouter.ai/api/v1"
+FIRECRAWL_API_URL   = _key("FIRECRAWL_API_URL") or "https://api.firecrawl.dev"
+
+STAGES = ["extract", "crawl", "profile", "ats", "questions"]
+
+# Firecrawl mode/budgets — most resume links only need the landing page.
+CRAWL_MODE      = os.getenv("TALENTOS_CRAWL_MODE", "scrape")      # landing links: scrape | batch
+MAX_CRAWL_LINKS = int(os.getenv("TALENTOS_MAX_CRAWL_LINKS", "6"))
+CRAWL_MAX_PAGES = int(os.getenv("TALENTOS_CRAWL_MAX_PAGES", "3"))
+CRAWL_MAX_DEPTH = int(os.getenv("TALENTOS_CRAWL_MAX_DEPTH", "1"))
+CRAWL_TIMEOUT   = float(os.getenv("TALENTOS_CRAWL_TIMEOUT", "20"))
+
+# Token budgets for prompt context (see context_packing.py)
+SOURCE_TOKEN_CAP      = int(os.getenv("TALENTOS_SOURCE_TOKEN_CAP", "1500"))
+PROFILE_TOKEN_BUDGET  = int(os.getenv("TALENTOS_PROFILE_TOKEN_BUDGET", "6000"))
+REPORT_TOKEN_BUDGET   = int(os.getenv("TALENTOS_REPORT_TOKEN_BUDGET", "4000"))
+
+ProgressFn = Callable[[str, str], None]
+
+
+# ─────────────────────────────────────────────────────────────
+# RESOURCES
+# ─────────────────────────────────────────────────────────────
+@lru_cache(maxsize=1)
+def get_llm():
+    if HAS_OPENAI and OPENROUTER_API_KEY:
+        from openai import OpenAI  #type: ignore
+        return OpenAI(
+            base_url=OPENROUTER_BASE_URL,
+            api_key=OPENROUTER_API_KEY,
+        )
+    return None
+
+
+# ─────────────────────────────────────────────────────────────
+# FIRECRAWL INTEGRATION
+# ─────────────────────────────────────────────────────────────
+@lru_cache(maxsize=1)
+def get_firecrawl() -> Optional[FirecrawlService]:
+    if HAS_FIRECRAWL and FIRECRAWL_API_KEY:
+        return FirecrawlService(api_key=FIRECRAWL_API_KEY, api_url=FIRECRAWL_API_URL)
+    return None
+
+
+def crawl_candidate_links(plans: list[LinkPlan]) -> str:
+    """Crawl triaged links: landing-policy links as single pages, deep ones bounded."""
+    firecrawl = get_firecrawl()
+    if not plans or firecrawl is None:
+        return ""
+    budget  = CrawlBudget(max_pages=CRAWL_MAX_PAGES, max_depth=CRAWL_MAX_DEPTH, timeout=CRAWL_TIMEOUT)
+    groups  = [
+        (CRAWL_MODE, [p.url for p in plans if p.mode != "deep"]),
+        (ScrapeMode.CRAWL, [p.url for p in plans if p.mode == "deep"]),
+    ]
+    groups  = [(mode, urls) for mode, urls in groups if urls]
+    with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+        batches = list(pool.map(in_context(lambda g: firecrawl.scrape_links(g[1], mode=g[0], budget=budget)), groups))
+    by_url  = {r["url"]: r for batch in batches for r in batch}
+    results = [by_url[p.url] for p in plans if p.url in by_url]   # keep ranked order
+    scraped = [(r["url"], r["content"]) for r in results if r["ok"] and r["content"]]
+    failed  = [f"--- Source: {r['url']} (fetch failed: {r['error']}) ---\n" for r in results if not r["ok"]]
+
+    with span("crawl.clean", sources=len(scraped)) as sp:
+        cleaned, stats = clean_sources(scraped)
+        sp.set(**stats.as_dict())
+    blocks = []
+    for url, content in cleaned:
+        # Condense on sentence boundaries instead of a blind slice;
+        # build_profile() re-packs all sources against one budget.
+        content = condense(content, SOURCE_TOKEN_CAP)
+        if content:
+            blocks.append(f"--- Source: {url} ---\n{content}\n")
+    return "\n".join(blocks + failed)
+
+
+def extract_pdf_links(file_bytes: bytes) -> list[str]:
+    if not HAS_PDF:
+        return []
+    try:
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
+            tmp.write(file_bytes)
+            tmp_path = tmp.name
+        links = extract_hyperlinks(tmp_path)
+        os.unlink(tmp_path)
+        return links
+    except Exception:
+        return []
+
+
+# ─────────────────────────────────────────────────────────────
+# LLM HELPERS
+# ─────────────────────────────────────────────────────────────
+def llm_chat(
+    prompt: str, system: str = "", followup: str = "",
+    priority: Priority = Priority.INTERACTIVE,
+) -> str:
+    llm = get_llm()
+    if not llm:
+        return "⚠ LLM not configured. Set OPENROUTER_API_KEY."
+    with span("llm.chat", model=MODEL, prompt_chars=len(prompt), priority=priority.name) as sp:
+        if HAS_OR:
+            res = chat_with_reasoning_followup(
+                client=llm, initial_prompt=prompt,
+                follow_up_prompt=followup or "Provide the final output. No reasoning tags.",
+                model=MODEL, priority=priority,
+            )
+            sp.set(response_chars=len(res.content or ""))
+            return res.content
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+        resp = get_scheduler().call(
+            lambda: llm.chat.completions.create(model=MODEL, messages=messages, max_tokens=2000),
+            priority=priority,
+            est_tokens=estimate_tokens(system, prompt, completion=2000),
+        )
+        usage = getattr(resp, "usage", None)
+        if usage is not None:
+            sp.set(prompt_tokens=usage.prompt_tokens, completion_tokens=usage.completion_tokens)
+        return resp.choices[0].message.content.strip()
+
+
+def readable_resume_text(resume_bytes: bytes, content_type: str) -> str:
+    """The resume's own words: the PDF text layer or a text/* body; "" for images and unreadable files."""
+    if content_type == "application/pdf" or resume_bytes[:5] == b"%PDF-":
+        return extract_pdf_text(resume_bytes)
+    if content_type.startswith("text/"):
+        return resume_bytes.decode("utf-8", errors="replace")
+    return ""
+
+
+def build_profile(resume_text: str, crawled: str, role: str) -> str:
+    resume_text, crawled = pack_profile_context(resume_text, crawled, PROFILE_TOKEN_BUDGET)
+    return llm_chat(
+        prompt=(
+            f"Create a detailed candidate intelligence profile.\n"
+            f"Target Role: {role}\nResume Data: {resume_text}\n"
+            f"Online Presence / Links: {crawled or '(none scraped)'}"
+        ),
+        followup="Output ONLY the final clean profile. Remove all reasoning.",
+    )
+
+
+def generate_questions(profile: str, role: str) -> list[str]:
+    raw = llm_chat(
+        prompt=(
+            f"You are a senior technical interviewer.\n"
+            f"Generate exactly {NUM_QUESTIONS} sharp, role-specific questions "
+            f"to evaluate the candidate below.\n"
+            f"Target Role: {role}\nProfile: {profile}\n"
+            f"Rules: tie each question to the profile; mix behavioural, "
+            f"situational, and technical; avoid generic openers."
+        ),
+        followup=(
+            f"Return ONLY a numbered list of {NUM_QUESTIONS} questions, "
+            "one per line. No headers, no explanations."
+        ),
+    )
+    lines = [q.strip() for q in raw.split("\n") if q.strip()]
+    return lines[:NUM_QUESTIONS] if len(lines) >= NUM_QUESTIONS else (
+        lines + [f"Tell us about a challenging project in your {role} career."] * (NUM_QUESTIONS - len(lines))
+    )
+
+
+_SKIPPED_ANSWERS = ("(skipped)", "(no answer)")
+EVAL_FALLBACK    = {"interview_score": 65, "skill_match_score": 68, "rationale": "(evaluation unavailable)"}
+
+
+def evaluate_answer(question: str, answer: str, role: str) -> dict:
+    """Score a single answer. Runs in the background while the interview continues."""
+    if answer in _SKIPPED_ANSWERS:
+        return {"interview_score": 0, "skill_match_score": 0, "rationale": "No answer given."}
+    with span("interview.evaluate_answer", answer_chars=len(answer)):
+        raw = llm_chat(
+            prompt=(
+                f"Evaluate this interview answer for the role: {role}\n"
+                f"Q: {question}\nA: {answer}\n"
+                'Return a JSON object: {"interview_score": <int 0-100>, '
+                '"skill_match_score": <int 0-100>, "rationale": "<one or two sentences>"}'
+            ),
+            followup="Return ONLY the JSON object. No explanation.",
+            priority=Priority.BACKGROUND,
+        )
+    try:
+        raw_clean = raw.strip().replace("```json", "").replace("```", "").strip()
+        data = json.loads(raw_clean)
+        return {
+            "interview_score":   int(data.get("interview_score", 65)),
+            "skill_match_score": int(data.get("skill_match_score", 65)),
+            "rationale":         str(data.get("rationale", "")).strip(),
+        }
+    except Exception:
+        return dict(EVAL_FALLBACK)
+
+
+def score_interview(evals: list[dict], skill_score: Optional[int] = None) -> tuple[int, int]:
+    """
+    Aggregate the precomputed per-answer evaluations. skill_score is the
+    deterministic resume skill match from run_assessment(); the LLM's
+    per-answer skill estimates are only used when it is missing.
+    """
+    if not evals:
+        return 55, (60 if skill_score is None else skill_score)
+    iv = sum(e["interview_score"] for e in evals) / len(evals)
+    if skill_score is None:
+        skill_score = sum(e["skill_match_score"] for e in evals) / len(evals)
+    return int(round(iv)), int(round(skill_score))
+
+
+def generate_report(profile: str, role: str, qa_pairs: list, evals: list[dict]) -> str:
+    """
+    Narrative part of the report, built from the per-answer evaluations.
+    Scores are merged in afterwards by merge_report_scores().
+    """
+    qa_text = "\n".join(
+        [f"Q{i+1}: {qa['question']}\nAssessment {i+1} ({ev['interview_score']}/100): {ev['rationale']}"
+         for i, (qa, ev) in enumerate(zip(qa_pairs, evals))]
+    )
+    packed  = pack_sections(
+        [Section("profile", profile, 1.0), Section("transcript", qa_text, 1.0)],
+        REPORT_TOKEN_BUDGET,
+    )
+    profile, qa_text = packed["profile"], packed["transcript"]
+    return llm_chat(
+        prompt=(
+            f"Write a comprehensive candidate evaluation report.\n"
+            f"Role: {role}\n"
+            f"Profile: {profile}\nPer-question assessments:\n{qa_text}\n"
+            "Do not invent numeric scores — they are added separately.\n"
+            "Sections: ## Executive Summary / ## Technical Competency / "
+            "## Interview Analysis / ## Strengths / ## Development Areas / "
+            "## Cultural Fit / ## Hiring Recommendation / ## Final Verdict"
+        ),
+        followup="Write the final polished report. Use markdown headers. Remove reasoning.",
+        priority=Priority.DEFERRABLE,
+    )
+
+
+def merge_report_scores(report: str, role: str, ats: int, iv: int, skill: int) -> str:
+    header = f"Role: {role} | ATS: {ats}% | Interview: {iv}% | Skill Match: {skill}%"
+    return f"{header}\n\n{report}"
+
+
+# ─────────────────────────────────────────────────────────────
+# PIPELINE
+# ─────────────────────────────────────────────────────────────
+def run_assessment(
+    resume_bytes: bytes,
+    content_type: str,
+    manual_links: list[str],
+    job: dict,
+    ats_model: Any = None,
+    progress: Optional[ProgressFn] = None,
+    jd_embedding: Any = None,
+    job_index: Any = None,
+) -> dict:
+    """
+    Run the five upload stages and return the results the interview needs.
+    progress(stage, message) is called as each stage starts. jd_embedding is
+    the job's precomputed vector (GET /jobs/{id}/embedding); without it, or
+    with max/topk pooling, the full job text is encoded here. job_index is
+    its prebuilt keyword index (keyword_index.JobIndex), built from the job
+    alone when missing.
+    """
+    report = progress or (lambda stage, message: None)
+    role   = job.get("title", "the target role")
+
+    with span("pipeline.assessment", job_id=job.get("id", ""), bytes=len(resume_bytes)):
+        report("extract", "⬡ Stage 1 · Extracting resume content…")
+        with span("pipeline.extract", content_type=content_type) as sp:
+            pdf_links = []
+            if content_type == "application/pdf":
+                pdf_links = extract_pdf_links(resume_bytes)
+            # Canonicalize, drop skip-policy domains and keep the most valuable links.
+            plans     = triage_links(list(manual_links) + pdf_links, limit=MAX_CRAWL_LINKS)
+            all_links = [p.url for p in plans]
+            sp.set(links_in=len(pdf_links) + len(manual_links), links=len(all_links))
+
+        with span("pipeline.crawl", links=len(all_links)) as sp:
+            if all_links:
+                report("crawl", f"◈ Stage 2 · Crawling {len(all_links)} candidate links…")
+                crawled = crawl_candidate_links(plans)
+            else:
+                report("crawl", "◈ Stage 2 · No external links to crawl — skipping.")
+                crawled = ""
+            sp.set(bytes=len(crawled.encode("utf-8")))
+
+        report("profile", "◎ Stage 3 · Synthesising intelligence profile…")
+        with span("pipeline.profile"):
+            resume_text  = readable_resume_text(resume_bytes, content_type)
+            profile_text = build_profile(
+                resume_text or resume_bytes[:8000].decode("utf-8", errors="replace"), crawled, role,
+            )
+
+        report("ats", "◈ Stage 4 · Computing ATS semantic match…")
+        with span("pipeline.ats", model_loaded=bool(ats_model), jd_cached=jd_embedding is not None):
+            # Skill credit needs the candidate's own sentences, never the LLM profile;
+            # an unreadable resume (image, no text layer) gets no skill score.
+            lexical  = (job_index or build_job_index(job)).score(f"{resume_text}\n{profile_text}")
+            semantic = None
+            skills   = {"score": None, "skills": []}
+            if HAS_TRANSFORMER and ats_model:
+                semantic = calculate_match_score(
+                    profile_text, compose_job_text(job), ats_model, jd_embedding=jd_embedding,
+                )
+                skills   = skill_match(job, resume_text, ats_model)
+            ats_score = int(round(fuse_scores(semantic, lexical))) if HAS_TRANSFORMER else int(round(lexical))
+
+        report("questions", "▶ Stage 5 · Generating personalised interview questions…")
+        with span("pipeline.questions"):
+            questions = generate_questions(profile_text, role)
+
+    return {
+        "resume_links":        all_links,
+        "crawled_data":        crawled,
+        "profile_text":        profile_text,
+        "ats_score":           ats_score,
+        "ats_components":      {"semantic": semantic, "lexical": round(lexical, 2)},
+        "skill_match_score":   skills["score"],
+        "skill_breakdown":     skills["skills"],
+        "interview_questions": questions,
+    }
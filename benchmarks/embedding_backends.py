@@ -0,0 +1,190 @@
+"""
+TalentOS · Embedding Backend Parity & Benchmark
+Compares the sentence-transformers (torch) and int8 ONNX backends of
+transformer_service. Each backend runs in its own subprocess so load time
+and peak RSS are measured from a cold interpreter.
+
+  python benchmarks/embedding_backends.py
+  python benchmarks/embedding_backends.py --model /path/to/st-model --onnx-dir /path/to/export -n 2000
+
+Parity: per-sentence cosine between the two backends' embeddings must be
+≥ --tolerance (default 0.98 for int8), the ATS-style match scores must
+agree within --score-tolerance points, and each sentence's nearest
+neighbour must be the same under both backends for ≥ MIN_NEIGHBOUR_AGREE
+of the sentences. Exits 1 when parity fails, so it can gate a deploy after
+scripts/export_onnx_model.py. tests/test_embedding_backends.py asserts the
+same thresholds under pytest.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+MIN_COSINE          = 0.98    # per-sentence fp32 ↔ int8 cosine
+MAX_SCORE_DIFF      = 2.0     # ATS match score points
+MIN_NEIGHBOUR_AGREE = 0.9     # share of sentences with the same nearest neighbour
+
+PARITY_SENTENCES = [
+    "Senior backend engineer with eight years of Python and Go experience.",
+    "Designed and operated Kubernetes clusters serving two million requests per day.",
+    "Led a team of five building a real-time fraud detection pipeline on Kafka and Flink.",
+    "Frontend developer focused on React, TypeScript and accessibility.",
+    "Published research on reinforcement learning from human feedback.",
+    "Managed vendor relationships and quarterly budgets for the marketing department.",
+    "I enjoy hiking, photography and cooking for friends.",
+    "Built CI/CD pipelines with GitHub Actions, Terraform and AWS.",
+    "Data scientist experienced in causal inference, A/B testing and PyTorch.",
+    "Mobile engineer shipping Swift and Kotlin apps to millions of users.",
+    "Improved PostgreSQL query latency by 60% through indexing and partitioning.",
+    "Technical writer producing API documentation and developer tutorials.",
+]
+MATCH_PAIRS = [
+    (" ".join(PARITY_SENTENCES[:3]), "Senior Backend Engineer — Python, Kubernetes, distributed systems."),
+    (PARITY_SENTENCES[3], "Senior Backend Engineer — Python, Kubernetes, distributed systems."),
+    (PARITY_SENTENCES[8], "Machine Learning Scientist — experimentation, PyTorch, statistics."),
+    (PARITY_SENTENCES[6], "Machine Learning Scientist — experimentation, PyTorch, statistics."),
+]
+
+
+def _rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+# ─────────────────────────────────────────────────────────────
+# CHILD — one backend, cold process
+# ─────────────────────────────────────────────────────────────
+def child(backend: str, model: str, n: int, batch_size: int) -> dict:
+    rss_start = _rss_mb()
+    t0 = time.perf_counter()
+    import transformer_service as ts
+    m = ts.load_model(model, backend=backend)
+    load_s = time.perf_counter() - t0
+    actual = "onnx" if isinstance(m, ts.OnnxEmbedder) else "torch"
+    rss_loaded = _rss_mb()
+
+    corpus = [PARITY_SENTENCES[i % len(PARITY_SENTENCES)] + f" ({i})" for i in range(n)]
+    m.encode(corpus[:batch_size], batch_size=batch_size)            # warm-up
+    t0 = time.perf_counter()
+    m.encode(corpus, batch_size=batch_size)
+    encode_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(20):
+        m.encode(PARITY_SENTENCES[0])
+    single_ms = (time.perf_counter() - t0) / 20 * 1000
+
+    return {
+        "backend":          actual,
+        "load_s":           round(load_s, 3),
+        "rss_start_mb":     round(rss_start, 1),
+        "rss_loaded_mb":    round(rss_loaded, 1),
+        "rss_peak_mb":      round(_rss_mb(), 1),
+        "sentences_per_s":  round(n / encode_s, 1),
+        "single_ms":        round(single_ms, 2),
+        **parity_outputs(m),
+    }
+
+
+def parity_outputs(model) -> dict:
+    """What compare() checks: unit embeddings of PARITY_SENTENCES and MATCH_PAIRS scores."""
+    import transformer_service as ts
+    return {
+        "embeddings":   ts.encode_normalized(PARITY_SENTENCES, model).tolist(),
+        "match_scores": [ts.calculate_match_score(p, j, model) for p, j in MATCH_PAIRS],
+    }
+
+
+# ─────────────────────────────────────────────────────────────
+# PARENT — run both, compare
+# ─────────────────────────────────────────────────────────────
+def run_child(backend: str, args) -> dict:
+    env = dict(os.environ, TALENTOS_TRACING="0")
+    if args.onnx_dir:
+        env["TALENTOS_ONNX_MODEL_DIR"] = str(args.onnx_dir)
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", backend, "--model", args.model,
+         "-n", str(args.n), "--batch-size", str(args.batch_size)],
+        env=env, capture_output=True, text=True, check=False,
+    )
+    if out.returncode != 0:
+        raise SystemExit(f"{backend} backend failed:\n{out.stderr[-2000:]}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def compare(
+    torch_res: dict, onnx_res: dict,
+    tolerance: float = MIN_COSINE, score_tolerance: float = MAX_SCORE_DIFF,
+    neighbour_tolerance: float = MIN_NEIGHBOUR_AGREE,
+) -> dict:
+    import numpy as np
+    a, b    = np.asarray(torch_res["embeddings"]), np.asarray(onnx_res["embeddings"])
+    cosines = (a * b).sum(axis=1)
+    diffs   = [abs(x - y) for x, y in zip(torch_res["match_scores"], onnx_res["match_scores"])]
+    # Same nearest neighbour for every sentence under both backends?
+    nn_a = np.argsort(-(a @ a.T), axis=1)[:, 1]
+    nn_b = np.argsort(-(b @ b.T), axis=1)[:, 1]
+    agree = float((nn_a == nn_b).mean())
+    return {
+        "min_cosine":       round(float(cosines.min()), 5),
+        "mean_cosine":      round(float(cosines.mean()), 5),
+        "max_score_diff":   round(max(diffs), 2),
+        "neighbour_agree":  round(agree, 3),
+        "passed":           bool(cosines.min() >= tolerance and max(diffs) <= score_tolerance
+                                 and agree >= neighbour_tolerance),
+    }
+
+
+def main() -> None:
+    from transformer_service import DEFAULT_MODEL
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--model", default=DEFAULT_MODEL)
+    ap.add_argument("--onnx-dir", type=Path, help="ONNX export dir (default: TALENTOS_ONNX_MODEL_DIR or models/<name>-onnx-int8)")
+    ap.add_argument("-n", type=int, default=1000, help="sentences for the throughput run")
+    ap.add_argument("--batch-size", type=int, default=32)
+    ap.add_argument("--tolerance", type=float, default=MIN_COSINE, help="minimum per-sentence cosine")
+    ap.add_argument("--score-tolerance", type=float, default=MAX_SCORE_DIFF, help="max ATS score difference (points)")
+    ap.add_argument("--neighbour-tolerance", type=float, default=MIN_NEIGHBOUR_AGREE,
+                    help="minimum nearest-neighbour agreement")
+    ap.add_argument("--out", type=Path, help="write results JSON here")
+    ap.add_argument("--child", choices=["torch", "onnx"], help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        print(json.dumps(child(args.child, args.model, args.n, args.batch_size)))
+        return
+
+    results = {name: run_child(name, args) for name in ("torch", "onnx")}
+    if results["onnx"]["backend"] != "onnx":
+        raise SystemExit("ONNX backend fell back to torch — run scripts/export_onnx_model.py first.")
+    parity = compare(results["torch"], results["onnx"], args.tolerance, args.score_tolerance,
+                     args.neighbour_tolerance)
+
+    print(f"{'backend':<8} {'load s':>8} {'RSS MB':>8} {'peak MB':>8} {'sent/s':>9} {'1-sent ms':>10}")
+    for name, r in results.items():
+        print(f"{name:<8} {r['load_s']:>8.2f} {r['rss_loaded_mb']:>8.1f} {r['rss_peak_mb']:>8.1f} "
+              f"{r['sentences_per_s']:>9.1f} {r['single_ms']:>10.2f}")
+    print(f"\nparity: min cosine {parity['min_cosine']}  mean {parity['mean_cosine']}  "
+          f"max ATS diff {parity['max_score_diff']} pts  NN agreement {parity['neighbour_agree']:.0%}  "
+          f"→ {'PASS' if parity['passed'] else 'FAIL'}")
+    print("ATS scores torch:", results["torch"]["match_scores"], " onnx:", results["onnx"]["match_scores"])
+
+    if args.out:
+        for r in results.values():
+            r.pop("embeddings")
+        args.out.write_text(json.dumps({"backends": results, "parity": parity}, indent=2), encoding="utf-8")
+    sys.exit(0 if parity["passed"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""
+TalentOS · Embedding Benchmark
+Micro-benchmarks of transformer_service's scoring path on synthetic
+profiles and job descriptions of controlled length (short ≈ 60 words,
+medium ≈ 300, long ≈ 1500 — several chunks):
+
+  load                   model load time, RSS after load, peak RSS
+  encode.single          one short text per encode() call
+  encode.batch.<B>       texts/s encoding medium texts at batch size B
+  threads.<T>            encode.batch.32 with T intra-op threads
+  match.<len>.cold       calculate_match_score, chunk cache empty
+  match.<len>.warm       … same pair again (JD and profile chunks cached)
+  rank.<N>               rank_profiles: N medium profiles × one JD
+  hybrid.<N>             rank_hybrid: same, fused with BM25
+  skills                 skill_match on a medium profile
+  chunk.<len>            chunk_text only (no model)
+  lexical.<len>          keyword_index scoring only (no model)
+
+Each backend runs in its own subprocess so load time and memory come from
+a cold interpreter. Results are written to benchmarks/results/ as JSON;
+--baseline compares every metric with an earlier file and exits 1 if any
+regressed by more than --tolerance.
+
+  python benchmarks/embedding_bench.py
+  python benchmarks/embedding_bench.py --backend torch --backend onnx --save-baseline benchmarks/results/embedding-baseline.json
+  python benchmarks/embedding_bench.py --baseline benchmarks/results/embedding-baseline.json --tolerance 0.15
+  python benchmarks/embedding_bench.py --quick --repeat 2             # skips rank/hybrid at 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+LENGTHS      = {"short": 60, "medium": 300, "long": 1500}
+BATCH_SIZES  = [1, 8, 32, 128]
+RANK_SIZES   = [100, 1000]
+BATCH_TEXTS  = 256
+
+_PHRASES = [
+    "designed and operated Kubernetes clusters", "built REST and gRPC services in Python and Go",
+    "led a team of five engineers", "reduced p95 latency by forty percent",
+    "migrated a monolith to event-driven microservices on Kafka", "trained PyTorch models for ranking",
+    "owned CI/CD pipelines with GitHub Actions and Terraform", "shipped React and TypeScript dashboards",
+    "tuned PostgreSQL queries and partitioned large tables", "mentored junior developers",
+    "ran A/B experiments and causal analyses", "wrote design docs and on-call runbooks",
+    "deployed services to AWS with autoscaling", "built data pipelines in Spark and Airflow",
+]
+_SKILLS = ["Python", "Kubernetes", "Go", "PyTorch", "Kafka", "PostgreSQL", "AWS", "Terraform", "React", "Spark"]
+
+
+def synthetic_text(words: int, rng: random.Random) -> str:
+    """Resume-like sentences until roughly `words` words."""
+    out, n = [], 0
+    while n < words:
+        sentence = f"{rng.choice(['I', 'We', 'The team'])} {rng.choice(_PHRASES)} and {rng.choice(_PHRASES)}."
+        out.append(sentence[0].upper() + sentence[1:])
+        n += len(sentence.split())
+    return " ".join(out)
+
+
+def synthetic_job(rng: random.Random) -> dict:
+    return {
+        "id":              "BENCH-JOB",
+        "title":           "Senior Platform Engineer",
+        "description":     synthetic_text(LENGTHS["medium"], rng),
+        "required_skills": rng.sample(_SKILLS, 5),
+        "nice_to_have":    rng.sample(_SKILLS, 3),
+    }
+
+
+def _rss_mb() -> float:
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024, 1)
+
+
+def _median_s(fn, repeat: int) -> float:
+    fn()                                            # warm-up
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times)
+
+
+def _metric(value: float, unit: str, higher_is_better: bool) -> dict:
+    return {"value": round(value, 3), "unit": unit, "higher_is_better": higher_is_better}
+
+
+# ─────────────────────────────────────────────────────────────
+# CHILD — one backend, cold process
+# ─────────────────────────────────────────────────────────────
+def _set_threads(model, backend: str, threads: int):
+    """Same model with `threads` intra-op threads (ONNX needs a new session)."""
+    import transformer_service as ts
+    if isinstance(model, ts.OnnxEmbedder):
+        return ts.OnnxEmbedder(model.model_dir, threads=threads)
+    import torch  #type: ignore
+    torch.set_num_threads(threads)
+    return model
+
+
+def run_cases(backend: str, model_name: str, repeat: int, threads: list[int], seed: int, quick: bool = False) -> dict:
+    rng = random.Random(seed)
+    res: dict[str, dict] = {}
+
+    t0 = time.perf_counter()
+    import transformer_service as ts
+    from keyword_index import build_job_index
+    model = ts.load_model(model_name, backend=backend)
+    res["load.seconds"] = _metric(time.perf_counter() - t0, "s", False)
+    res["load.rss_mb"]  = _metric(_rss_mb(), "MB", False)
+    actual = "onnx" if isinstance(model, ts.OnnxEmbedder) else "torch"
+
+    texts = {name: [synthetic_text(n, rng) for _ in range(8)] for name, n in LENGTHS.items()}
+    batch = [synthetic_text(LENGTHS["medium"], rng) for _ in range(BATCH_TEXTS)]
+    job   = synthetic_job(rng)
+
+    # ── model-free stages ────────────────────────────────────
+    index = build_job_index(job)
+    for name, docs in texts.items():
+        s = _median_s(lambda: [ts.chunk_text(d, ts._chunk_budget(model), ts._token_counter(model)) for d in docs], repeat)
+        res[f"chunk.{name}"] = _metric(len(docs) / s, "docs/s", True)
+        s = _median_s(lambda: index.score_many(docs * 50), repeat)
+        res[f"lexical.{name}"] = _metric(len(docs) * 50 / s, "docs/s", True)
+
+    # ── encode ───────────────────────────────────────────────
+    single = texts["short"][0]
+    s = _median_s(lambda: model.encode(single), repeat)
+    res["encode.single"] = _metric(s * 1000, "ms", False)
+    for b in BATCH_SIZES:
+        s = _median_s(lambda: model.encode(batch, batch_size=b), max(1, repeat // 2))
+        res[f"encode.batch.{b}"] = _metric(len(batch) / s, "texts/s", True)
+    for t in threads:
+        m = _set_threads(model, actual, t)
+        s = _median_s(lambda: m.encode(batch, batch_size=32), max(1, repeat // 2))
+        res[f"threads.{t}"] = _metric(len(batch) / s, "texts/s", True)
+    model = _set_threads(model, actual, os.cpu_count() or 1)
+
+    # ── scoring ──────────────────────────────────────────────
+    jd_text = ts.compose_job_text(job)
+    for name, docs in texts.items():
+        def cold():
+            ts._chunk_cache.clear()
+            ts.calculate_match_score(docs[0], jd_text, model)
+        res[f"match.{name}.cold"] = _metric(_median_s(cold, repeat) * 1000, "ms", False)
+        res[f"match.{name}.warm"] = _metric(
+            _median_s(lambda: ts.calculate_match_score(docs[0], jd_text, model), repeat) * 1000, "ms", False)
+
+    for n in RANK_SIZES[:1] if quick else RANK_SIZES:
+        profiles = [synthetic_text(LENGTHS["medium"], rng) for _ in range(n)]
+        def rank():
+            ts._chunk_cache.clear()
+            ts.rank_profiles(profiles, jd_text, model)
+        def hybrid():
+            ts._chunk_cache.clear()
+            ts.rank_hybrid(profiles, job, model, index=index)
+        res[f"rank.{n}"]   = _metric(n / _median_s(rank, 1), "profiles/s", True)
+        res[f"hybrid.{n}"] = _metric(n / _median_s(hybrid, 1), "profiles/s", True)
+
+    def skills():
+        ts._chunk_cache.clear()
+        ts.skill_match(job, texts["medium"][0], model)
+    res["skills"] = _metric(_median_s(skills, repeat) * 1000, "ms", False)
+
+    res["peak.rss_mb"] = _metric(_rss_mb(), "MB", False)
+    return {"backend": actual, "metrics": res}
+
+
+# ─────────────────────────────────────────────────────────────
+# PARENT — run backends, compare with a baseline
+# ─────────────────────────────────────────────────────────────
+def _git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, timeout=5).stdout.strip()
+    except Exception:
+        return ""
+
+
+def run_child(backend: str, args) -> dict:
+    env = dict(os.environ, TALENTOS_TRACING="0")
+    if args.onnx_dir:
+        env["TALENTOS_ONNX_MODEL_DIR"] = str(args.onnx_dir)
+    cmd = [sys.executable, __file__, "--child", backend, "--model", args.model,
+           "--repeat", str(args.repeat), "--seed", str(args.seed)]
+    for t in args.threads:
+        cmd += ["--threads", str(t)]
+    if args.quick:
+        cmd.append("--quick")
+    out = subprocess.run(cmd, env=env, capture_output=True, text=True, check=False)
+    if out.returncode != 0:
+        raise SystemExit(f"{backend} benchmark failed:\n{out.stderr[-2000:]}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def compare(baseline: dict, current: dict, tolerance: float) -> list[dict]:
+    """Every metric present in both runs, flagged when it is worse by more than tolerance."""
+    rows = []
+    for backend, cur in current["backends"].items():
+        old = baseline.get("backends", {}).get(backend, {}).get("metrics", {})
+        for name, m in cur["metrics"].items():
+            if name not in old or not old[name]["value"]:
+                continue
+            change = (m["value"] - old[name]["value"]) / old[name]["value"]
+            worse  = -change if m["higher_is_better"] else change
+            rows.append({
+                "backend": backend, "metric": name, "unit": m["unit"],
+                "baseline": old[name]["value"], "current": m["value"],
+                "change": round(change, 4), "regressed": worse > tolerance,
+            })
+    return rows
+
+
+def format_results(res: dict) -> str:
+    names = sorted({n for b in res["backends"].values() for n in b["metrics"]})
+    heads = list(res["backends"])
+    lines = [f"{'metric':<22} {'unit':<11}" + "".join(f"{h:>12}" for h in heads)]
+    for n in names:
+        unit = next(b["metrics"][n]["unit"] for b in res["backends"].values() if n in b["metrics"])
+        vals = "".join(
+            f"{res['backends'][h]['metrics'][n]['value']:>12.2f}" if n in res["backends"][h]["metrics"] else f"{'—':>12}"
+            for h in heads
+        )
+        lines.append(f"{n:<22} {unit:<11}{vals}")
+    return "\n".join(lines)
+
+
+def format_comparison(rows: list[dict], baseline: dict, tolerance: float) -> str:
+    meta  = baseline.get("meta", {})
+    lines = [f"vs {meta.get('git_revision') or '?'} @ {meta.get('timestamp', '?')}  (tolerance {tolerance:.0%})"]
+    for r in rows:
+        flag = "  ← REGRESSION" if r["regressed"] else ""
+        lines.append(f"  {r['backend']:<6} {r['metric']:<22} {r['baseline']:>10.2f} → {r['current']:>10.2f} "
+                     f"{r['unit']:<11} {r['change'] * 100:+6.1f}%{flag}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    from transformer_service import DEFAULT_MODEL
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--backend", action="append", choices=["torch", "onnx"],
+                    help="repeatable (default: torch)")
+    ap.add_argument("--model", default=DEFAULT_MODEL)
+    ap.add_argument("--onnx-dir", type=Path, help="ONNX export dir (default: TALENTOS_ONNX_MODEL_DIR or models/<name>-onnx-int8)")
+    ap.add_argument("--threads", type=int, action="append", help="intra-op thread counts (default: 1 and all cores)")
+    ap.add_argument("--repeat", type=int, default=5, help="timed repetitions per case (median reported)")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--quick", action="store_true", help=f"rank/hybrid at {RANK_SIZES[0]} profiles only")
+    ap.add_argument("--out", type=Path, help="results JSON (default: benchmarks/results/embedding-<ts>.json)")
+    ap.add_argument("--baseline", type=Path, help="earlier results JSON; exit 1 on regression")
+    ap.add_argument("--tolerance", type=float, default=0.15, help="allowed slowdown per metric (fraction)")
+    ap.add_argument("--save-baseline", type=Path, help="also write the results here")
+    ap.add_argument("--child", choices=["torch", "onnx"], help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    args.threads = sorted(set(args.threads or [1, os.cpu_count() or 1]))
+
+    if args.child:
+        print(json.dumps(run_cases(args.child, args.model, args.repeat, args.threads, args.seed, args.quick)))
+        return
+
+    res = {
+        "meta": {
+            "timestamp":    datetime.now().isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python":       platform.python_version(),
+            "platform":     platform.platform(),
+            "cpu_count":    os.cpu_count(),
+            "model":        args.model,
+            "repeat":       args.repeat,
+            "quick":        args.quick,
+        },
+        "backends": {},
+    }
+    for backend in args.backend or ["torch"]:
+        child = run_child(backend, args)
+        if child["backend"] != backend:
+            print(f"{backend} backend unavailable — skipped (loaded {child['backend']} instead).")
+            continue
+        res["backends"][backend] = child
+    print(format_results(res))
+
+    out = args.out or RESULTS_DIR / f"embedding-{datetime.now():%Y%m%d-%H%M%S}.json"
+    for path in filter(None, (out, args.save_baseline)):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(res, indent=2), encoding="utf-8")
+    print(f"\nresults → {out}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        rows     = compare(baseline, res, args.tolerance)
+        print("\n" + format_comparison(rows, baseline, args.tolerance))
+        if any(r["regressed"] for r in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
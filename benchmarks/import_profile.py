@@ -0,0 +1,144 @@
+"""
+TalentOS · Import-Time Profile
+What an app pays before it can render: runs the module-level imports of
+each entry point under `python -X importtime` in a fresh interpreter and
+reports the slowest packages.
+
+  python benchmarks/import_profile.py                         # candidate_app, hr_app, main
+  python benchmarks/import_profile.py --app candidate_app --top 25
+  python benchmarks/import_profile.py --budget-ms 1500
+
+Only the entry point's top-level import statements are executed (parsed
+with ast), so the Streamlit script body and its network calls never run
+and a missing optional package is skipped like the app's own try/except.
+Exits 1 if any --forbid package (the heavy integrations that must load
+lazily: openai, torch, sentence-transformers, onnxruntime, plotly, gTTS,
+mindee, firecrawl, PyMuPDF) is imported, or when an app exceeds
+--budget-ms. tests/test_import_profile.py asserts the same under pytest.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_APPS   = ["candidate_app", "hr_app", "main"]
+DEFAULT_FORBID = [
+    "openai", "torch", "sentence_transformers", "transformers", "onnxruntime",
+    "plotly", "gtts", "mindee", "firecrawl", "fitz", "pymupdf",
+]
+
+
+def top_level_imports(path: Path) -> list[str]:
+    """Module names imported at module level, including inside top-level try blocks."""
+    tree  = ast.parse(path.read_text(encoding="utf-8"))
+    names: list[str] = []
+
+    def visit(body: list[ast.stmt]) -> None:
+        for node in body:
+            if isinstance(node, ast.Import):
+                names.extend(a.name for a in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                if node.module != "__future__":
+                    names.append(node.module)
+            elif isinstance(node, ast.Try):
+                visit(node.body)
+
+    visit(tree.body)
+    return list(dict.fromkeys(names))
+
+
+def profile(modules: list[str]) -> tuple[list[dict], set[str]]:
+    """
+    ([{"module", "self_us", "cumulative_us", "depth"}] in import order, every
+    module in sys.modules afterwards). Interpreter start-up imports are excluded.
+    """
+    code = (
+        "import importlib, json, sys\n"
+        "before = set(sys.modules)\n"
+        f"for m in {modules!r}:\n"
+        "    try:\n"
+        "        importlib.import_module(m)\n"
+        "    except Exception:\n"
+        "        pass\n"
+        "print(json.dumps(sorted(set(sys.modules) - before)))\n"
+    )
+    env = dict(os.environ, TALENTOS_TRACING="0", TALENTOS_WARMUP="0", PYTHONPATH=str(ROOT))
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                         cwd=ROOT, env=env, capture_output=True, text=True, check=False)
+    loaded = set(json.loads(out.stdout.strip().splitlines()[-1]))
+    rows   = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|", 2)
+        if name.strip() not in loaded:
+            continue
+        rows.append({
+            "module":        name.strip(),
+            "self_us":       int(self_us),
+            "cumulative_us": int(cum_us),
+            "depth":         (len(name) - len(name.lstrip()) - 1) // 2,
+        })
+    return rows, loaded
+
+
+def summarise(app: str, rows: list[dict], loaded: set[str], forbid: list[str], top: int) -> dict:
+    roots     = [r for r in rows if r["depth"] == 0]
+    total_ms  = sum(r["cumulative_us"] for r in roots) / 1000
+    by_pkg: dict[str, int] = {}
+    for r in roots:
+        pkg = r["module"].split(".", 1)[0]
+        by_pkg[pkg] = by_pkg.get(pkg, 0) + r["cumulative_us"]
+    packages  = {m.split(".", 1)[0] for m in loaded}
+    return {
+        "app":       app,
+        "total_ms":  round(total_ms, 1),
+        "modules":   len(loaded),
+        "slowest":   [{"package": p, "ms": round(us / 1000, 1)}
+                      for p, us in sorted(by_pkg.items(), key=lambda kv: -kv[1])[:top]],
+        "forbidden": sorted(packages & set(forbid)),
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--app", action="append", help=f"entry module, repeatable (default: {', '.join(DEFAULT_APPS)})")
+    ap.add_argument("--forbid", action="append", help="package that must not load at import (default: heavy integrations)")
+    ap.add_argument("--budget-ms", type=float, help="fail when an app's imports take longer")
+    ap.add_argument("--top", type=int, default=12)
+    ap.add_argument("--out", type=Path, help="write the profile JSON here")
+    args   = ap.parse_args()
+    forbid = args.forbid or DEFAULT_FORBID
+
+    results, failed = [], False
+    for app in args.app or DEFAULT_APPS:
+        rows, loaded = profile(top_level_imports(ROOT / f"{app}.py"))
+        res = summarise(app, rows, loaded, forbid, args.top)
+        results.append(res)
+        over = args.budget_ms is not None and res["total_ms"] > args.budget_ms
+        ok   = not res["forbidden"] and not over
+        failed |= not ok
+        print(f"{app}: {res['total_ms']:.0f} ms, {res['modules']} modules  → {'OK' if ok else 'FAIL'}")
+        for s in res["slowest"]:
+            print(f"  {s['package']:<28} {s['ms']:>8.1f} ms")
+        if res["forbidden"]:
+            print(f"  ✗ imported eagerly: {', '.join(res['forbidden'])}")
+        if over:
+            print(f"  ✗ over budget ({args.budget_ms:.0f} ms)")
+
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
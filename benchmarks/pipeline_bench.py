@@ -0,0 +1,455 @@
+"""
+TalentOS · Pipeline Benchmark
+Drives the candidate flow headlessly for N synthetic candidates against the
+local fake services and an in-process FastAPI backend:
+
+  upload → assessment (extract · crawl · profile · ATS · questions, on the
+  backend worker pool) → answers (TTS · STT · per-answer evaluation) →
+  report → POST /reports
+
+Reports throughput, per-stage latency percentiles (client side, plus the
+server-side spans from tracing.py), memory high-water mark and error rates,
+and writes everything to a JSON file so runs can be compared.
+
+  python benchmarks/pipeline_bench.py -n 40 -c 8
+  python benchmarks/pipeline_bench.py -n 40 -c 8 --latency openrouter=fixed:50 --error-rate firecrawl=0.1
+  python benchmarks/pipeline_bench.py -n 40 -c 8 --compare benchmarks/results/pipeline-20250101-120000.json
+
+Everything runs in one process (fakes, API, pipeline, candidates), so the
+memory figure is an upper bound for a single node.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from fake_services import LatencyModel, ServiceConfig, per_service, service_env, start_all  # noqa: E402
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Rough production shapes; override per service with --latency.
+DEFAULT_LATENCY = {
+    "openrouter": "lognormal:900:0.5",
+    "firecrawl":  "uniform:300:900",
+    "mindee":     "uniform:500:1500",
+    "whisper":    "lognormal:500:0.4",
+    "tts":        "uniform:150:400",
+}
+
+CLIENT_STAGES = ["upload", "assessment", "answers", "report", "submit", "total"]
+SERVER_SPANS  = [
+    "pipeline.assessment", "pipeline.extract", "pipeline.crawl", "pipeline.profile",
+    "pipeline.ats", "pipeline.questions", "llm.chat", "firecrawl.scrape",
+    "interview.evaluate_answer", "crawl.clean",
+]
+
+_SKILLS = [
+    "Python", "FastAPI", "Django", "PostgreSQL", "Redis", "Kafka", "Docker", "Kubernetes",
+    "AWS", "Terraform", "React", "TypeScript", "Go", "Rust", "PyTorch", "Airflow", "Spark",
+]
+
+
+# ─────────────────────────────────────────────────────────────
+# SYNTHETIC CANDIDATES
+# ─────────────────────────────────────────────────────────────
+def synthetic_resume(i: int, rng: random.Random) -> tuple[bytes, list[str]]:
+    handle = f"cand{i:04d}"
+    skills = rng.sample(_SKILLS, 6)
+    years  = rng.randint(1, 12)
+    links  = [
+        f"https://github.com/{handle}",
+        f"https://github.com/{handle}/{skills[0].lower()}-toolkit",
+        f"https://{handle}.github.io",
+        f"https://www.linkedin.com/in/{handle}",   # skipped by link triage
+    ]
+    text = (
+        f"Candidate {i}\n{handle}@example.com\n\n"
+        f"Software engineer with {years} years of experience.\n"
+        f"Skills: {', '.join(skills)}\n\n"
+        f"Experience\n- Built and operated {skills[1]} services handling "
+        f"{rng.randint(1, 50)}k requests per second.\n"
+        f"- Led migration from a monolith to {skills[2]}-based services.\n\n"
+        f"Links: {' '.join(links)}\n"
+    )
+    return text.encode("utf-8"), links
+
+
+# ─────────────────────────────────────────────────────────────
+# BACKEND
+# ─────────────────────────────────────────────────────────────
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_api():
+    """Run main.app under uvicorn in a daemon thread; returns the server."""
+    import uvicorn  #type: ignore
+    import main
+
+    port   = int(os.environ["TALENTOS_API_URL"].rsplit(":", 1)[1])
+    server = uvicorn.Server(uvicorn.Config(main.app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, name="bench-api", daemon=True).start()
+    deadline = time.monotonic() + 15
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError("API server did not start within 15 s")
+        time.sleep(0.05)
+    return server
+
+
+# ─────────────────────────────────────────────────────────────
+# ONE CANDIDATE
+# ─────────────────────────────────────────────────────────────
+class CandidateRun:
+    """Replays candidate_app's flow for one synthetic candidate."""
+
+    def __init__(self, idx: int, job: dict, seed: int, eval_pool: ThreadPoolExecutor,
+                 poll_interval: float, resume_pdf: bytes | None):
+        self.idx           = idx
+        self.job           = job
+        self.rng           = random.Random(seed + idx)
+        self.eval_pool     = eval_pool
+        self.poll_interval = poll_interval
+        self.resume_pdf    = resume_pdf
+        self.timings: dict[str, float] = {}
+        self.error_stage   = ""
+        self.error         = ""
+
+    def _timed(self, stage: str, fn, *args):
+        t0 = time.perf_counter()
+        try:
+            return fn(*args)
+        except Exception as exc:
+            self.error_stage = stage
+            self.error       = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            self.timings[stage] = (time.perf_counter() - t0) * 1000
+
+    def _wait_for_assessment(self, assessment_id: str) -> dict:
+        import api_client
+        while True:
+            rec = api_client.get_assessment(assessment_id)
+            if rec is None:
+                raise RuntimeError("assessment disappeared")
+            if rec["status"] == "done":
+                return rec["result"]
+            if rec["status"] == "error":
+                raise RuntimeError(rec.get("error") or "assessment failed")
+            time.sleep(self.poll_interval)
+
+    def _answers(self, questions: list[str]) -> tuple[list[dict], list]:
+        import requests
+        from assessment_service import evaluate_answer
+        role     = self.job.get("title", "")
+        qa_pairs = []
+        futures  = []
+        for q in questions:
+            if os.getenv("TTS_URL"):
+                requests.post(os.environ["TTS_URL"], json={"text": q, "lang": "en"}, timeout=30).raise_for_status()
+            resp = requests.post(
+                os.environ["WHISPER_URL"], data=b"RIFF" + bytes(self.rng.randrange(256) for _ in range(2048)),
+                headers={"Authorization": f"Bearer {os.getenv('HUGGINGFACE_API_KEY', '')}",
+                         "Content-Type": "audio/wav"},
+                timeout=30,
+            )
+            resp.raise_for_status()
+            answer = resp.json().get("text", "").strip()
+            qa_pairs.append({"question": q, "answer": answer})
+            futures.append(self.eval_pool.submit(evaluate_answer, q, answer, role))
+        return qa_pairs, futures
+
+    def _report(self, result: dict, qa_pairs: list[dict], futures: list) -> tuple[str, int, int]:
+        from assessment_service import generate_report, merge_report_scores, score_interview
+        evals = [f.result() for f in futures]
+        iv, skill = score_interview(evals, result.get("skill_match_score"))
+        report = generate_report(result["profile_text"], self.job.get("title", ""), qa_pairs, evals)
+        return merge_report_scores(report, self.job.get("title", ""), result["ats_score"], iv, skill), iv, skill
+
+    def run(self) -> dict:
+        import api_client
+        t0 = time.perf_counter()
+        try:
+            if self.resume_pdf is not None:
+                resume, links, ctype = self.resume_pdf, [], "application/pdf"
+            else:
+                (resume, links), ctype = synthetic_resume(self.idx, self.rng), "text/plain"
+            name = f"Candidate {self.idx}"
+            rec = self._timed("upload", api_client.create_assessment,
+                              self.job["id"], name, resume, ctype, links)
+            result = self._timed("assessment", self._wait_for_assessment, rec["id"])
+            qa_pairs, futures = self._timed("answers", self._answers, result["interview_questions"])
+            report, iv, skill = self._timed("report", self._report, result, qa_pairs, futures)
+            self._timed("submit", api_client.submit_report, self.job["id"], name,
+                        result["ats_score"], iv, skill, report, qa_pairs, result["profile_text"],
+                        result.get("skill_breakdown", []))
+        except Exception:
+            pass
+        self.timings["total"] = (time.perf_counter() - t0) * 1000
+        return {"idx": self.idx, "ok": not self.error_stage, "timings_ms": self.timings,
+                "error_stage": self.error_stage, "error": self.error}
+
+
+# ─────────────────────────────────────────────────────────────
+# STATISTICS
+# ─────────────────────────────────────────────────────────────
+def _percentile(sorted_vals: list[float], pct: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_vals)))
+    return sorted_vals[rank - 1]
+
+
+def stage_stats(runs: list[dict]) -> dict[str, dict]:
+    """Latency percentiles over successful attempts of each stage; errors per attempt."""
+    stats = {}
+    for stage in CLIENT_STAGES:
+        attempted = [r for r in runs if stage in r["timings_ms"]]
+        if stage == "total":
+            failed = [r for r in attempted if not r["ok"]]
+        else:
+            failed = [r for r in attempted if r["error_stage"] == stage]
+        vals   = sorted(r["timings_ms"][stage] for r in attempted if r not in failed)
+        errors = len(failed)
+        stats[stage] = {
+            "count":      len(attempted),
+            "errors":     errors,
+            "error_rate": round(errors / len(attempted), 4) if attempted else 0.0,
+            "mean_ms":    round(sum(vals) / len(vals), 1) if vals else 0.0,
+            "p50_ms":     round(_percentile(vals, 50), 1),
+            "p90_ms":     round(_percentile(vals, 90), 1),
+            "p95_ms":     round(_percentile(vals, 95), 1),
+            "p99_ms":     round(_percentile(vals, 99), 1),
+            "max_ms":     round(vals[-1], 1) if vals else 0.0,
+        }
+    return stats
+
+
+def max_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return round(rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024, 1)
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, timeout=5).stdout.strip()
+    except Exception:
+        return ""
+
+
+def format_results(res: dict) -> str:
+    s = res["summary"]
+    lines = [
+        f"candidates {s['candidates']}  ok {s['completed']}  failed {s['failed']}  "
+        f"concurrency {res['config']['concurrency']}  wall {s['wall_s']:.1f}s",
+        f"throughput {s['assessments_per_min']:.2f} assessments/min   max RSS {s['max_rss_mb']:.1f} MB   "
+        f"reports persisted {s['reports_persisted']}/{s['completed']}",
+        "",
+        f"{'stage':<28} {'n':>5} {'err%':>6} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'max ms':>10}",
+    ]
+    for name, st in res["stages"].items():
+        lines.append(f"{name:<28} {st['count']:>5} {st['error_rate'] * 100:>6.1f} {st['p50_ms']:>10.1f} "
+                     f"{st['p95_ms']:>10.1f} {st['p99_ms']:>10.1f} {st['max_ms']:>10.1f}")
+    lines.append("")
+    for name, st in res["server_spans"].items():
+        err = st["errors"] / st["count"] * 100 if st["count"] else 0.0
+        lines.append(f"{name:<28} {st['count']:>5} {err:>6.1f} {st['p50_ms']:>10.1f} "
+                     f"{st['p95_ms']:>10.1f} {'':>10} {st['max_ms']:>10.1f}")
+    if res["errors"]:
+        lines += ["", "errors:"] + [f"  {stage}: {msg}" for stage, msg in res["errors"][:10]]
+    return "\n".join(lines)
+
+
+def format_comparison(old: dict, new: dict) -> str:
+    def delta(a: float, b: float) -> str:
+        return f"{(b - a) / a * 100:+.1f}%" if a else "n/a"
+
+    lines = [
+        f"vs {old.get('meta', {}).get('git_revision') or '?'} @ {old.get('meta', {}).get('timestamp', '?')}",
+        f"throughput {old['summary']['assessments_per_min']:.2f} → {new['summary']['assessments_per_min']:.2f} "
+        f"({delta(old['summary']['assessments_per_min'], new['summary']['assessments_per_min'])})",
+        f"max RSS    {old['summary']['max_rss_mb']:.1f} → {new['summary']['max_rss_mb']:.1f} MB",
+    ]
+    for name, st in new["stages"].items():
+        prev = old.get("stages", {}).get(name)
+        if prev:
+            lines.append(f"  {name:<12} p50 {delta(prev['p50_ms'], st['p50_ms']):>8}   "
+                         f"p95 {delta(prev['p95_ms'], st['p95_ms']):>8}")
+    return "\n".join(lines)
+
+
+# ─────────────────────────────────────────────────────────────
+# DRIVER
+# ─────────────────────────────────────────────────────────────
+def _scaled(lat: LatencyModel, scale: float) -> LatencyModel:
+    if lat.kind == "lognormal":   # scale the median, keep the shape (sigma)
+        return LatencyModel(lat.kind, (lat.params[0] * scale,) + lat.params[1:])
+    return LatencyModel(lat.kind, tuple(p * scale for p in lat.params))
+
+
+def configure_environment(args, workdir: Path) -> dict:
+    """Start the fakes and point every service URL, data dir and trace file at this run."""
+    latency = {**{k: LatencyModel.parse(v) for k, v in DEFAULT_LATENCY.items()},
+               **per_service(args.latency, LatencyModel.parse)}
+    errors  = per_service(args.error_rate, float)
+    status  = per_service(args.error_status, int)
+    configs = {
+        name: ServiceConfig(
+            latency=_scaled(lat, args.latency_scale),
+            error_rate=errors.get(name, 0.0),
+            error_status=status.get(name, 500),
+            seed=args.seed + i,
+        )
+        for i, (name, lat) in enumerate(latency.items())
+    }
+    services = start_all(configs)
+    os.environ.update(service_env({n: s.url for n, s in services.items()}))
+    os.environ.update({
+        "TALENTOS_DATA_DIR":     str(workdir / "data"),
+        "TALENTOS_TRACE_FILE":   str(workdir / "traces.jsonl"),
+        "TALENTOS_TRACING":      "1",
+        "TALENTOS_SERVICE_NAME": "talentos-bench",
+        "TALENTOS_API_URL":      f"http://127.0.0.1:{_free_port()}",
+        "TALENTOS_PIPELINE_WORKERS": str(args.workers or args.concurrency),
+    })
+    if args.llm_rpm is not None:
+        os.environ["TALENTOS_LLM_RPM"] = str(args.llm_rpm)
+    if args.llm_concurrency is not None:
+        os.environ["TALENTOS_LLM_CONCURRENCY"] = str(args.llm_concurrency)
+    return services
+
+
+def run_benchmark(args) -> dict:
+    workdir  = Path(tempfile.mkdtemp(prefix="talentos-bench-"))
+    services = configure_environment(args, workdir)
+    # Service modules read their configuration at import time — import after the env is set.
+    import api_client
+    import tracing
+
+    server = start_api()
+    job = api_client.create_job(
+        title="Senior Backend Engineer", company="Bench Corp", location="Remote",
+        job_type="Full-time", experience="5+ Years",
+        description="Design and operate Python services at scale.",
+        required_skills=["Python", "FastAPI", "PostgreSQL", "Docker", "Kubernetes"],
+        nice_to_have=["Kafka", "Terraform"],
+        responsibilities="Own backend services end to end.",
+    )
+    resume_pdf = args.resume.read_bytes() if args.resume else None
+    eval_pool  = ThreadPoolExecutor(max_workers=8, thread_name_prefix="bench-eval")
+
+    def candidate(idx: int) -> dict:
+        return CandidateRun(idx, job, args.seed, eval_pool, args.poll_interval, resume_pdf).run()
+
+    with ThreadPoolExecutor(max_workers=args.concurrency, thread_name_prefix="bench-cand") as pool:
+        if args.warmup:
+            list(pool.map(candidate, range(-args.warmup, 0)))
+            tracing_file = Path(os.environ["TALENTOS_TRACE_FILE"])
+            tracing_file.unlink(missing_ok=True)
+        t0   = time.perf_counter()
+        runs = list(pool.map(candidate, range(args.candidates)))
+        wall = time.perf_counter() - t0
+
+    eval_pool.shutdown(wait=True)
+    reports   = api_client.get_reports_for_job(job["id"])
+    completed = sum(1 for r in runs if r["ok"])
+    # Lost concurrent writes to reports.json show up as persisted < completed.
+    expected  = {f"Candidate {r['idx']}" for r in runs if r["ok"]}
+    spans     = tracing.summarize(os.environ["TALENTOS_TRACE_FILE"])
+    server.should_exit = True
+    for svc in services.values():
+        svc.stop()
+
+    return {
+        "meta": {
+            "timestamp":    datetime.now().isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python":       platform.python_version(),
+            "platform":     platform.platform(),
+            "cpu_count":    os.cpu_count(),
+        },
+        "config": {
+            "candidates":      args.candidates,
+            "concurrency":     args.concurrency,
+            "warmup":          args.warmup,
+            "pipeline_workers": int(os.environ["TALENTOS_PIPELINE_WORKERS"]),
+            "llm_rpm":         os.getenv("TALENTOS_LLM_RPM", "20"),
+            "llm_concurrency": os.getenv("TALENTOS_LLM_CONCURRENCY", "4"),
+            "latency":         {n: f"{s.config.latency.kind}:{':'.join(str(p) for p in s.config.latency.params)}"
+                                for n, s in services.items()},
+            "error_rate":      {n: s.config.error_rate for n, s in services.items()},
+            "seed":            args.seed,
+            "resume":          str(args.resume) if args.resume else "synthetic",
+        },
+        "summary": {
+            "candidates":          len(runs),
+            "completed":           completed,
+            "failed":              len(runs) - completed,
+            "wall_s":              round(wall, 2),
+            "assessments_per_min": round(completed / wall * 60, 2) if wall else 0.0,
+            "max_rss_mb":          max_rss_mb(),
+            "reports_persisted":   sum(1 for r in reports if r.get("candidate_name") in expected),
+            "fake_requests":       {n: dict(s.stats) for n, s in services.items()},
+        },
+        "stages":       stage_stats(runs),
+        "server_spans": {name: spans[name] for name in SERVER_SPANS if name in spans},
+        "errors":       [(r["error_stage"], r["error"]) for r in runs if not r["ok"]],
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("-n", "--candidates", type=int, default=20)
+    ap.add_argument("-c", "--concurrency", type=int, default=4, help="candidates in flight")
+    ap.add_argument("--workers", type=int, help="backend pipeline workers (default: concurrency)")
+    ap.add_argument("--warmup", type=int, default=1, help="untimed candidates run first")
+    ap.add_argument("--latency", action="append", metavar="[SERVICE=]SPEC",
+                    help="fixed:MS | uniform:LO:HI | normal:MEAN:STD | lognormal:MEDIAN:SIGMA")
+    ap.add_argument("--latency-scale", type=float, default=1.0, help="multiply every fake latency")
+    ap.add_argument("--error-rate", action="append", metavar="[SERVICE=]RATE")
+    ap.add_argument("--error-status", action="append", metavar="[SERVICE=]CODE")
+    ap.add_argument("--llm-rpm", type=float, help="override TALENTOS_LLM_RPM (0 = unlimited)")
+    ap.add_argument("--llm-concurrency", type=int, help="override TALENTOS_LLM_CONCURRENCY")
+    ap.add_argument("--poll-interval", type=float, default=0.1, help="seconds between assessment polls")
+    ap.add_argument("--resume", type=Path, help="use this PDF for every candidate instead of synthetic text")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--out", type=Path, help="results JSON (default: benchmarks/results/pipeline-<ts>.json)")
+    ap.add_argument("--compare", type=Path, help="earlier results JSON to diff against")
+    args = ap.parse_args()
+
+    res = run_benchmark(args)
+    print(format_results(res))
+
+    out = args.out or RESULTS_DIR / f"pipeline-{datetime.now():%Y%m%d-%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(res, indent=2), encoding="utf-8")
+    print(f"\nresults → {out}")
+
+    if args.compare:
+        print("\n" + format_comparison(json.loads(args.compare.read_text(encoding="utf-8")), res))
+
+
+if __name__ == "__main__":
+    main()
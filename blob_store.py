@@ -0,0 +1,159 @@
+"""
+TalentOS · Blob Store
+Session-scoped byte blobs (uploaded resumes, question audio) kept on disk
+instead of in Streamlit session_state, which would hold them in every
+session's memory for the session's whole lifetime.
+
+  put(session, data)    — write once, content-addressed; returns a short
+                          handle "<session>/<sha256>[.ext]" for session_state
+  get(handle)           — bytes, or None if the blob was evicted or swept
+  drop_session(session) — remove every blob of one session
+  sweep()               — remove sessions idle longer than ttl_s
+  start_sweeper()       — sweep() on a daemon thread every SWEEP_INTERVAL_S
+
+Layout: <root>/<session>/<sha256>[.ext]. Reads and writes touch the session
+directory, so its mtime is the session's last activity. The store is
+bounded at max_bytes: when a put goes over, the least recently used blobs
+(any session) are evicted first. Point TALENTOS_BLOB_DIR at /dev/shm to
+keep blobs in shared memory instead of on disk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+BLOB_DIR         = Path(os.getenv("TALENTOS_BLOB_DIR") or Path(tempfile.gettempdir()) / "talentos-blobs")
+MAX_BYTES        = int(float(os.getenv("TALENTOS_BLOB_MAX_MB", "512")) * 1024 * 1024)
+TTL_S            = float(os.getenv("TALENTOS_BLOB_TTL_S", str(2 * 3600)))
+SWEEP_INTERVAL_S = float(os.getenv("TALENTOS_BLOB_SWEEP_S", "300"))
+
+_SESSION_RE = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+_HANDLE_RE  = re.compile(r"^([A-Za-z0-9_-]{1,64})/([0-9a-f]{64}(?:\.[a-z0-9]{1,8})?)$")
+
+
+class BlobStore:
+    def __init__(self, root: str | Path = BLOB_DIR, max_bytes: int = MAX_BYTES, ttl_s: float = TTL_S):
+        self.root      = Path(root)
+        self.max_bytes = max_bytes
+        self.ttl_s     = ttl_s
+        self._lock     = threading.Lock()
+        self._sweeper: Optional[threading.Thread] = None
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._size     = sum(p.stat().st_size for p in self.root.glob("*/*") if p.is_file())
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    # ── blobs ────────────────────────────────────────────────
+    def _path(self, handle: str) -> Optional[Path]:
+        m = _HANDLE_RE.match(handle or "")
+        return self.root / m.group(1) / m.group(2) if m else None
+
+    def put(self, session: str, data: bytes, ext: str = "") -> str:
+        if not _SESSION_RE.match(session):
+            raise ValueError(f"invalid blob session id: {session!r}")
+        name   = hashlib.sha256(data).hexdigest() + (f".{ext.lower()}" if ext else "")
+        handle = f"{session}/{name}"
+        if self._path(handle) is None:
+            raise ValueError(f"invalid blob extension: {ext!r}")
+        folder = self.root / session
+        path   = folder / name
+        with self._lock:
+            folder.mkdir(exist_ok=True)
+            if not path.exists():
+                tmp = path.with_suffix(path.suffix + ".tmp")
+                tmp.write_bytes(data)
+                tmp.replace(path)     # readers never see a partial blob
+                self._size += len(data)
+            os.utime(path)
+            os.utime(folder)
+            if self._size > self.max_bytes:
+                self._evict(keep=path)
+        return handle
+
+    def get(self, handle: str) -> Optional[bytes]:
+        path = self._path(handle)
+        if path is None:
+            return None
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+            os.utime(path.parent)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def _evict(self, keep: Path) -> None:
+        """Delete least recently used blobs until the store fits. Caller holds the lock."""
+        blobs = sorted(
+            (p for p in self.root.glob("*/*") if p.is_file() and p != keep and not p.name.endswith(".tmp")),
+            key=lambda p: p.stat().st_mtime,
+        )
+        for p in blobs:
+            if self._size <= self.max_bytes:
+                break
+            self._size -= self._unlink(p)
+
+    @staticmethod
+    def _unlink(path: Path) -> int:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+            return size
+        except FileNotFoundError:
+            return 0
+
+    # ── sessions ─────────────────────────────────────────────
+    def _drop(self, folder: Path) -> int:
+        """Remove one session directory. Caller holds the lock."""
+        freed = 0
+        if folder.is_dir():
+            for p in folder.iterdir():
+                freed += self._unlink(p)
+            folder.rmdir()
+        self._size -= freed
+        return freed
+
+    def drop_session(self, session: str) -> int:
+        """Remove a session's blobs; returns the bytes freed."""
+        if not _SESSION_RE.match(session):
+            return 0
+        with self._lock:
+            return self._drop(self.root / session)
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Drop sessions idle for longer than ttl_s; returns how many were removed."""
+        cutoff  = (now or time.time()) - self.ttl_s
+        removed = 0
+        for folder in list(self.root.iterdir()):
+            with self._lock:
+                try:
+                    # Checked under the lock: a put() in between keeps the session.
+                    if not folder.is_dir() or folder.stat().st_mtime >= cutoff:
+                        continue
+                except FileNotFoundError:
+                    continue
+                self._drop(folder)
+                removed += 1
+        return removed
+
+    def start_sweeper(self, interval_s: float = SWEEP_INTERVAL_S) -> threading.Thread:
+        if self._sweeper is None:
+            def loop() -> None:
+                while True:
+                    time.sleep(interval_s)
+                    try:
+                        self.sweep()
+                    except OSError as exc:
+                        print(f"Blob sweep failed: {exc}")
+            self._sweeper = threading.Thread(target=loop, name="blob-sweeper", daemon=True)
+            self._sweeper.start()
+        return self._sweeper
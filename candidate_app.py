@@ -6,55 +6,42 @@ Changes from standalone version:
   - job_id read from ?job_id=... URL query param
   - fetch_job_data() calls FastAPI GET /jobs/{job_id}
   - Submit Report button calls FastAPI POST /reports/{job_id}
-  - All CSS/theme tokens preserved verbatim from talentos_theme.py
+  - CSS/theme tokens in static/theme/candidate.css, linked via theme.py
 
 Port: 8502 (default)
 """
 
 import streamlit as st
-import os, io, json, time, base64, tempfile, requests as _requests
-import sys
-import importlib.util
-import plotly.graph_objects as go
+import os, io, re, time, base64, hashlib, uuid, requests as _requests
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from gtts import gTTS
+
+from blob_store import BlobStore
+from lazy_imports import warm_up
+import theme
+from tracing import in_context, span
 
 # ── Load api_client ────────────────────────────────────────────────────────────
 import api_client
-get_job       = api_client.get_job
-submit_report = api_client.submit_report
+get_job           = api_client.get_job
+submit_report     = api_client.submit_report
+create_assessment = api_client.create_assessment
+get_assessment    = api_client.get_assessment
+get_job_embedding = api_client.get_job_embedding
+
+# ── Assessment pipeline (shared with the FastAPI worker pool) ─────────────────
+from assessment_service import (
+    EVAL_FALLBACK,
+    run_assessment,
+    evaluate_answer,
+    score_interview,
+    generate_report,
+    merge_report_scores,
+)
 
 # ── Optional imports (graceful fallback) ─────────────────────────────────────
-try:
-    from sentence_transformers import SentenceTransformer
-    HAS_ST = True
-except ImportError:
-    HAS_ST = False
-
-try:
-    from mindee import ClientV2
-    HAS_MINDEE = True
-except ImportError:
-    HAS_MINDEE = False
-
-try:
-    from openai import OpenAI
-    HAS_OPENAI = True
-except ImportError:
-    HAS_OPENAI = False
-
-try:
-    from firecrawl_service import FirecrawlService
-    HAS_FIRECRAWL = True
-except ImportError:
-    HAS_FIRECRAWL = False
-
-try:
-    from pdf_service import extract_hyperlinks
-    HAS_PDF = True
-except ImportError:
-    HAS_PDF = False
-
+# plotly, gTTS, openai and the embedding model load on first use (or in the
+# background warm-up after the first render), never on the import path.
 try:
     from config import Config
     HAS_CONFIG = True
@@ -62,13 +49,7 @@ except ImportError:
     HAS_CONFIG = False
 
 try:
-    from openrouter_service import chat_with_reasoning_followup
-    HAS_OR = True
-except ImportError:
-    HAS_OR = False
-
-try:
-    from transformer_service import calculate_match_score
+    from transformer_service import load_embedder, vector_from_bytes
     HAS_TRANSFORMER = True
 except ImportError:
     HAS_TRANSFORMER = False
@@ -86,417 +67,21 @@ st.set_page_config(
 )
 
 # ─────────────────────────────────────────────────────────────
-# DESIGN SYSTEM — FULL CSS (matches talentos_theme.py tokens)
+# DESIGN SYSTEM — static/theme/candidate.css, served by the API (theme.py)
 # ─────────────────────────────────────────────────────────────
-DESIGN_CSS = """
-<link rel="preconnect" href="https://fonts.googleapis.com">
-<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-<link href="https://fonts.googleapis.com/css2?family=Sora:wght@300;400;500;600;700;800&family=JetBrains+Mono:wght@400;500;600&family=Instrument+Serif:ital@0;1&display=swap" rel="stylesheet">
-
-<style>
-/* ═══════════════════════════════════════════
-   ROOT DESIGN TOKENS (identical to talentos_theme.py)
-   ═══════════════════════════════════════════ */
-:root {
-  --bg-base:        #03050D;
-  --bg-surface:     #070A17;
-  --bg-card:        rgba(255,255,255,0.028);
-  --bg-card-hover:  rgba(255,255,255,0.052);
-  --border:         rgba(255,255,255,0.07);
-  --border-active:  rgba(0,163,255,0.5);
-  --border-glow:    rgba(0,229,196,0.3);
-
-  --blue:   #00A3FF;
-  --cyan:   #00E5C4;
-  --gold:   #F5C842;
-  --red:    #FF4D6A;
-  --violet: #7B61FF;
-
-  --t1: #EDF0FA;
-  --t2: #8B93B0;
-  --t3: #4E566E;
-  --t4: #2A3050;
-
-  --f-main:  'Sora', sans-serif;
-  --f-mono:  'JetBrains Mono', monospace;
-  --f-serif: 'Instrument Serif', serif;
-
-  --r-sm: 10px;
-  --r-md: 16px;
-  --r-lg: 24px;
-  --r-xl: 32px;
-
-  --shadow-card: 0 8px 48px rgba(0,0,0,0.6);
-  --shadow-glow: 0 0 80px rgba(0,163,255,0.10);
-  --shadow-cyan: 0 0 80px rgba(0,229,196,0.10);
-  --ease:   cubic-bezier(0.4, 0, 0.2, 1);
-  --spring: cubic-bezier(0.34, 1.56, 0.64, 1);
-  --t: 0.28s;
-}
-
-/* ═══════════════════════════════════════════
-   GLOBAL RESETS
-   ═══════════════════════════════════════════ */
-*, *::before, *::after { box-sizing: border-box; }
-
-html, body,
-[data-testid="stAppViewContainer"],
-[data-testid="stApp"] {
-  background-color: var(--bg-base) !important;
-  font-family: var(--f-main) !important;
-  color: var(--t1) !important;
-}
-
-[data-testid="stMain"],
-[data-testid="stMainBlockContainer"],
-[data-testid="stVerticalBlock"],
-section[data-testid="stSidebar"] + div {
-  background: transparent !important;
-}
-
-/* ═══════════════════════════════════════════
-   AMBIENT BACKGROUND MESH
-   ═══════════════════════════════════════════ */
-[data-testid="stAppViewContainer"]::before {
-  content: '';
-  position: fixed; inset: 0;
-  background:
-    radial-gradient(ellipse 90% 70% at 5%   0%,  rgba(0,163,255,0.075) 0%, transparent 55%),
-    radial-gradient(ellipse 60% 55% at 95%  95%, rgba(0,229,196,0.065) 0%, transparent 50%),
-    radial-gradient(ellipse 50% 45% at 50%  50%, rgba(123,97,255,0.04)  0%, transparent 65%),
-    radial-gradient(ellipse 40% 35% at 80%  10%, rgba(245,200,66,0.03)  0%, transparent 50%);
-  pointer-events: none;
-  z-index: 0;
-  animation: ambientShift 18s ease-in-out infinite alternate;
-}
-@keyframes ambientShift {
-  0%   { opacity:1; transform:scale(1) translateY(0px); }
-  100% { opacity:0.75; transform:scale(1.04) translateY(-12px); }
-}
-[data-testid="stAppViewContainer"]::after {
-  content: '';
-  position: fixed; inset: 0;
-  background-image: url("data:image/svg+xml,%3Csvg viewBox='0 0 256 256' xmlns='http://www.w3.org/2000/svg'%3E%3Cfilter id='n'%3E%3CfeTurbulence type='fractalNoise' baseFrequency='0.9' numOctaves='4' stitchTiles='stitch'/%3E%3C/filter%3E%3Crect width='100%25' height='100%25' filter='url(%23n)' opacity='0.035'/%3E%3C/svg%3E");
-  pointer-events: none; z-index: 0; opacity: 0.6;
-}
-
-/* ═══════════════════════════════════════════
-   HIDE STREAMLIT CHROME
-   ═══════════════════════════════════════════ */
-#MainMenu, footer, header,
-[data-testid="stDecoration"],
-[data-testid="stToolbar"],
-[data-testid="stSidebar"] { display: none !important; }
-
-/* ═══════════════════════════════════════════
-   LAYOUT WRAPPER
-   ═══════════════════════════════════════════ */
-.main-container {
-  max-width: 1060px;
-  margin: 0 auto;
-  padding: 0 28px 80px;
-  position: relative;
-  z-index: 1;
-}
-
-/* ═══════════════════════════════════════════
-   FIXED TOP NAV BAR
-   ═══════════════════════════════════════════ */
-.topnav-fixed {
-  position: sticky;
-  top: 0;
-  z-index: 100;
-  background: rgba(3,5,13,0.85);
-  backdrop-filter: blur(20px);
-  -webkit-backdrop-filter: blur(20px);
-  border-bottom: 1px solid var(--border);
-  padding: 14px 28px;
-  margin: 0 -28px 28px;
-  display: flex;
-  align-items: center;
-  justify-content: space-between;
-  animation: fadeDown 0.5s var(--ease) both;
-}
-.nav-brand { display: flex; align-items: center; gap: 12px; }
-.nav-hex {
-  width: 36px; height: 36px;
-  background: linear-gradient(135deg, var(--blue), var(--cyan));
-  clip-path: polygon(50% 0%,100% 25%,100% 75%,50% 100%,0% 75%,0% 25%);
-  display: flex; align-items: center; justify-content: center;
-  font-size: 14px; color: #fff;
-  animation: hexPulse 4s ease-in-out infinite;
-  flex-shrink: 0;
-}
-@keyframes hexPulse {
-  0%,100% { box-shadow: 0 0 20px rgba(0,163,255,0.35); }
-  50%      { box-shadow: 0 0 44px rgba(0,229,196,0.5);  }
-}
-.nav-title {
-  font-size: 1.1rem; font-weight: 800; letter-spacing: -0.03em;
-  background: linear-gradient(135deg, var(--t1) 40%, var(--blue));
-  -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-}
-.nav-sub {
-  font-size: 0.58rem; font-family: var(--f-mono);
-  color: var(--t3); letter-spacing: 0.2em;
-  text-transform: uppercase; margin-top: 2px;
-}
-
-/* ═══════════════════════════════════════════
-   STEP PROGRESS BAR (5 steps)
-   ═══════════════════════════════════════════ */
-.stepper {
-  display: flex; align-items: center;
-  background: rgba(255,255,255,0.03);
-  border: 1px solid var(--border);
-  border-radius: var(--r-xl);
-  padding: 5px 7px;
-  gap: 0;
-}
-.step-item {
-  display: flex; align-items: center; gap: 7px;
-  padding: 7px 14px; border-radius: 999px;
-  font-family: var(--f-mono); font-size: 0.65rem;
-  font-weight: 500; letter-spacing: 0.08em;
-  text-transform: uppercase;
-  transition: all var(--t) var(--ease);
-  white-space: nowrap; color: var(--t3);
-  position: relative; z-index: 2;
-}
-.step-item.active {
-  background: linear-gradient(135deg, rgba(0,163,255,0.18), rgba(0,229,196,0.1));
-  border: 1px solid rgba(0,163,255,0.35);
-  color: var(--blue);
-  box-shadow: 0 0 24px rgba(0,163,255,0.12);
-}
-.step-item.done { color: var(--cyan); }
-.step-num {
-  width: 18px; height: 18px; border-radius: 50%;
-  display: flex; align-items: center; justify-content: center;
-  font-size: 0.6rem; font-weight: 700;
-  background: rgba(255,255,255,0.05);
-  border: 1px solid rgba(255,255,255,0.1);
-  flex-shrink: 0; position: relative; z-index: 3;
-}
-.step-item.active .step-num {
-  background: var(--blue); border-color: var(--blue); color: #fff;
-  box-shadow: 0 0 10px rgba(0,163,255,0.45);
-}
-.step-item.done .step-num {
-  background: rgba(0,229,196,0.15);
-  border-color: rgba(0,229,196,0.4); color: var(--cyan);
-}
-.step-connector {
-  flex-shrink: 0; width: 20px; height: 2px;
-  background: var(--border); border-radius: 999px;
-  position: relative; z-index: 1; margin: 0 2px;
-}
-.step-connector.done { background: rgba(0,229,196,0.35); }
-
-/* ═══ SECTION HEADER ════════════════════════════════════════ */
-.sec-block { margin-bottom: 28px; animation: fadeUp 0.5s var(--ease) both; }
-.sec-tag { font-family: var(--f-mono); font-size: 0.63rem; color: var(--blue); letter-spacing: 0.2em; text-transform: uppercase; margin-bottom: 8px; }
-.sec-title { font-size: 1.9rem; font-weight: 800; letter-spacing: -0.04em; color: var(--t1); line-height: 1.1; margin-bottom: 6px; }
-.sec-desc { font-size: 0.88rem; color: var(--t2); line-height: 1.6; }
-
-/* ═══ GLASS CARD ════════════════════════════════════════════ */
-.g-card {
-  background: var(--bg-card); border: 1px solid var(--border);
-  border-radius: var(--r-lg); padding: 28px 32px;
-  backdrop-filter: blur(20px); box-shadow: var(--shadow-card);
-  transition: border-color var(--t) var(--ease), box-shadow var(--t) var(--ease);
-  animation: fadeUp 0.55s var(--ease) 0.1s both;
-}
-.g-card:hover {
-  border-color: rgba(0,163,255,0.22);
-  box-shadow: var(--shadow-card), var(--shadow-glow);
-}
-
-/* ═══ JD HEADER ═════════════════════════════════════════════ */
-.jd-header {
-  background: linear-gradient(135deg, rgba(0,163,255,0.08) 0%, rgba(123,97,255,0.05) 100%);
-  border: 1px solid rgba(0,163,255,0.22);
-  border-radius: var(--r-lg); padding: 28px 32px;
-  margin-bottom: 20px; animation: fadeUp 0.5s var(--ease) both;
-  position: relative; overflow: hidden;
-}
-.jd-header::before {
-  content: ''; position: absolute; top:0; left:0; right:0; height: 3px;
-  background: linear-gradient(90deg, var(--blue), var(--cyan), var(--violet));
-}
-.jd-company-badge {
-  display: inline-flex; align-items: center; gap: 8px;
-  background: rgba(0,163,255,0.1); border: 1px solid rgba(0,163,255,0.25);
-  border-radius: 999px; padding: 5px 14px;
-  font-family: var(--f-mono); font-size: 0.65rem;
-  color: var(--blue); letter-spacing: 0.12em; text-transform: uppercase; margin-bottom: 14px;
-}
-.jd-title { font-size: 1.75rem; font-weight: 800; letter-spacing: -0.04em; color: var(--t1); margin-bottom: 8px; line-height: 1.15; }
-.jd-meta { display: flex; gap: 16px; flex-wrap: wrap; margin-top: 14px; }
-.jd-meta-item { display: inline-flex; align-items: center; gap: 7px; font-family: var(--f-mono); font-size: 0.68rem; color: var(--t3); letter-spacing: 0.08em; }
-.jd-meta-dot { width: 5px; height: 5px; border-radius: 50%; background: var(--blue); opacity: 0.7; }
-
-/* ═══ JD BODY ═══════════════════════════════════════════════ */
-.jd-body { display: grid; grid-template-columns: 1fr 340px; gap: 20px; animation: fadeUp 0.55s var(--ease) 0.15s both; }
-.jd-left { background: var(--bg-card); border: 1px solid var(--border); border-radius: var(--r-lg); padding: 28px 30px; }
-.jd-right { background: var(--bg-card); border: 1px solid var(--border); border-radius: var(--r-lg); padding: 28px 24px; }
-.jd-col-title { font-family: var(--f-mono); font-size: 0.63rem; color: var(--blue); letter-spacing: 0.2em; text-transform: uppercase; margin-bottom: 16px; display: flex; align-items: center; gap: 8px; }
-.jd-col-title::after { content: ''; flex: 1; height: 1px; background: linear-gradient(90deg, var(--border), transparent); }
-.jd-body-text { font-size: 0.88rem; color: var(--t2); line-height: 1.85; letter-spacing: 0.01em; }
-.skill-grid { display: flex; flex-wrap: wrap; gap: 8px; }
-.skill-pill { display: inline-flex; align-items: center; gap: 6px; padding: 6px 13px; background: rgba(0,163,255,0.06); border: 1px solid rgba(0,163,255,0.2); border-radius: 999px; font-family: var(--f-mono); font-size: 0.65rem; color: var(--blue); letter-spacing: 0.08em; transition: all 0.2s var(--ease); }
-.skill-pill:hover { background: rgba(0,163,255,0.12); border-color: rgba(0,163,255,0.4); transform: translateY(-1px); }
-.skill-pill.primary { background: rgba(0,229,196,0.06); border-color: rgba(0,229,196,0.22); color: var(--cyan); }
-
-/* ═══ UPLOAD ZONE ═══════════════════════════════════════════ */
-.upload-zone { border: 1.5px dashed rgba(0,163,255,0.28); border-radius: var(--r-md); padding: 44px 32px; text-align: center; background: rgba(0,163,255,0.025); transition: all var(--t) var(--ease); cursor: pointer; }
-.upload-zone:hover { border-color: rgba(0,163,255,0.55); background: rgba(0,163,255,0.055); transform: scale(1.005); }
-.upload-icon { font-size: 2.6rem; display: block; margin-bottom: 14px; animation: floatIcon 3s ease-in-out infinite; }
-@keyframes floatIcon { 0%,100% { transform: translateY(0); } 50% { transform: translateY(-7px); } }
-.upload-title { font-size: 1.0rem; font-weight: 600; color: var(--t1); margin-bottom: 6px; }
-.upload-hint { font-size: 0.74rem; font-family: var(--f-mono); color: var(--t3); letter-spacing: 0.06em; }
-
-/* ═══ PROCESSING MODAL ══════════════════════════════════════ */
-.processing-overlay { position: fixed; inset: 0; z-index: 9999; background: rgba(3,5,13,0.82); backdrop-filter: blur(16px); -webkit-backdrop-filter: blur(16px); display: flex; align-items: center; justify-content: center; animation: fadeIn 0.35s var(--ease) both; }
-.processing-modal { background: rgba(7,10,23,0.95); border: 1px solid rgba(0,163,255,0.28); border-radius: var(--r-xl); padding: 48px 52px; text-align: center; max-width: 440px; width: 100%; box-shadow: 0 32px 80px rgba(0,0,0,0.7), 0 0 80px rgba(0,163,255,0.08); animation: scaleIn 0.4s var(--spring) both; }
-.proc-hex-ring { width: 80px; height: 80px; margin: 0 auto 24px; }
-.proc-hex { width: 80px; height: 80px; background: linear-gradient(135deg, rgba(0,163,255,0.2), rgba(0,229,196,0.15)); clip-path: polygon(50% 0%,100% 25%,100% 75%,50% 100%,0% 75%,0% 25%); display: flex; align-items: center; justify-content: center; font-size: 2rem; animation: hexSpin 3s linear infinite; }
-@keyframes hexSpin { 0% { transform: rotate(0deg); } 100% { transform: rotate(360deg); } }
-.proc-title { font-size: 1.2rem; font-weight: 700; color: var(--t1); margin-bottom: 10px; }
-.proc-step { font-family: var(--f-mono); font-size: 0.72rem; color: var(--blue); letter-spacing: 0.1em; margin-bottom: 24px; }
-.proc-bar { height: 4px; background: rgba(255,255,255,0.06); border-radius: 999px; overflow: hidden; }
-.proc-bar-fill { height: 100%; background: linear-gradient(90deg, var(--blue), var(--cyan)); border-radius: 999px; animation: procFill 2.4s ease-in-out infinite; }
-@keyframes procFill { 0% { width: 8%; } 60% { width: 82%; } 100% { width: 8%; } }
-
-/* ═══ INTERVIEW LAYOUT ══════════════════════════════════════ */
-.interview-grid { display: grid; grid-template-columns: minmax(0, 4fr) minmax(0, 1fr); gap: 20px; align-items: start; }
-.q-panel { background: var(--bg-card); border: 1px solid var(--border); border-radius: var(--r-lg); overflow: hidden; }
-.q-panel-header { padding: 20px 28px; background: linear-gradient(135deg, rgba(0,163,255,0.06), rgba(0,229,196,0.03)); border-bottom: 1px solid var(--border); position: relative; }
-.q-panel-header::before { content: ''; position: absolute; top:0; left:0; right:0; height: 3px; background: linear-gradient(90deg, var(--blue), var(--cyan), var(--violet)); }
-.q-panel-body { padding: 28px; }
-.q-card { background: var(--bg-card); border: 1px solid var(--border); border-radius: var(--r-lg); padding: 26px 28px; margin-bottom: 18px; animation: fadeUp 0.45s var(--ease) both; }
-.q-badge { display: inline-flex; align-items: center; gap: 8px; background: rgba(0,163,255,0.1); border: 1px solid rgba(0,163,255,0.3); border-radius: 999px; padding: 5px 14px; font-family: var(--f-mono); font-size: 0.66rem; color: var(--blue); letter-spacing: 0.12em; text-transform: uppercase; margin-bottom: 14px; }
-.q-text { font-size: 1.15rem; font-weight: 600; color: var(--t1); line-height: 1.7; letter-spacing: -0.01em; }
-.play-btn-wrap { margin-top: 20px; display: flex; align-items: center; gap: 14px; flex-wrap: wrap; }
-.play-note { font-family: var(--f-mono); font-size: 0.62rem; color: var(--t3); letter-spacing: 0.08em; }
-.mic-label { font-family: var(--f-mono); font-size: 0.64rem; color: var(--t3); letter-spacing: 0.16em; text-transform: uppercase; display: flex; align-items: center; gap: 8px; }
-.answer-label { font-family: var(--f-mono); font-size: 0.62rem; color: var(--cyan); letter-spacing: 0.14em; text-transform: uppercase; margin-bottom: 8px; }
-.mic-label::after { content: ''; flex: 1; height: 1px; background: linear-gradient(90deg, var(--border), transparent); min-width: 80px; }
-.cam-panel { background: var(--bg-card); border: 1px solid var(--border); border-radius: var(--r-lg); overflow: hidden; position: sticky; top: 80px; }
-.cam-header { padding: 13px 16px; border-bottom: 1px solid var(--border); font-family: var(--f-mono); font-size: 0.62rem; color: var(--t3); letter-spacing: 0.14em; text-transform: uppercase; display: flex; align-items: center; gap: 8px; }
-.cam-dot-live { width: 6px; height: 6px; border-radius: 50%; background: var(--red); animation: dotPulse 1.4s ease infinite; }
-
-/* ═══ REPORT PAGE ════════════════════════════════════════════ */
-.candidate-summary-card { background: linear-gradient(160deg, rgba(0,163,255,0.07), rgba(0,229,196,0.04)); border: 1px solid rgba(0,163,255,0.2); border-radius: var(--r-lg); padding: 28px 24px; position: sticky; top: 80px; }
-.avatar-ring { width: 72px; height: 72px; margin: 0 auto 18px; display: flex; align-items: center; justify-content: center; border-radius: 50%; background: linear-gradient(135deg, rgba(0,163,255,0.15), rgba(0,229,196,0.1)); border: 2px solid rgba(0,163,255,0.3); font-size: 2.2rem; }
-.cand-name { font-size: 1.1rem; font-weight: 700; color: var(--t1); text-align: center; margin-bottom: 4px; }
-.cand-role { font-family: var(--f-mono); font-size: 0.62rem; color: var(--t3); text-align: center; letter-spacing: 0.1em; text-transform: uppercase; margin-bottom: 16px; }
-.score-divider { height: 1px; background: var(--border); margin: 16px 0; }
-.score-row { display: flex; justify-content: space-between; align-items: center; margin-bottom: 6px; }
-.score-lbl { font-family: var(--f-mono); font-size: 0.63rem; color: var(--t3); letter-spacing: 0.1em; }
-.score-val { font-family: var(--f-mono); font-size: 0.8rem; font-weight: 700; }
-.score-bar-track { height: 5px; background: rgba(255,255,255,0.05); border-radius: 999px; overflow: hidden; margin-bottom: 14px; }
-.score-bar-fill { height: 100%; border-radius: 999px; }
-.report-body-card { background: var(--bg-card); border: 1px solid var(--border); border-radius: var(--r-lg); padding: 30px 34px; animation: fadeUp 0.5s var(--ease) both; }
-.report-text { font-size: 0.88rem; color: var(--t2); line-height: 1.85; }
-.report-text h2 { font-size: 0.75rem; font-family: var(--f-mono); color: var(--blue); letter-spacing: 0.18em; text-transform: uppercase; margin: 20px 0 8px; border-bottom: 1px solid var(--border); padding-bottom: 6px; }
-
-/* ═══ COMPLETION OVERLAY ════════════════════════════════════ */
-.completion-overlay { display: flex; align-items: center; justify-content: center; padding: 40px 20px; }
-.completion-card { background: rgba(7,10,23,0.96); border: 1px solid rgba(0,229,196,0.28); border-radius: var(--r-xl); padding: 52px 60px; max-width: 560px; width: 100%; text-align: center; box-shadow: 0 32px 80px rgba(0,0,0,0.7), 0 0 80px rgba(0,229,196,0.08); animation: scaleIn 0.5s var(--spring) both; position: relative; overflow: hidden; }
-.completion-card::before { content: ''; position: absolute; top:0; left:0; right:0; height: 3px; background: linear-gradient(90deg, var(--cyan), var(--blue), var(--violet)); }
-.completion-icon { font-size: 3.5rem; display: block; margin-bottom: 20px; animation: floatIcon 3s ease-in-out infinite; }
-.completion-title { font-size: 1.8rem; font-weight: 800; letter-spacing: -0.04em; color: var(--t1); margin-bottom: 14px; }
-.completion-sub { font-size: 0.88rem; color: var(--t2); line-height: 1.75; margin-bottom: 28px; }
-.completion-badge { display: inline-flex; align-items: center; gap: 10px; background: rgba(0,229,196,0.08); border: 1px solid rgba(0,229,196,0.28); border-radius: 999px; padding: 8px 20px; font-family: var(--f-mono); font-size: 0.7rem; color: var(--cyan); letter-spacing: 0.12em; }
-.comp-dot { width: 8px; height: 8px; border-radius: 50%; background: var(--cyan); animation: dotPulse 2s ease infinite; }
-
-/* ═══ INPUTS ════════════════════════════════════════════════ */
-[data-testid="stTextArea"] textarea,
-[data-testid="stTextInput"] input {
-  background: rgba(255,255,255,0.028) !important; border: 1px solid var(--border) !important;
-  border-radius: var(--r-sm) !important; color: var(--t1) !important;
-  font-family: var(--f-main) !important; font-size: 0.88rem !important;
-  padding: 11px 15px !important; transition: all var(--t) var(--ease) !important;
-}
-[data-testid="stTextArea"] textarea:focus,
-[data-testid="stTextInput"] input:focus { border-color: rgba(0,163,255,0.5) !important; box-shadow: 0 0 0 4px rgba(0,163,255,0.09) !important; }
-[data-testid="stTextArea"] textarea::placeholder,
-[data-testid="stTextInput"] input::placeholder { color: var(--t3) !important; }
-
-/* ═══ BUTTONS ═══════════════════════════════════════════════ */
-[data-testid="stButton"] > button {
-  font-family: var(--f-main) !important; font-weight: 700 !important;
-  font-size: 0.82rem !important; letter-spacing: 0.06em !important;
-  text-transform: uppercase !important; border-radius: var(--r-sm) !important;
-  transition: all 0.24s var(--spring) !important;
-}
-[data-testid="stButton"] > button[kind="primary"] {
-  background: linear-gradient(135deg, #0070D8, var(--blue), #00C8FF) !important;
-  background-size: 200% 200% !important; border: none !important; color: #fff !important;
-  box-shadow: 0 4px 24px rgba(0,163,255,0.4) !important; padding: 12px 24px !important;
-  animation: btnShimmer 4s ease infinite !important;
-}
-@keyframes btnShimmer { 0%{background-position:0% 50%;} 50%{background-position:100% 50%;} 100%{background-position:0% 50%;} }
-[data-testid="stButton"] > button[kind="primary"]:hover { box-shadow: 0 6px 36px rgba(0,163,255,0.6) !important; transform: translateY(-2px) scale(1.01) !important; }
-[data-testid="stButton"] > button:not([kind="primary"]) { background: rgba(255,255,255,0.04) !important; border: 1px solid var(--border) !important; color: var(--t2) !important; }
-[data-testid="stButton"] > button:not([kind="primary"]):hover { background: rgba(255,255,255,0.08) !important; border-color: rgba(255,255,255,0.16) !important; color: var(--t1) !important; transform: translateY(-1px) !important; }
-
-[data-testid="stDownloadButton"] > button {
-  background: linear-gradient(135deg, rgba(245,200,66,0.12), rgba(245,200,66,0.06)) !important;
-  border: 1px solid rgba(245,200,66,0.32) !important; color: var(--gold) !important;
-  font-family: var(--f-main) !important; font-weight: 700 !important;
-  font-size: 0.78rem !important; letter-spacing: 0.06em !important;
-  text-transform: uppercase !important; border-radius: var(--r-sm) !important;
-  padding: 11px 18px !important; transition: all 0.22s var(--ease) !important;
-}
-[data-testid="stDownloadButton"] > button:hover { background: linear-gradient(135deg, rgba(245,200,66,0.22), rgba(245,200,66,0.12)) !important; box-shadow: 0 4px 24px rgba(245,200,66,0.2) !important; transform: translateY(-1px) !important; }
-
-[data-testid="stExpander"] { background: var(--bg-card) !important; border: 1px solid var(--border) !important; border-radius: var(--r-md) !important; }
-[data-testid="stExpander"] summary { font-family: var(--f-main) !important; font-size: 0.8rem !important; font-weight: 500 !important; color: var(--t2) !important; }
-[data-testid="stExpander"] summary:hover { color: var(--t1) !important; }
-
-[data-testid="stWidgetLabel"] p, label { font-family: var(--f-main) !important; font-size: 0.76rem !important; font-weight: 500 !important; color: var(--t2) !important; letter-spacing: 0.04em !important; text-transform: uppercase !important; }
-[data-testid="stAlert"] { background: var(--bg-card) !important; border: 1px solid var(--border) !important; border-radius: var(--r-md) !important; font-family: var(--f-main) !important; }
-div[data-testid="stAlert"][kind="info"]    { border-left: 3px solid var(--blue) !important; }
-div[data-testid="stAlert"][kind="success"] { border-left: 3px solid var(--cyan) !important; }
-div[data-testid="stAlert"][kind="warning"] { border-left: 3px solid var(--gold) !important; }
-
-/* ═══ MISC ═══════════════════════════════════════════════════ */
-.field-label { font-family: var(--f-mono); font-size: 0.65rem; color: var(--t3); letter-spacing: 0.16em; text-transform: uppercase; margin-bottom: 8px; display: flex; align-items: center; gap: 7px; }
-.field-dot { width: 5px; height: 5px; border-radius: 50%; background: var(--blue); }
-.divider-label { display: flex; align-items: center; gap: 14px; margin: 28px 0 20px; font-family: var(--f-mono); font-size: 0.63rem; color: var(--t3); letter-spacing: 0.16em; text-transform: uppercase; }
-.divider-label::before { content:''; flex:1; height:1px; background: linear-gradient(90deg,transparent,var(--border)); }
-.divider-label::after  { content:''; flex:1; height:1px; background: linear-gradient(270deg,transparent,var(--border)); }
-.spacer-xs { height: 8px; }
-.spacer-sm { height: 14px; }
-.spacer-md { height: 24px; }
-.spacer-lg { height: 40px; }
-
-::-webkit-scrollbar { width: 6px; }
-::-webkit-scrollbar-track { background: var(--bg-base); }
-::-webkit-scrollbar-thumb { background: rgba(255,255,255,0.1); border-radius: 99px; }
-::-webkit-scrollbar-thumb:hover { background: rgba(255,255,255,0.2); }
-
-@keyframes fadeUp   { from { opacity:0; transform:translateY(20px); } to { opacity:1; transform:translateY(0); } }
-@keyframes fadeDown { from { opacity:0; transform:translateY(-16px); } to { opacity:1; transform:translateY(0); } }
-@keyframes fadeIn   { from { opacity:0; } to { opacity:1; } }
-@keyframes scaleIn  { from { opacity:0; transform:scale(0.92); } to { opacity:1; transform:scale(1); } }
-@keyframes dotPulse { 0%,100% { opacity:1; transform:scale(1); } 50% { opacity:0.4; transform:scale(0.7); } }
-</style>
-"""
-st.markdown(DESIGN_CSS, unsafe_allow_html=True)
+st.markdown(theme.head_html("candidate", api_client.asset_base_url()), unsafe_allow_html=True)
 
 
 # ─────────────────────────────────────────────────────────────
 # CONSTANTS & CONFIG
 # ─────────────────────────────────────────────────────────────
 HF_API_KEY   = os.getenv("HUGGINGFACE_API_KEY", "")
-WHISPER_URL  = "https://router.huggingface.co/hf-inference/models/openai/whisper-large-v3"
-MODEL        = os.getenv("OPENROUTER_MODEL", "arcee-ai/trinity-large-preview:free")
-NUM_QUESTIONS = 4
-OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY", "")
-FIRECRAWL_API_KEY  = os.getenv("FIRECRAWL_API_KEY", "")
+WHISPER_URL  = Config.WHISPER_URL if HAS_CONFIG else "https://router.huggingface.co/hf-inference/models/openai/whisper-large-v3"
+TTS_URL      = Config.TTS_URL if HAS_CONFIG else os.getenv("TTS_URL", "")
+POLL_INTERVAL = 1.0   # seconds between GET /assessments/{id} polls
+POLL_TIMEOUT  = float(os.getenv("TALENTOS_POLL_TIMEOUT_S", "600"))   # give up on the worker after this long
+POLL_STALL    = float(os.getenv("TALENTOS_POLL_STALL_S", "180"))     # … or after this long without a new stage
+_EMAIL_RE     = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")          # identifies re-applications (resume_dedup)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -504,23 +89,26 @@ FIRECRAWL_API_KEY  = os.getenv("FIRECRAWL_API_KEY", "")
 # ─────────────────────────────────────────────────────────────
 @st.cache_resource
 def load_ats_model():
-    if HAS_ST:
-        return SentenceTransformer("all-MiniLM-L6-v2")
+    if HAS_TRANSFORMER:
+        try:
+            return load_embedder()     # shared service when TALENTOS_EMBED_URL is set
+        except Exception:
+            return None
     return None
 
 
 @st.cache_resource
-def get_llm():
-    if HAS_OPENAI and OPENROUTER_API_KEY:
-        return OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=OPENROUTER_API_KEY,
-        )
-    return None
+def get_report_pool() -> ThreadPoolExecutor:
+    # Shared across sessions — per-answer evaluations and report builds run here.
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="report")
 
 
-ats_model = load_ats_model()
-llm       = get_llm()
+@st.cache_resource
+def get_blob_store() -> BlobStore:
+    # Resume and question-audio bytes live here; session_state keeps handles.
+    store = BlobStore()
+    store.start_sweeper()
+    return store
 
 
 # ─────────────────────────────────────────────────────────────
@@ -537,7 +125,7 @@ DEFAULTS: dict = {
     "page":                 "jd",
     "job_id":               _url_job_id,
     "job_data":             None,
-    "resume_file":          None,
+    "resume_file":          None,      # blob handle, see blob_store
     "resume_links":         [],
     "crawled_data":         "",
     "profile_text":         "",
@@ -546,10 +134,15 @@ DEFAULTS: dict = {
     "current_q_index":      0,
     "audio_played":         False,
     "interview_answers":    [],
+    "answer_evals":         [],
     "interview_score":      0,
     "skill_match_score":    0,
+    "resume_skill_score":   None,
+    "skill_breakdown":      [],
     "final_report":         "",
     "candidate_name":       "Candidate",
+    "candidate_email":      "",
+    "assessment_id":        "",
     "report_submitted":     False,
     "submit_error":         "",
 }
@@ -557,10 +150,21 @@ for k, v in DEFAULTS.items():
     if k not in st.session_state:
         st.session_state[k] = v
 
-# Update job_id if URL param changed (e.g. new tab session)
-if st.session_state.job_id != _url_job_id:
+# Keys this session's blobs; survives the DEFAULTS resets below.
+if "blob_session" not in st.session_state:
+    st.session_state.blob_session = uuid.uuid4().hex
+
+
+def reset_session() -> None:
+    """Back to DEFAULTS, dropping the session's stored resume and audio."""
+    get_blob_store().drop_session(st.session_state.blob_session)
     for k, v in DEFAULTS.items():
         st.session_state[k] = v
+
+
+# Update job_id if URL param changed (e.g. new tab session)
+if st.session_state.job_id != _url_job_id:
+    reset_session()
     st.session_state.job_id = _url_job_id
 
 
@@ -606,11 +210,15 @@ def _submit_report_to_api() -> bool:
         submit_report(
             job_id            = st.session_state.job_id,
             candidate_name    = str(st.session_state.candidate_name or "Candidate"),
+            candidate_email   = str(st.session_state.candidate_email or ""),
             ats_score         = max(0, min(100, int(round(st.session_state.ats_score)))),
             interview_score   = max(0, min(100, int(round(st.session_state.interview_score)))),
             skill_match_score = max(0, min(100, int(round(st.session_state.skill_match_score)))),
             final_report      = str(st.session_state.final_report or ""),
             transcript        = list(st.session_state.interview_answers or []),
+            profile_text      = str(st.session_state.profile_text or ""),
+            skill_breakdown   = list(st.session_state.skill_breakdown or []),
+            assessment_id     = str(st.session_state.assessment_id or ""),
         )
         return True
     except Exception as exc:
@@ -618,156 +226,105 @@ def _submit_report_to_api() -> bool:
         return False
 
 
-# ─────────────────────────────────────────────────────────────
-# FIRECRAWL INTEGRATION
-# ─────────────────────────────────────────────────────────────
-def crawl_candidate_links(links: list[str]) -> str:
-    if not links or not FIRECRAWL_API_KEY:
-        return ""
-    results = []
-    headers = {
-        "Authorization": f"Bearer {FIRECRAWL_API_KEY}",
-        "Content-Type":  "application/json",
-    }
-    for url in links[:6]:
-        try:
-            resp = _requests.post(
-                "https://api.firecrawl.dev/v1/scrape",
-                json={"url": url, "formats": ["markdown"], "onlyMainContent": True, "waitFor": 1500},
-                headers=headers, timeout=20,
-            )
-            if resp.status_code == 200:
-                data    = resp.json()
-                content = data.get("data", {}).get("markdown", "") or data.get("data", {}).get("content", "")
-                if content:
-                    results.append(f"--- Source: {url} ---\n{content[:3000]}\n")
-        except Exception as exc:
-            results.append(f"--- Source: {url} (fetch failed: {exc}) ---\n")
-    return "\n".join(results)
-
-
-def extract_pdf_links(file_bytes: bytes) -> list[str]:
-    if not HAS_PDF:
-        return []
-    try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            tmp.write(file_bytes)
-            tmp_path = tmp.name
-        links = extract_hyperlinks(tmp_path)
-        os.unlink(tmp_path)
-        return links
-    except Exception:
-        return []
-
-
 # ─────────────────────────────────────────────────────────────
 # AUDIO HELPERS
 # ─────────────────────────────────────────────────────────────
 def _tts_bytes(text: str) -> bytes:
-    tts_obj = gTTS(text=text, lang="en", slow=False)
-    fp = io.BytesIO()
-    tts_obj.write_to_fp(fp)
-    fp.seek(0)
-    return fp.read()
+    if TTS_URL:
+        # Self-hosted / stand-in TTS endpoint: POST {"text"} → audio bytes
+        with span("tts.http", chars=len(text)) as sp:
+            resp = _requests.post(TTS_URL, json={"text": text, "lang": "en"}, timeout=30)
+            resp.raise_for_status()
+            sp.set(bytes=len(resp.content))
+            return resp.content
+    with span("tts.gtts", chars=len(text)) as sp:
+        from gtts import gTTS
+        tts_obj = gTTS(text=text, lang="en", slow=False)
+        fp = io.BytesIO()
+        tts_obj.write_to_fp(fp)
+        fp.seek(0)
+        audio = fp.read()
+        sp.set(bytes=len(audio))
+        return audio
 
 
 def transcribe_audio(audio_bytes: bytes) -> str:
     if not HF_API_KEY:
         return "[STT unavailable — set HUGGINGFACE_API_KEY]"
     headers  = {"Authorization": f"Bearer {HF_API_KEY}", "Content-Type": "audio/wav"}
-    response = _requests.post(WHISPER_URL, headers=headers, data=audio_bytes, timeout=30)
-    if response.status_code == 200:
-        return response.json().get("text", "").strip()
-    return f"[Transcription error: {response.status_code}]"
+    with span("stt.whisper", bytes=len(audio_bytes)) as sp:
+        response = _requests.post(WHISPER_URL, headers=headers, data=audio_bytes, timeout=30)
+        sp.set(**{"http.status_code": response.status_code})
+        if response.status_code == 200:
+            return response.json().get("text", "").strip()
+        sp.error(f"HTTP {response.status_code}")
+        return f"[Transcription error: {response.status_code}]"
 
 
 # ─────────────────────────────────────────────────────────────
-# LLM HELPERS
+# ASSESSMENT PIPELINE  — FastAPI worker pool, in-process fallback
 # ─────────────────────────────────────────────────────────────
-def llm_chat(prompt: str, system: str = "", followup: str = "") -> str:
-    if not llm:
-        return "⚠ LLM not configured. Set OPENROUTER_API_KEY."
-    if HAS_OR:
-        res = chat_with_reasoning_followup(
-            client=llm, initial_prompt=prompt,
-            follow_up_prompt=followup or "Provide the final output. No reasoning tags.",
-            model=MODEL,
-        )
-        return res.content
-    messages = []
-    if system:
-        messages.append({"role": "system", "content": system})
-    messages.append({"role": "user", "content": prompt})
-    resp = llm.chat.completions.create(model=MODEL, messages=messages, max_tokens=2000)
-    return resp.choices[0].message.content.strip()
-
-
-def build_profile(resume_text: str, crawled: str, role: str) -> str:
-    return llm_chat(
-        prompt=(
-            f"Create a detailed candidate intelligence profile.\n"
-            f"Target Role: {role}\nResume Data: {resume_text}\n"
-            f"Online Presence / Links: {crawled or '(none scraped)'}"
-        ),
-        followup="Output ONLY the final clean profile. Remove all reasoning.",
-    )
+def _fetch_jd_embedding(job_id: str):
+    """Backend's stored JD vector, or None — run_assessment then encodes the job text."""
+    if not HAS_TRANSFORMER:
+        return None
+    try:
+        payload = get_job_embedding(job_id)
+    except Exception:
+        return None
+    return vector_from_bytes(base64.b64decode(payload["vector_b64"])) if payload else None
 
 
-def generate_questions(profile: str, role: str) -> list[str]:
-    raw = llm_chat(
-        prompt=(
-            f"You are a senior technical interviewer.\n"
-            f"Generate exactly {NUM_QUESTIONS} sharp, role-specific questions "
-            f"to evaluate the candidate below.\n"
-            f"Target Role: {role}\nProfile: {profile}\n"
-            f"Rules: tie each question to the profile; mix behavioural, "
-            f"situational, and technical; avoid generic openers."
-        ),
-        followup=(
-            f"Return ONLY a numbered list of {NUM_QUESTIONS} questions, "
-            "one per line. No headers, no explanations."
-        ),
-    )
-    lines = [q.strip() for q in raw.split("\n") if q.strip()]
-    return lines[:NUM_QUESTIONS] if len(lines) >= NUM_QUESTIONS else (
-        lines + [f"Tell us about a challenging project in your {role} career."] * (NUM_QUESTIONS - len(lines))
-    )
+def _apply_assessment(result: dict) -> None:
+    st.session_state.resume_links        = result.get("resume_links", [])
+    st.session_state.crawled_data        = result.get("crawled_data", "")
+    st.session_state.profile_text        = result.get("profile_text", "")
+    st.session_state.ats_score           = result.get("ats_score", 72)
+    st.session_state.resume_skill_score  = result.get("skill_match_score")
+    st.session_state.skill_breakdown     = result.get("skill_breakdown", [])
+    st.session_state.interview_questions = result.get("interview_questions", [])
+    st.session_state.current_q_index     = 0
+    st.session_state.audio_played        = False
+    st.session_state.interview_answers   = []
+    st.session_state.answer_evals        = []
+    st.session_state.page                = "interview"
 
 
-def score_interview(qa_pairs: list[dict], role: str) -> tuple[int, int]:
-    if not qa_pairs:
-        return 55, 60
-    qa_text = "\n".join([f"Q: {qa['question']}\nA: {qa['answer']}" for qa in qa_pairs])
-    raw = llm_chat(
-        prompt=(
-            f"Evaluate this interview transcript for the role: {role}\n{qa_text}\n"
-            'Return a JSON object: {"interview_score": <int 0-100>, "skill_match_score": <int 0-100>}'
-        ),
-        followup="Return ONLY the JSON object. No explanation.",
-    )
-    try:
-        raw_clean = raw.strip().replace("```json", "").replace("```", "").strip()
-        data = json.loads(raw_clean)
-        return int(data.get("interview_score", 65)), int(data.get("skill_match_score", 65))
-    except Exception:
-        return 65, 68
+class AssessmentStalled(RuntimeError):
+    """The backend worker made no progress in time; the caller may run the pipeline itself."""
 
 
-def generate_report(profile: str, role: str, qa_pairs: list, ats: int, iv: int, skill: int) -> str:
-    qa_text = "\n".join(
-        [f"Q{i+1}: {qa['question']}\nA{i+1}: {qa['answer']}" for i, qa in enumerate(qa_pairs)]
-    )
-    return llm_chat(
-        prompt=(
-            f"Write a comprehensive candidate evaluation report.\n"
-            f"Role: {role} | ATS: {ats}% | Interview: {iv}% | Skill Match: {skill}%\n"
-            f"Profile: {profile}\nTranscript:\n{qa_text}\n"
-            "Sections: ## Executive Summary / ## Technical Competency / "
-            "## Interview Analysis / ## Strengths / ## Development Areas / "
-            "## Cultural Fit / ## Hiring Recommendation / ## Final Verdict"
-        ),
-        followup="Write the final polished report. Use markdown headers. Remove reasoning.",
-    )
+def _poll_assessment(assessment_id: str, status) -> dict:
+    """
+    Poll GET /assessments/{id} until the worker finishes, echoing stage
+    messages into the status box. Returns the result dict. Raises
+    AssessmentStalled after POLL_TIMEOUT overall or POLL_STALL without a
+    new stage, so a hung worker can't spin the session forever.
+    """
+    seen     = 0
+    progress = None
+    started  = last_progress = time.monotonic()
+    while True:
+        rec = get_assessment(assessment_id)
+        if rec is None:
+            raise RuntimeError(f"assessment {assessment_id} not found")
+        for stage in rec.get("stages", [])[seen:]:
+            status.write(stage["message"])
+        seen = len(rec.get("stages", []))
+        if rec["status"] == "done":
+            return rec.get("result") or {}
+        if rec["status"] == "error":
+            raise RuntimeError(rec.get("error") or "assessment failed")
+
+        now = time.monotonic()
+        if (seen, rec["status"]) != progress:
+            progress, last_progress = (seen, rec["status"]), now
+        if now - started > POLL_TIMEOUT:
+            raise AssessmentStalled(f"assessment {assessment_id} not finished after {POLL_TIMEOUT:.0f}s")
+        if now - last_progress > POLL_STALL:
+            raise AssessmentStalled(f"assessment {assessment_id} stuck at '{rec.get('stage') or rec['status']}' "
+                                    f"for {POLL_STALL:.0f}s")
+        time.sleep(POLL_INTERVAL)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -968,6 +525,11 @@ def page_upload():
         "Full name", placeholder="e.g. Alex Johnson",
         label_visibility="collapsed", key="inp_name",
     )
+    st.markdown('<div class="field-label"><div class="field-dot"></div>Email</div>', unsafe_allow_html=True)
+    cand_email = st.text_input(
+        "Email", placeholder="e.g. alex@example.com",
+        label_visibility="collapsed", key="inp_email",
+    )
 
     st.markdown('<div class="spacer-md"></div>', unsafe_allow_html=True)
     col_cta, _ = st.columns([2, 3])
@@ -981,52 +543,53 @@ def page_upload():
             if not cand_name.strip():
                 st.warning("⚠ Please enter your full name before continuing.")
                 st.stop()
+            if not _EMAIL_RE.match(cand_email.strip()):
+                st.warning("⚠ Please enter a valid email address before continuing.")
+                st.stop()
 
-            st.session_state.candidate_name = cand_name.strip()
+            st.session_state.candidate_name  = cand_name.strip()
+            st.session_state.candidate_email = cand_email.strip()
             manual_links = [l.strip() for l in [gh_link, portfolio, linkedin] if l.strip()]
 
             with st.status("⬡ Building your candidate profile…", expanded=True) as status:
                 try:
-                    status.write("⬡ Stage 1 · Extracting resume content…")
                     resume_bytes = uploaded_file.getvalue()
-                    st.session_state.resume_file = resume_bytes
-
-                    pdf_links = []
-                    if uploaded_file.type == "application/pdf":
-                        pdf_links = extract_pdf_links(resume_bytes)
-                    all_links = list(set(pdf_links + manual_links))
-                    st.session_state.resume_links = all_links
-
-                    if all_links:
-                        status.write(f"◈ Stage 2 · Crawling {len(all_links)} candidate links…")
-                        crawled = crawl_candidate_links(all_links)
-                        st.session_state.crawled_data = crawled
-                    else:
-                        status.write("◈ Stage 2 · No external links to crawl — skipping.")
-                        crawled = ""
-
-                    status.write("◎ Stage 3 · Synthesising intelligence profile…")
-                    resume_text = resume_bytes[:8000].decode("utf-8", errors="replace")
-                    st.session_state.profile_text = build_profile(
-                        resume_text, crawled, jd.get("title", "the target role")
+                    st.session_state.resume_file = get_blob_store().put(
+                        st.session_state.blob_session, resume_bytes,
+                        "pdf" if uploaded_file.type == "application/pdf" else "",
                     )
 
-                    status.write("◈ Stage 4 · Computing ATS semantic match…")
-                    if HAS_TRANSFORMER and ats_model:
-                        st.session_state.ats_score = int(round(calculate_match_score(
-                            st.session_state.profile_text, jd.get("title", ""), ats_model,
-                        )))
-                    else:
-                        st.session_state.ats_score = 72
-
-                    status.write("▶ Stage 5 · Generating personalised interview questions…")
-                    st.session_state.interview_questions = generate_questions(
-                        st.session_state.profile_text, jd.get("title", "the target role"),
-                    )
-                    st.session_state.current_q_index   = 0
-                    st.session_state.audio_played      = False
-                    st.session_state.interview_answers = []
-                    st.session_state.page              = "interview"
+                    try:
+                        created = create_assessment(
+                            job_id         = st.session_state.job_id,
+                            candidate_name = st.session_state.candidate_name,
+                            candidate_email = st.session_state.candidate_email,
+                            resume_bytes   = resume_bytes,
+                            content_type   = uploaded_file.type or "",
+                            links          = manual_links,
+                        )
+                    except Exception:
+                        created = None
+
+                    result = None
+                    if created:
+                        # Survives a browser refresh: the router resumes polling.
+                        st.session_state.assessment_id = created["id"]
+                        st.query_params["assessment_id"] = created["id"]
+                        try:
+                            result = _poll_assessment(created["id"], status)
+                        except AssessmentStalled as exc:
+                            status.write(f"⚠ {exc} — continuing here instead…")
+                            st.session_state.assessment_id = ""
+                            st.query_params.pop("assessment_id", None)
+                    if result is None:
+                        result = run_assessment(
+                            resume_bytes, uploaded_file.type or "", manual_links, jd,
+                            ats_model=load_ats_model(),
+                            progress=lambda stage, message: status.write(message),
+                            jd_embedding=_fetch_jd_embedding(st.session_state.job_id),
+                        )
+                    _apply_assessment(result)
                     status.update(label="✓ Profile built — starting technical interview", state="complete", expanded=False)
                 except Exception as exc:
                     status.update(label=f"⚠ Pipeline error: {exc}", state="error")
@@ -1062,86 +625,142 @@ def page_interview():
     col_main, col_cam = st.columns([4, 1], gap="medium")
 
     with col_main:
-        st.markdown(f"""
-        <div class="q-card">
-          <div class="q-badge">▶ &nbsp; Question {idx + 1} of {total}</div>
-          <div class="q-text">{q_text}</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-        audio_key = f"_tts_bytes_{idx}"
-        if audio_key not in st.session_state:
-            with st.spinner("⬡ Generating audio…"):
-                st.session_state[audio_key] = _tts_bytes(q_text)
-
-        st.markdown('<div class="play-btn-wrap"><span class="play-note">▶ &nbsp; Question audio — plays automatically below</span></div>', unsafe_allow_html=True)
-        st.audio(st.session_state[audio_key], format="audio/mp3", autoplay=True)
-
-        st.markdown('<div class="mic-label" style="margin-top:18px;">◉ &nbsp; Record your answer</div>', unsafe_allow_html=True)
-        recorded = st.audio_input("ans", key=f"aq_{idx}", label_visibility="collapsed")
-
-        if recorded:
-            with st.spinner("⬡ Transcribing…"):
-                transcript_text = transcribe_audio(recorded.getvalue())
-
-            st.markdown('<div class="answer-label">◈ &nbsp; Review &amp; edit transcription</div>', unsafe_allow_html=True)
-            edited = st.text_area(
-                "tr", label_visibility="collapsed",
-                value=transcript_text, height=120, key=f"edit_q_{idx}",
-                placeholder="Transcription appears here — edit if needed…",
-            )
-
-            st.markdown('<div style="height:10px;"></div>', unsafe_allow_html=True)
-            is_last   = (idx + 1 >= total)
-            btn_label = "Submit & Generate Report →" if is_last else "Submit · Next Question ▶"
-
-            c1, c2 = st.columns([3, 1])
-            with c1:
-                if st.button(btn_label, type="primary", use_container_width=True, key=f"next_btn_{idx}"):
-                    st.session_state.interview_answers.append({
-                        "question": q_text,
-                        "answer":   edited or "(no answer)",
-                    })
-                    st.session_state.current_q_index += 1
-                    if is_last:
-                        _build_report()
-                    st.rerun()
-            with c2:
-                if st.button("Skip", use_container_width=True, key=f"skip_btn_{idx}"):
-                    st.session_state.interview_answers.append({
-                        "question": q_text, "answer": "(skipped)",
-                    })
-                    st.session_state.current_q_index += 1
-                    if st.session_state.current_q_index >= total:
-                        _build_report()
-                    st.rerun()
-        else:
-            st.markdown('<div style="font-family:var(--f-mono);font-size:0.63rem;color:var(--t3);letter-spacing:0.08em;margin-top:8px;">◎ Record your answer above to continue</div>', unsafe_allow_html=True)
+        _question_panel(idx, total, q_text)
+        _answer_panel(idx, total, q_text)
 
     with col_cam:
-        st.markdown('<div class="cam-panel"><div class="cam-header"><div class="cam-dot-live"></div>Camera Preview</div></div>', unsafe_allow_html=True)
-        st.camera_input("cam", key=f"cam_{idx}", label_visibility="collapsed")
-        st.markdown('<div style="font-family:var(--f-mono);font-size:.6rem;color:var(--t3);letter-spacing:.08em;text-align:center;margin-top:6px;">◎ Live · Allow camera access if prompted</div>', unsafe_allow_html=True)
+        _camera_panel(idx)
 
     close_container()
 
 
-def _build_report():
-    """Generate scores and final report after all questions are answered."""
+# Interview panels. Widgets inside an st.fragment rerun only that fragment,
+# so recording, editing the transcript or a camera snapshot no longer
+# re-executes the nav, the theme and the session bootstrap. Each panel gets
+# what it reads as arguments; moving to the next question is an app rerun.
+def _question_panel(idx: int, total: int, q_text: str) -> None:
+    st.markdown(f"""
+    <div class="q-card">
+      <div class="q-badge">▶ &nbsp; Question {idx + 1} of {total}</div>
+      <div class="q-text">{q_text}</div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # session_state holds the blob handle; a swept or evicted blob is regenerated.
+    audio_key = f"_tts_blob_{idx}"
+    blobs     = get_blob_store()
+    audio     = blobs.get(st.session_state.get(audio_key, ""))
+    with span("interview.question_audio", cache_hit=audio is not None):
+        if audio is None:
+            with st.spinner("⬡ Generating audio…"):
+                audio = _tts_bytes(q_text)
+            st.session_state[audio_key] = blobs.put(st.session_state.blob_session, audio, "mp3")
+
+    st.markdown('<div class="play-btn-wrap"><span class="play-note">▶ &nbsp; Question audio — plays automatically below</span></div>', unsafe_allow_html=True)
+    st.audio(audio, format="audio/mp3", autoplay=True)
+
+
+def _transcript(idx: int, audio_bytes: bytes) -> str:
+    """Whisper transcript of this recording, once — edits to the text area don't re-transcribe."""
+    key    = f"_transcript_{idx}"
+    digest = hashlib.sha256(audio_bytes).hexdigest()
+    cached = st.session_state.get(key)
+    if cached and cached[0] == digest:
+        return cached[1]
+    with st.spinner("⬡ Transcribing…"):
+        text = transcribe_audio(audio_bytes)
+    st.session_state[key] = (digest, text)
+    return text
+
+
+@st.fragment
+def _answer_panel(idx: int, total: int, q_text: str) -> None:
+    st.markdown('<div class="mic-label" style="margin-top:18px;">◉ &nbsp; Record your answer</div>', unsafe_allow_html=True)
+    recorded = st.audio_input("ans", key=f"aq_{idx}", label_visibility="collapsed")
+
+    if not recorded:
+        st.markdown('<div style="font-family:var(--f-mono);font-size:0.63rem;color:var(--t3);letter-spacing:0.08em;margin-top:8px;">◎ Record your answer above to continue</div>', unsafe_allow_html=True)
+        return
+
+    transcript_text = _transcript(idx, recorded.getvalue())
+
+    st.markdown('<div class="answer-label">◈ &nbsp; Review &amp; edit transcription</div>', unsafe_allow_html=True)
+    edited = st.text_area(
+        "tr", label_visibility="collapsed",
+        value=transcript_text, height=120, key=f"edit_q_{idx}",
+        placeholder="Transcription appears here — edit if needed…",
+    )
+
+    st.markdown('<div style="height:10px;"></div>', unsafe_allow_html=True)
+    is_last   = (idx + 1 >= total)
+    btn_label = "Submit & Generate Report →" if is_last else "Submit · Next Question ▶"
+
+    c1, c2 = st.columns([3, 1])
+    with c1:
+        if st.button(btn_label, type="primary", use_container_width=True, key=f"next_btn_{idx}"):
+            _record_answer(q_text, edited or "(no answer)")
+            st.session_state.current_q_index += 1
+            if is_last:
+                _build_report()
+            st.rerun()
+    with c2:
+        if st.button("Skip", use_container_width=True, key=f"skip_btn_{idx}"):
+            _record_answer(q_text, "(skipped)")
+            st.session_state.current_q_index += 1
+            if st.session_state.current_q_index >= total:
+                _build_report()
+            st.rerun()
+
+
+@st.fragment
+def _camera_panel(idx: int) -> None:
+    st.markdown('<div class="cam-panel"><div class="cam-header"><div class="cam-dot-live"></div>Camera Preview</div></div>', unsafe_allow_html=True)
+    st.camera_input("cam", key=f"cam_{idx}", label_visibility="collapsed")
+    st.markdown('<div style="font-family:var(--f-mono);font-size:.6rem;color:var(--t3);letter-spacing:.08em;text-align:center;margin-top:6px;">◎ Live · Allow camera access if prompted</div>', unsafe_allow_html=True)
+
+
+def _record_answer(question: str, answer: str) -> None:
+    """Store the answer and start evaluating it in the background."""
     jd = st.session_state.job_data or {}
-    with st.spinner("⬡ Compiling evaluation report…"):
-        iv_score, skill_score = score_interview(
-            st.session_state.interview_answers, jd.get("title", "the role"),
-        )
+    st.session_state.interview_answers.append({"question": question, "answer": answer})
+    st.session_state.answer_evals.append(
+        get_report_pool().submit(in_context(evaluate_answer), question, answer, jd.get("title", "the role"))
+    )
+
+
+def _resolve_evals() -> list[dict]:
+    resolved = []
+    for ev in st.session_state.answer_evals:
+        if isinstance(ev, dict):
+            resolved.append(ev)
+            continue
+        try:
+            resolved.append(ev.result())
+        except Exception:
+            resolved.append(dict(EVAL_FALLBACK))
+    st.session_state.answer_evals = resolved
+    return resolved
+
+
+def _build_report():
+    """Aggregate per-answer evaluations and write the final report."""
+    jd   = st.session_state.job_data or {}
+    role = jd.get("title", "the role")
+    with st.spinner("⬡ Compiling evaluation report…"), span("report.build", answers=len(st.session_state.answer_evals)):
+        # Earlier answers were evaluated while the interview was running;
+        # only the last one can still be in flight here.
+        evals = _resolve_evals()
+        iv_score, skill_score = score_interview(evals, st.session_state.resume_skill_score)
         st.session_state.interview_score   = iv_score
         st.session_state.skill_match_score = skill_score
-        st.session_state.final_report = generate_report(
-            profile   = st.session_state.profile_text,
-            role      = jd.get("title", "the role"),
-            qa_pairs  = st.session_state.interview_answers,
-            ats       = st.session_state.ats_score,
-            iv        = iv_score,
-            skill     = skill_score,
+        st.session_state.final_report = merge_report_scores(
+            report = generate_report(
+                st.session_state.profile_text, role, st.session_state.interview_answers, evals,
+            ),
+            role   = role,
+            ats    = st.session_state.ats_score,
+            iv     = iv_score,
+            skill  = skill_score,
         )
         st.session_state.page = "report"
 
@@ -1150,6 +769,7 @@ def _build_report():
 # TAB 4 · REPORT
 # ─────────────────────────────────────────────────────────────
 def page_report():
+    import plotly.graph_objects as go
     render_topnav()
 
     ats   = st.session_state.ats_score
@@ -1232,6 +852,14 @@ def page_report():
 
     # Submit & Download
     st.markdown('<div class="spacer-md"></div>', unsafe_allow_html=True)
+    _report_actions(name, ats, iv, skill)
+
+    close_container()
+
+
+@st.fragment
+def _report_actions(name: str, ats: int, iv: int, skill: int) -> None:
+    """Submit/download row: a failed submit or a download reruns only this fragment."""
     col_submit, col_dl = st.columns([1.6, 1], gap="medium")
 
     with col_submit:
@@ -1258,9 +886,10 @@ def page_report():
                 st.session_state.page             = "complete"
                 st.rerun()
             else:
-                st.rerun()   # show error banner on next render
+                st.rerun(scope="fragment")   # show the error banner
 
     with col_dl:
+        jd         = st.session_state.job_data or {}
         jd_t       = jd.get("title", "Role")
         report_txt = (
             f"TalentOS · Candidate Assessment Report\n{'='*55}\n"
@@ -1280,8 +909,6 @@ def page_report():
             use_container_width=True,
         )
 
-    close_container()
-
 
 # ─────────────────────────────────────────────────────────────
 # TAB 5 · COMPLETION
@@ -1318,8 +945,8 @@ def page_complete():
     col_c, _ = st.columns([2, 3])
     with col_c:
         if st.button("⬡ Close & Return to Home", use_container_width=True):
-            for k, v in DEFAULTS.items():
-                st.session_state[k] = v
+            reset_session()
+            st.query_params.pop("assessment_id", None)
             st.rerun()
 
     close_container()
@@ -1328,10 +955,38 @@ def page_complete():
 # ─────────────────────────────────────────────────────────────
 # ROUTER
 # ─────────────────────────────────────────────────────────────
+_url_assessment_id = _params.get("assessment_id", "")
+if _url_assessment_id and st.session_state.page in ("jd", "upload") \
+        and st.session_state.assessment_id != _url_assessment_id:
+    st.session_state.assessment_id = _url_assessment_id
+    if st.session_state.job_data is None:
+        st.session_state.job_data = fetch_job_data(st.session_state.job_id)
+    with st.status("⬡ Resuming your candidate profile…", expanded=True) as _status:
+        try:
+            _rec = get_assessment(_url_assessment_id)
+            if _rec:
+                st.session_state.candidate_name  = _rec.get("candidate_name") or "Candidate"
+                st.session_state.candidate_email = _rec.get("candidate_email") or ""
+            _apply_assessment(_poll_assessment(_url_assessment_id, _status))
+            _status.update(label="✓ Profile built — starting technical interview", state="complete", expanded=False)
+        except Exception as exc:
+            _status.update(label=f"⚠ Pipeline error: {exc}", state="error")
+
 PAGE = st.session_state.page
 
 if   PAGE == "jd":        page_jd()
 elif PAGE == "upload":    page_upload()
 elif PAGE == "interview": page_interview()
 elif PAGE == "report":    page_report()
-elif PAGE == "complete":  page_complete()
\ No newline at end of file
+elif PAGE == "complete":  page_complete()
+
+# After the first render: pull the deferred integrations in on a background
+# thread so the upload/interview/report pages don't pay for them. The model
+# goes through load_embedder()'s own cache, which load_ats_model() reuses.
+warm_up(
+    "plotly.graph_objects",
+    *(() if TTS_URL else ("gtts",)),
+    "openai",
+    *((load_embedder,) if HAS_TRANSFORMER else ()),
+    name="candidate_app",
+)
\ No newline at end of file
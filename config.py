@@ -19,4 +19,11 @@ class Config:
     MINDEE_API_KEY = _secret("MINDEE_API_KEY")
     FIRECRAWL_API_KEY = _secret("FIRECRAWL_API_KEY")
     OPENROUTER_API_KEY = _secret("OPENROUTER_API_KEY")
-    HUGGINGFACE_API_KEY = _secret("HUGGINGFACE_API_KEY")
\ No newline at end of file
+    HUGGINGFACE_API_KEY = _secret("HUGGINGFACE_API_KEY")
+
+    # Service base URLs — override to point at fake_services for offline/load tests
+    OPENROUTER_BASE_URL = _secret("OPENROUTER_BASE_URL") or "https://openrouter.ai/api/v1"
+    FIRECRAWL_API_URL = _secret("FIRECRAWL_API_URL") or "https://api.firecrawl.dev"
+    MINDEE_API_URL = _secret("MINDEE_API_URL") or ""
+    WHISPER_URL = _secret("WHISPER_URL") or "https://router.huggingface.co/hf-inference/models/openai/whisper-large-v3"
+    TTS_URL = _secret("TTS_URL") or ""   # empty → gTTS (Google Translate TTS)
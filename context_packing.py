@@ -0,0 +1,217 @@
+"""
+TalentOS · Context Packing
+Token-aware prompt assembly for profile and report prompts.
+
+  count_tokens(text)              — local tokenizer (tiktoken if installed,
+                                    otherwise a word-piece approximation)
+  strip_boilerplate(text)         — drop nav/link/image/cookie lines
+  condense(text, budget)          — extractive summary on sentence boundaries
+  pack_sections(sections, budget) — split a token budget across sections,
+                                    condensing only the ones that overflow
+  split_sources / join_sources    — parse the "--- Source: url ---" blob
+                                    produced by crawl_candidate_links()
+
+Budgets are approximate. tiktoken's cl100k_base stands in for whichever
+model OpenRouter routes to, and each model has its own tokenizer. Without
+tiktoken the word-piece estimate is padded by TOKEN_MARGIN so it errs
+high. Set the TALENTOS_*_TOKEN_BUDGET values well below the model's
+context window.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+# ─────────────────────────────────────────────────────────────
+# TOKEN COUNTING
+# ─────────────────────────────────────────────────────────────
+_PIECE_RE    = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+TOKEN_MARGIN = float(os.getenv("TALENTOS_TOKEN_MARGIN", "1.2"))   # fallback over-estimate factor
+
+
+@lru_cache(maxsize=1)
+def _encoder():
+    try:
+        import tiktoken  #type: ignore
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Token count with tiktoken when available; otherwise ≈ BPE word pieces
+    times TOKEN_MARGIN. Either way an estimate for the target model.
+    """
+    if not text:
+        return 0
+    enc = _encoder()
+    if enc is not None:
+        return len(enc.encode(text, disallowed_special=()))
+    # BPE vocabularies keep common words whole and split long ones into ~4-char pieces.
+    pieces = sum(max(1, math.ceil(len(p) / 4)) if p[0].isalnum() else 1 for p in _PIECE_RE.findall(text))
+    return math.ceil(pieces * TOKEN_MARGIN)
+
+
+# ─────────────────────────────────────────────────────────────
+# BOILERPLATE
+# ─────────────────────────────────────────────────────────────
+_IMAGE_RE     = re.compile(r"^!\[[^\]]*\]\([^)]*\)$")
+_LINK_ONLY_RE = re.compile(r"^[\s*\-•|>#]*(\[[^\]]*\]\([^)]*\)[\s|·•,/-]*)+$")
+_BOILER_RE    = re.compile(
+    r"(cookie|privacy policy|terms of (service|use)|all rights reserved|©|sign in|sign up|"
+    r"log in|skip to (main )?content|toggle navigation|subscribe to)",
+    re.IGNORECASE,
+)
+
+
+def strip_boilerplate(text: str) -> str:
+    """Remove per-line boilerplate: image embeds, link-only nav rows, legal/cookie lines."""
+    kept = []
+    for line in text.splitlines():
+        s = line.strip()
+        if not s:
+            if kept and kept[-1] != "":
+                kept.append("")
+            continue
+        if _IMAGE_RE.match(s) or _LINK_ONLY_RE.match(s):
+            continue
+        if len(s) < 120 and _BOILER_RE.search(s):
+            continue
+        kept.append(line.rstrip())
+    return "\n".join(kept).strip()
+
+
+# ─────────────────────────────────────────────────────────────
+# EXTRACTIVE CONDENSATION
+# ─────────────────────────────────────────────────────────────
+_SENT_RE   = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(\[])|\n+")
+_WORD_RE   = re.compile(r"[a-z0-9][a-z0-9+#.\-]*")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have i in is it its of on or our that the "
+    "this to was we were will with you your my me he she they them his her their".split()
+)
+
+
+def split_sentences(text: str) -> list[str]:
+    return [s.strip() for s in _SENT_RE.split(text) if s and s.strip()]
+
+
+def _truncate_words(sentence: str, budget: int) -> str:
+    """Last resort for a single run-on "sentence": cut at a word boundary."""
+    out: list[str] = []
+    used = 0
+    for w in sentence.split():
+        used += count_tokens(w)
+        if used > budget:
+            break
+        out.append(w)
+    return " ".join(out) + " …" if out else ""
+
+
+def condense(text: str, budget: int) -> str:
+    """
+    Keep the most informative sentences that fit in `budget` tokens, in their
+    original order. Sentences are scored by how often their content words
+    recur across the text (what it is mostly about), with a small bonus for
+    leading sentences.
+    """
+    if count_tokens(text) <= budget:
+        return text
+    sentences = split_sentences(text)
+    if not sentences:
+        return ""
+    tf = Counter(w for s in sentences for w in _WORD_RE.findall(s.lower()) if w not in _STOPWORDS)
+
+    scored = []
+    for i, s in enumerate(sentences):
+        words = [w for w in _WORD_RE.findall(s.lower()) if w not in _STOPWORDS]
+        if not words:
+            continue
+        score = sum(tf[w] for w in set(words)) / math.sqrt(len(words))
+        score *= 1.0 + 0.5 / (1 + i)          # lead bias
+        scored.append((score, i, s))
+
+    chosen: list[tuple[int, str]] = []
+    used = 0
+    for _, i, s in sorted(scored, reverse=True):
+        cost = count_tokens(s) + 1
+        if used + cost <= budget:
+            chosen.append((i, s))
+            used += cost
+    if not chosen:
+        return _truncate_words(sentences[0], budget)
+    return " ".join(s for _, s in sorted(chosen))
+
+
+# ─────────────────────────────────────────────────────────────
+# BUDGETED PACKING
+# ─────────────────────────────────────────────────────────────
+
+@dataclass
+class Section:
+    name:   str
+    text:   str
+    weight: float = 1.0
+
+
+def pack_sections(sections: list[Section], budget: int) -> dict[str, str]:
+    """
+    Water-fill `budget` tokens across sections by weight. Sections smaller than
+    their share keep their full text and hand the surplus to the others; only
+    sections still over their allocation are condensed.
+    """
+    sizes     = {s.name: count_tokens(s.text) for s in sections}
+    alloc:    dict[str, int] = {}
+    remaining = list(sections)
+    left      = budget
+    while remaining:
+        total_w = sum(s.weight for s in remaining) or 1.0
+        fits = [s for s in remaining if sizes[s.name] <= left * s.weight / total_w]
+        if not fits:
+            for s in remaining:
+                alloc[s.name] = int(left * s.weight / total_w)
+            break
+        for s in fits:
+            alloc[s.name] = sizes[s.name]
+            left -= sizes[s.name]
+            remaining.remove(s)
+    return {s.name: condense(s.text, alloc[s.name]) for s in sections}
+
+
+# ─────────────────────────────────────────────────────────────
+# CRAWL BLOB HELPERS
+# ─────────────────────────────────────────────────────────────
+_SOURCE_RE = re.compile(r"^--- Source: (.+?) ---$", re.MULTILINE)
+
+
+def split_sources(blob: str) -> list[tuple[str, str]]:
+    """Split crawl output into [(header, content)] in source order."""
+    parts   = _SOURCE_RE.split(blob or "")
+    sources = []
+    for i in range(1, len(parts) - 1, 2):
+        sources.append((parts[i], parts[i + 1].strip()))
+    return sources
+
+
+def join_sources(sources: list[tuple[str, str]]) -> str:
+    return "\n".join(f"--- Source: {header} ---\n{content}\n" for header, content in sources)
+
+
+def pack_profile_context(
+    resume_text: str, crawled: str, budget: int, resume_weight: float = 2.0,
+) -> tuple[str, str]:
+    """Budget the resume and each crawled source independently for build_profile()."""
+    sources  = [(h, strip_boilerplate(c)) for h, c in split_sources(crawled)]
+    sections = [Section("resume", resume_text, resume_weight)] + [
+        Section(f"src{i}", c) for i, (_, c) in enumerate(sources) if c
+    ]
+    packed = pack_sections(sections, budget)
+    kept   = [(h, packed.get(f"src{i}", "")) for i, (h, _) in enumerate(sources)]
+    return packed["resume"], join_sources([(h, c) for h, c in kept if c])
@@ -0,0 +1,150 @@
+"""
+TalentOS · Crawl Cleaning
+Post-crawl cleanup across all sources scraped for one candidate.
+
+  1. Line-frequency boilerplate — short lines repeated within one page are
+     removed, and so are lines that recur across sources when they also
+     repeat inside a page or look like nav/footer rows (menus, link-only
+     rows, ©/privacy/follow lines); plus the per-line patterns in
+     context_packing.strip_boilerplate(). Any other line found in several
+     sources (a job title, a skills line) is kept once, in the first source
+     that has it.
+  2. Near-duplicate paragraphs — each paragraph is shingled into hashed word
+     5-grams; a paragraph whose shingles are mostly contained in an earlier
+     kept paragraph (same README on two URLs, repeated project blurbs) is
+     dropped.
+
+clean_sources() returns the cleaned sources and a CleanStats with the
+number of bytes saved.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+
+from context_packing import strip_boilerplate
+
+SHINGLE_SIZE         = 5
+DUPLICATE_THRESHOLD  = 0.8    # containment of a paragraph's shingles in one kept paragraph
+MAX_BOILERPLATE_LEN  = 200    # only short lines are treated as nav/footer candidates
+WITHIN_PAGE_REPEATS  = 3
+
+_MD_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_WS_RE      = re.compile(r"\s+")
+_WORD_RE    = re.compile(r"\w+")
+_NAV_WORDS   = (
+    r"(home|about( me)?|blog|posts|projects|portfolio|resume|cv|contact( me)?|menu|search|archives?|"
+    r"tags|categories|rss|back to top|next|previous|older posts|newer posts|read more)"
+)
+_NAV_RE     = re.compile(
+    rf"^{_NAV_WORDS}(\s*[|·•/]\s*{_NAV_WORDS})*$"                           # "Home | Blog | About"
+    r"|^(share( this)?( on \w+)?|follow( me| us)?( on .*)?|(powered|built|made) (by|with) .*)$"
+    r"|(©|\(c\) \d{4}|copyright|all rights reserved|privacy policy|terms of (service|use)|cookie)",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class CleanStats:
+    bytes_in:               int = 0
+    bytes_out:              int = 0
+    boilerplate_lines:      int = 0
+    duplicate_lines:        int = 0
+    duplicate_paragraphs:   int = 0
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_in - self.bytes_out
+
+    def as_dict(self) -> dict:
+        return {
+            "bytes_in":             self.bytes_in,
+            "bytes_out":            self.bytes_out,
+            "bytes_saved":          self.bytes_saved,
+            "boilerplate_lines":    self.boilerplate_lines,
+            "duplicate_lines":      self.duplicate_lines,
+            "duplicate_paragraphs": self.duplicate_paragraphs,
+        }
+
+
+def _norm_line(line: str) -> str:
+    return _WS_RE.sub(" ", _MD_LINK_RE.sub(r"\1", line)).strip().lower()
+
+
+def _shingles(text: str) -> set[int]:
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        return {hash(" ".join(words))} if words else set()
+    return {hash(" ".join(words[i:i + SHINGLE_SIZE])) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def _is_nav(line: str, key: str) -> bool:
+    """Menu / footer shape: a link-only row or a nav/legal phrase."""
+    if _MD_LINK_RE.search(line) and not _WORD_RE.search(_MD_LINK_RE.sub("", line)):
+        return True
+    return bool(_NAV_RE.search(key))
+
+
+def _drop_boilerplate_lines(contents: list[str], stats: CleanStats) -> list[str]:
+    per_source = [Counter(_norm_line(l) for l in c.splitlines() if l.strip()) for c in contents]
+    source_df  = Counter(line for counts in per_source for line in counts)
+    max_repeat: Counter = Counter()
+    for counts in per_source:
+        for line, n in counts.items():
+            max_repeat[line] = max(max_repeat[line], n)
+
+    seen:    set[str] = set()      # cross-source lines already kept once
+    cleaned = []
+    for content, counts in zip(contents, per_source):
+        kept = []
+        for line in content.splitlines():
+            key = _norm_line(line)
+            if key and len(key) <= MAX_BOILERPLATE_LEN:
+                if counts[key] >= WITHIN_PAGE_REPEATS or (
+                    source_df[key] > 1 and (max_repeat[key] > 1 or _is_nav(line, key))
+                ):
+                    stats.boilerplate_lines += 1
+                    continue
+                if source_df[key] > 1:
+                    if key in seen:
+                        stats.duplicate_lines += 1
+                        continue
+                    seen.add(key)
+            kept.append(line)
+        cleaned.append(strip_boilerplate("\n".join(kept)))
+    return cleaned
+
+
+def _drop_duplicate_paragraphs(contents: list[str], stats: CleanStats) -> list[str]:
+    index: dict[int, list[int]] = defaultdict(list)   # shingle → kept paragraph ids
+    next_pid = 0
+    cleaned = []
+    for content in contents:
+        kept = []
+        for para in re.split(r"\n\s*\n", content):
+            if not para.strip():
+                continue
+            sh = _shingles(para)
+            if sh:
+                overlap = Counter(pid for s in sh for pid in index.get(s, ()))
+                if overlap and max(overlap.values()) / len(sh) >= DUPLICATE_THRESHOLD:
+                    stats.duplicate_paragraphs += 1
+                    continue
+                for s in sh:
+                    index[s].append(next_pid)
+                next_pid += 1
+            kept.append(para.strip())
+        cleaned.append("\n\n".join(kept))
+    return cleaned
+
+
+def clean_sources(sources: list[tuple[str, str]]) -> tuple[list[tuple[str, str]], CleanStats]:
+    """Clean [(url, markdown)] in order; earlier sources win duplicate paragraphs."""
+    stats = CleanStats(bytes_in=sum(len(c.encode("utf-8")) for _, c in sources))
+    contents = _drop_boilerplate_lines([c for _, c in sources], stats)
+    contents = _drop_duplicate_paragraphs(contents, stats)
+    cleaned  = [(url, c) for (url, _), c in zip(sources, contents)]
+    stats.bytes_out = sum(len(c.encode("utf-8")) for _, c in cleaned)
+    return cleaned, stats
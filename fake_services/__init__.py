@@ -0,0 +1,89 @@
+"""
+TalentOS · Fake Services
+Local stand-ins for every external integration so the pipeline can be
+load-tested and benchmarked offline:
+
+  openrouter  — chat completions (profile, questions, answer JSON, report)
+  firecrawl   — scrape / batch scrape / crawl
+  mindee      — V2 enqueue → job → inference
+  whisper     — speech-to-text
+  tts         — text-to-speech for TTS_URL (replaces gTTS)
+
+Each server has its own latency distribution, error rate and optional
+canned payloads (<payload_dir>/<service>/<file>). Start them with
+`python -m fake_services` or start_all() from a benchmark.
+"""
+
+from __future__ import annotations
+
+from fake_services.base import FakeService, LatencyModel, ServiceConfig
+from fake_services.firecrawl import FirecrawlFake
+from fake_services.mindee import MindeeFake
+from fake_services.openrouter import OpenRouterFake
+from fake_services.speech import TTSFake, WhisperFake
+
+SERVICES: dict[str, type[FakeService]] = {
+    "openrouter": OpenRouterFake,
+    "firecrawl":  FirecrawlFake,
+    "mindee":     MindeeFake,
+    "whisper":    WhisperFake,
+    "tts":        TTSFake,
+}
+
+DEFAULT_PORTS = {"openrouter": 9101, "firecrawl": 9102, "mindee": 9103, "whisper": 9104, "tts": 9105}
+
+
+def per_service(values: list[str] | None, cast) -> dict:
+    """Parse CLI options of the form ['name=value', 'value']; a bare value applies to every service."""
+    out = {}
+    for raw in values or []:
+        name, sep, value = raw.partition("=")
+        if not sep:
+            out.update({n: cast(raw) for n in SERVICES})
+        elif name not in SERVICES:
+            raise ValueError(f"unknown service '{name}' (expected one of {', '.join(SERVICES)})")
+        else:
+            out[name] = cast(value)
+    return out
+
+
+def service_env(urls: dict[str, str]) -> dict[str, str]:
+    """Environment overrides that point config.Config at running fakes."""
+    env = {}
+    if "openrouter" in urls:
+        env["OPENROUTER_BASE_URL"] = f"{urls['openrouter']}/api/v1"
+        env["OPENROUTER_API_KEY"]  = "fake-key"
+    if "firecrawl" in urls:
+        env["FIRECRAWL_API_URL"] = urls["firecrawl"]
+        env["FIRECRAWL_API_KEY"] = "fake-key"
+    if "mindee" in urls:
+        env["MINDEE_API_URL"] = f"{urls['mindee']}/v2"
+        env["MINDEE_API_KEY"] = "fake-key"
+    if "whisper" in urls:
+        env["WHISPER_URL"] = f"{urls['whisper']}/models/openai/whisper-large-v3"
+        env["HUGGINGFACE_API_KEY"] = "fake-key"
+    if "tts" in urls:
+        env["TTS_URL"] = f"{urls['tts']}/tts"
+    return env
+
+
+def start_service(name: str, config: ServiceConfig | None = None, port: int = 0,
+                  host: str = "127.0.0.1") -> FakeService:
+    service = SERVICES[name](config)
+    service.start(host, port)
+    return service
+
+
+def start_all(configs: dict[str, ServiceConfig] | None = None, ports: dict[str, int] | None = None,
+              host: str = "127.0.0.1") -> dict[str, FakeService]:
+    """Start every fake (ephemeral ports unless given) and return them by name."""
+    configs = configs or {}
+    ports   = ports or {}
+    return {name: start_service(name, configs.get(name), ports.get(name, 0), host) for name in SERVICES}
+
+
+__all__ = [
+    "FakeService", "LatencyModel", "ServiceConfig", "SERVICES", "DEFAULT_PORTS",
+    "FirecrawlFake", "MindeeFake", "OpenRouterFake", "TTSFake", "WhisperFake",
+    "per_service", "service_env", "start_service", "start_all",
+]
@@ -0,0 +1,65 @@
+"""
+Run the fake services in the foreground.
+
+  python -m fake_services
+  python -m fake_services --latency openrouter=lognormal:1500:0.6 --latency firecrawl=uniform:300:900 \
+                          --error-rate openrouter=0.05 --error-status openrouter=429 --seed 7
+
+Prints the environment overrides to export before starting the apps.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from fake_services import (
+    DEFAULT_PORTS, SERVICES, LatencyModel, ServiceConfig, per_service, service_env, start_all,
+)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(prog="python -m fake_services", description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--latency", action="append", metavar="[SERVICE=]SPEC",
+                    help="fixed:MS | uniform:LO:HI | normal:MEAN:STD | lognormal:MEDIAN:SIGMA")
+    ap.add_argument("--error-rate", action="append", metavar="[SERVICE=]RATE")
+    ap.add_argument("--error-status", action="append", metavar="[SERVICE=]CODE")
+    ap.add_argument("--payload-dir", type=Path, help="canned payloads: <dir>/<service>/<file>")
+    ap.add_argument("--seed", type=int)
+    ap.add_argument("--ephemeral", action="store_true", help="bind random free ports")
+    args = ap.parse_args()
+
+    latency = per_service(args.latency, LatencyModel.parse)
+    errors  = per_service(args.error_rate, float)
+    status  = per_service(args.error_status, int)
+    configs = {
+        name: ServiceConfig(
+            latency=latency.get(name, LatencyModel()),
+            error_rate=errors.get(name, 0.0),
+            error_status=status.get(name, 500),
+            seed=None if args.seed is None else args.seed + i,
+            payload_dir=args.payload_dir,
+        )
+        for i, name in enumerate(SERVICES)
+    }
+    services = start_all(configs, None if args.ephemeral else DEFAULT_PORTS, args.host)
+
+    for name, svc in services.items():
+        print(f"  {name:<11} {svc.url}")
+    print("\n# export these before starting main.py / candidate_app.py")
+    for k, v in service_env({n: s.url for n, s in services.items()}).items():
+        print(f"export {k}={v}")
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        for svc in services.values():
+            svc.stop()
+
+
+if __name__ == "__main__":
+    main()
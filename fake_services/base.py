@@ -0,0 +1,175 @@
+"""
+Shared plumbing for the stand-in servers: route table, latency model,
+error injection and canned payload loading.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# A handler gets (match, body_bytes, headers) and returns (status, payload, content_type).
+# dict/list payloads are JSON-encoded; bytes are sent as-is.
+Handler = Callable[[re.Match, bytes, dict], tuple]
+
+
+# ─────────────────────────────────────────────────────────────
+# LATENCY
+# ─────────────────────────────────────────────────────────────
+
+@dataclass
+class LatencyModel:
+    """
+    Per-request latency in milliseconds.
+      fixed:MS             — constant
+      uniform:LO:HI        — uniform between LO and HI
+      normal:MEAN:STD      — clipped at 0
+      lognormal:MEDIAN:SIGMA — long-tailed, like real LLM/API latency
+    """
+    kind:   str = "fixed"
+    params: tuple = (0.0,)
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        kind, *raw = spec.split(":")
+        params = tuple(float(p) for p in raw) or (0.0,)
+        if kind not in ("fixed", "uniform", "normal", "lognormal"):
+            raise ValueError(f"unknown latency model '{kind}'")
+        return cls(kind, params)
+
+    def sample(self, rng: random.Random) -> float:
+        p = self.params
+        if self.kind == "uniform":
+            return rng.uniform(p[0], p[1])
+        if self.kind == "normal":
+            return max(0.0, rng.gauss(p[0], p[1]))
+        if self.kind == "lognormal":
+            return rng.lognormvariate(math.log(max(p[0], 1e-6)), p[1] if len(p) > 1 else 0.5)
+        return p[0]
+
+
+@dataclass
+class ServiceConfig:
+    latency:     LatencyModel = field(default_factory=LatencyModel)
+    error_rate:  float = 0.0          # fraction of requests answered with error_status
+    error_status: int = 500           # 429 to exercise rate-limit handling
+    seed:        Optional[int] = None
+    payload_dir: Optional[Path] = None   # canned JSON/text overrides, see load_payload()
+
+
+# ─────────────────────────────────────────────────────────────
+# SERVER
+# ─────────────────────────────────────────────────────────────
+
+class FakeService:
+    """A threaded HTTP server with a regex route table."""
+
+    name = "fake"
+
+    def __init__(self, config: Optional[ServiceConfig] = None):
+        self.config  = config or ServiceConfig()
+        self.rng     = random.Random(self.config.seed)
+        self._rng_lock = threading.Lock()
+        self.routes: list[tuple[str, re.Pattern, Handler]] = []
+        self.stats   = {"requests": 0, "errors_injected": 0}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread]    = None
+
+    def route(self, method: str, pattern: str, handler: Handler) -> None:
+        self.routes.append((method, re.compile(pattern + r"/?$"), handler))
+
+    def load_payload(self, name: str, default: Any) -> Any:
+        """Return payload_dir/<name> (parsed if .json) or the built-in default."""
+        if self.config.payload_dir:
+            path = Path(self.config.payload_dir) / self.name / name
+            if path.exists():
+                text = path.read_text(encoding="utf-8")
+                return json.loads(text) if path.suffix == ".json" else text
+        return default
+
+    # ── request dispatch ─────────────────────────────────────
+    def _draw(self) -> tuple[float, bool]:
+        with self._rng_lock:
+            delay = self.config.latency.sample(self.rng)
+            fail  = self.rng.random() < self.config.error_rate
+        return delay, fail
+
+    def handle(self, method: str, path: str, body: bytes, headers: dict) -> tuple[int, bytes, str, dict]:
+        self.stats["requests"] += 1
+        delay_ms, fail = self._draw()
+        time.sleep(delay_ms / 1000)
+        if fail:
+            self.stats["errors_injected"] += 1
+            extra = {"Retry-After": "1"} if self.config.error_status == 429 else {}
+            err = json.dumps({"error": {"message": "injected failure", "code": self.config.error_status}})
+            return self.config.error_status, err.encode(), "application/json", extra
+
+        for m, pattern, handler in self.routes:
+            match = pattern.match(path.split("?", 1)[0])
+            if m == method and match:
+                status, payload, ctype = handler(match, body, headers)
+                if isinstance(payload, (dict, list)):
+                    payload = json.dumps(payload).encode()
+                elif isinstance(payload, str):
+                    payload = payload.encode()
+                return status, payload, ctype, {}
+        return 404, b'{"error": "not found"}', "application/json", {}
+
+    # ── lifecycle ────────────────────────────────────────────
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        service = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _dispatch(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body   = self.rfile.read(length) if length else b""
+                status, payload, ctype, extra = service.handle(
+                    method, self.path, body, {k.lower(): v for k, v in self.headers.items()},
+                )
+                self.send_response(status)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(payload)))
+                for k, v in extra.items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):  self._dispatch("GET")
+            def do_POST(self): self._dispatch("POST")
+
+            def log_message(self, *args):   # keep benchmark output clean
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name=f"fake-{self.name}", daemon=True)
+        self._thread.start()
+        return self.url
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def json_body(body: bytes) -> dict:
+    try:
+        return json.loads(body or b"{}")
+    except json.JSONDecodeError:
+        return {}
@@ -0,0 +1,86 @@
+"""
+Firecrawl v1/v2 scrape, batch-scrape and crawl endpoints. Async jobs
+(batch, crawl) complete immediately: the first status poll returns
+"completed" with one markdown document per URL.
+"""
+
+from __future__ import annotations
+
+import threading
+import uuid
+from urllib.parse import urlsplit
+
+from fake_services.base import FakeService, ServiceConfig, json_body
+
+DEFAULT_PAGE = (
+    "[Home](/) | [Projects](/projects) | [Blog](/blog)\n\n"
+    "# {title}\n\n"
+    "Software engineer working on distributed systems and developer tooling. "
+    "Maintainer of several open-source Python libraries.\n\n"
+    "## Projects\n\n"
+    "**queue-runner** — a Redis-backed task queue with retries and rate limiting. "
+    "Written in Python with asyncio, tested with pytest, deployed on Kubernetes.\n\n"
+    "**semantic-search** — embeddings-based search over internal documentation "
+    "using sentence-transformers and a flat vector index.\n\n"
+    "© 2025 All rights reserved."
+)
+
+
+class FirecrawlFake(FakeService):
+    name = "firecrawl"
+
+    def __init__(self, config: ServiceConfig | None = None):
+        super().__init__(config)
+        self._jobs: dict[str, list[str]] = {}
+        self._jobs_lock = threading.Lock()
+        self.route("POST", r"/v[12]/scrape", self._scrape)
+        self.route("POST", r"/v[12]/batch/scrape", self._start_batch)
+        self.route("GET",  r"/v[12]/batch/scrape/(?P<job>[\w-]+)", self._job_status)
+        self.route("POST", r"/v[12]/crawl", self._start_crawl)
+        self.route("GET",  r"/v[12]/crawl/(?P<job>[\w-]+)", self._job_status)
+
+    def _document(self, url: str) -> dict:
+        title = urlsplit(url).netloc or url
+        markdown = self.load_payload("page.md", DEFAULT_PAGE).replace("{title}", title)
+        return {
+            "markdown": markdown,
+            "metadata": {"sourceURL": url, "url": url, "title": title, "statusCode": 200},
+        }
+
+    def _new_job(self, urls: list[str]) -> str:
+        job_id = str(uuid.uuid4())
+        with self._jobs_lock:
+            self._jobs[job_id] = urls
+        return job_id
+
+    def _scrape(self, match, body, headers):
+        url = json_body(body).get("url", "")
+        if not url:
+            return 400, {"success": False, "error": "url is required"}, "application/json"
+        return 200, {"success": True, "data": self._document(url)}, "application/json"
+
+    def _start_batch(self, match, body, headers):
+        urls = json_body(body).get("urls") or []
+        return 200, {"success": True, "id": self._new_job(urls), "invalidURLs": []}, "application/json"
+
+    def _start_crawl(self, match, body, headers):
+        req   = json_body(body)
+        url   = req.get("url", "")
+        limit = max(1, int(req.get("limit") or 1))
+        # A bounded crawl returns the root plus up to limit-1 sub-pages.
+        pages = [url] + [f"{url.rstrip('/')}/page-{i}" for i in range(1, limit)]
+        return 200, {"success": True, "id": self._new_job(pages)}, "application/json"
+
+    def _job_status(self, match, body, headers):
+        with self._jobs_lock:
+            urls = self._jobs.get(match.group("job"))
+        if urls is None:
+            return 404, {"success": False, "error": "job not found"}, "application/json"
+        return 200, {
+            "success":     True,
+            "status":      "completed",
+            "total":       len(urls),
+            "completed":   len(urls),
+            "creditsUsed": len(urls),
+            "data":        [self._document(u) for u in urls],
+        }, "application/json"
@@ -0,0 +1,74 @@
+"""
+Mindee V2 enqueue → poll → inference flow. Routes are matched on their
+suffix, so the fake works whatever prefix MINDEE_API_URL carries
+(mindee_service.get_mindee_client sets it on the client).
+Jobs are processed on the first poll.
+"""
+
+from __future__ import annotations
+
+import threading
+import uuid
+
+from fake_services.base import FakeService, ServiceConfig
+
+DEFAULT_FIELDS = {
+    "given_names":  {"value": "Alex"},
+    "surnames":     {"value": "Rivera"},
+    "email":        {"value": "alex.rivera@example.com"},
+    "phone_number": {"value": "+1 555 0100"},
+    "address":      {"value": "Berlin, Germany"},
+    "skills":       {"items": [{"value": s} for s in ("Python", "FastAPI", "PostgreSQL", "Docker")]},
+    "languages":    {"items": [{"value": "English"}, {"value": "German"}]},
+    "experience":   {"items": [{"value": "Backend Engineer, Acme Corp, 2020–2025"}]},
+    "education":    {"items": [{"value": "BSc Computer Science, TU Berlin"}]},
+}
+
+DEFAULT_RAW_TEXT = (
+    "Alex Rivera — Backend Engineer\nalex.rivera@example.com\n"
+    "Skills: Python, FastAPI, PostgreSQL, Docker, Kubernetes\n"
+    "Experience: Backend Engineer at Acme Corp (2020–2025)"
+)
+
+
+class MindeeFake(FakeService):
+    name = "mindee"
+
+    def __init__(self, config: ServiceConfig | None = None):
+        super().__init__(config)
+        self._jobs: dict[str, str] = {}          # job id → model id
+        self._jobs_lock = threading.Lock()
+        self.route("POST", r".*/inferences/enqueue", self._enqueue)
+        self.route("GET",  r"(?P<prefix>.*)/jobs/(?P<job>[\w-]+)", self._job)
+        self.route("GET",  r".*/inferences/(?P<job>[\w-]+)", self._inference)
+
+    def _enqueue(self, match, body, headers):
+        job_id = str(uuid.uuid4())
+        with self._jobs_lock:
+            self._jobs[job_id] = "fake-model"
+        return 202, {"job": {"id": job_id, "status": "Processing", "model_id": "fake-model"}}, "application/json"
+
+    def _job(self, match, body, headers):
+        job_id = match.group("job")
+        with self._jobs_lock:
+            known = job_id in self._jobs
+        if not known:
+            return 404, {"status": 404, "detail": "job not found"}, "application/json"
+        return 200, {"job": {
+            "id":         job_id,
+            "status":     "Processed",
+            "model_id":   "fake-model",
+            "result_url": f"http://{headers.get('host', '')}{match.group('prefix')}/inferences/{job_id}",
+        }}, "application/json"
+
+    def _inference(self, match, body, headers):
+        job_id = match.group("job")
+        return 200, {"inference": {
+            "id":    job_id,
+            "model": {"id": "fake-model"},
+            "file":  {"name": "resume.pdf", "page_count": 1, "mime_type": "application/pdf"},
+            "result": {
+                "fields":   self.load_payload("fields.json", DEFAULT_FIELDS),
+                "raw_text": {"pages": [{"content": self.load_payload("raw_text.txt", DEFAULT_RAW_TEXT)}]},
+            },
+        }}, "application/json"
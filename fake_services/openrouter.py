@@ -0,0 +1,104 @@
+"""
+OpenAI-compatible chat completions, shaped like OpenRouter's
+POST /api/v1/chat/completions. The reply is picked from the prompt so the
+pipeline's parsers see realistic output:
+
+  'Return a JSON object'        → answer evaluation JSON
+  'numbered list of N questions' → N numbered questions
+  'evaluation report'           → markdown report with the usual sections
+  anything else                 → a candidate profile
+"""
+
+from __future__ import annotations
+
+import re
+import time
+import uuid
+
+from fake_services.base import FakeService, ServiceConfig, json_body
+
+_N_QUESTIONS_RE = re.compile(r"numbered list of (\d+) questions", re.IGNORECASE)
+_ROLE_RE        = re.compile(r"(?:Target Role|Role|for the role):\s*([^\n]+)")
+
+DEFAULT_PROFILE = (
+    "## Candidate Profile\n"
+    "Backend engineer with five years of Python experience building data-heavy web services. "
+    "Designed and operated FastAPI and Django services on AWS, with PostgreSQL and Redis. "
+    "Open-source contributions show clean, tested code and steady commit history.\n\n"
+    "## Key Skills\nPython, FastAPI, SQL, Docker, Kubernetes, CI/CD, system design.\n\n"
+    "## Notable Projects\nA job-queue service handling 2M tasks/day; an internal search tool "
+    "built on embeddings."
+)
+
+DEFAULT_REPORT = (
+    "## Executive Summary\nA solid candidate with relevant production experience.\n\n"
+    "## Technical Competency\nStrong Python and API design fundamentals.\n\n"
+    "## Interview Analysis\nAnswers were specific and grounded in past projects.\n\n"
+    "## Strengths\n- Ownership\n- Clear communication\n\n"
+    "## Development Areas\n- Limited frontend exposure\n\n"
+    "## Cultural Fit\nCollaborative and pragmatic.\n\n"
+    "## Hiring Recommendation\nProceed to the next round.\n\n"
+    "## Final Verdict\nRecommended."
+)
+
+DEFAULT_QUESTIONS = [
+    "Walk us through the architecture of the most complex service you have owned.",
+    "Describe a production incident you debugged and what you changed afterwards.",
+    "How would you design a rate limiter shared across several API workers?",
+    "Tell us about a time you disagreed with a technical decision and how it was resolved.",
+    "How do you decide what to test and what to leave untested?",
+    "What would you change first in a codebase with no observability?",
+]
+
+
+class OpenRouterFake(FakeService):
+    name = "openrouter"
+
+    def __init__(self, config: ServiceConfig | None = None):
+        super().__init__(config)
+        self.route("POST", r"(?:/api)?/v1/chat/completions", self._completions)
+        self.route("GET",  r"(?:/api)?/v1/models", self._models)
+
+    def _reply_for(self, prompt: str) -> str:
+        if "Return a JSON object" in prompt:
+            with self._rng_lock:
+                iv, skill = self.rng.randint(55, 92), self.rng.randint(55, 92)
+            return ('{"interview_score": %d, "skill_match_score": %d, '
+                    '"rationale": "Concrete answer with relevant detail."}' % (iv, skill))
+        m = _N_QUESTIONS_RE.search(prompt)
+        if m:
+            questions = self.load_payload("questions.json", DEFAULT_QUESTIONS)
+            n = int(m.group(1))
+            return "\n".join(f"{i + 1}. {questions[i % len(questions)]}" for i in range(n))
+        if "evaluation report" in prompt:
+            return self.load_payload("report.md", DEFAULT_REPORT)
+        return self.load_payload("profile.md", DEFAULT_PROFILE)
+
+    def _completions(self, match, body, headers):
+        req      = json_body(body)
+        messages = req.get("messages") or []
+        # Follow-up turns repeat the conversation; the first user turn carries the task.
+        user     = [m.get("content", "") for m in messages if m.get("role") == "user"]
+        prompt   = "\n".join(user)
+        content  = self._reply_for(prompt)
+        prompt_tokens     = sum(len(str(m.get("content", "")).split()) for m in messages)
+        completion_tokens = len(content.split())
+        return 200, {
+            "id":      f"gen-{uuid.uuid4().hex[:24]}",
+            "object":  "chat.completion",
+            "created": int(time.time()),
+            "model":   req.get("model", "fake/model"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content, "reasoning": None},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens":     prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens":      prompt_tokens + completion_tokens,
+            },
+        }, "application/json"
+
+    def _models(self, match, body, headers):
+        return 200, {"data": [{"id": "fake/model", "context_length": 131072}]}, "application/json"
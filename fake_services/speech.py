@@ -0,0 +1,45 @@
+"""
+Speech stand-ins: HF-inference style Whisper (POST raw audio → {"text"})
+and a TTS endpoint (POST {"text"} → audio/mpeg bytes) for TTS_URL.
+"""
+
+from __future__ import annotations
+
+from fake_services.base import FakeService, ServiceConfig, json_body
+
+DEFAULT_TRANSCRIPT = (
+    "In my last role I owned the task queue service. We moved it from cron jobs to a "
+    "Redis-backed worker pool, added retries with backoff and cut failed jobs by ninety percent."
+)
+
+# Smallest valid MPEG-1 Layer III frame header followed by silence; the
+# payload size scales with the text like real TTS output.
+_MP3_FRAME = b"\xff\xfb\x90\x64" + b"\x00" * 413
+
+
+class WhisperFake(FakeService):
+    name = "whisper"
+
+    def __init__(self, config: ServiceConfig | None = None):
+        super().__init__(config)
+        self.route("POST", r"/models/.+", self._transcribe)
+
+    def _transcribe(self, match, body, headers):
+        if not body:
+            return 400, {"error": "empty audio"}, "application/json"
+        return 200, {"text": self.load_payload("transcript.txt", DEFAULT_TRANSCRIPT)}, "application/json"
+
+
+class TTSFake(FakeService):
+    name = "tts"
+
+    def __init__(self, config: ServiceConfig | None = None):
+        super().__init__(config)
+        self.route("POST", r"/tts", self._speak)
+
+    def _speak(self, match, body, headers):
+        text = json_body(body).get("text", "")
+        if not text:
+            return 400, {"error": "text is required"}, "application/json"
+        # One 26 ms frame per two characters ≈ normal speaking rate.
+        return 200, _MP3_FRAME * max(1, len(text) // 2), "audio/mpeg"
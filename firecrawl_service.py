@@ -1,37 +1,186 @@
-from typing import List, Dict, Any
-from firecrawl import Firecrawl  #type: ignore
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import List, Dict, Any, Optional
 
+import requests
 
-from typing import List, Dict, Any
+from lazy_imports import has_module
+from tracing import in_context, span, traced
+
+# The SDK is imported when the first FirecrawlService is created.
+HAS_FIRECRAWL_SDK = has_module("firecrawl")
+
+DEFAULT_API_URL = "https://api.firecrawl.dev"
+
+
+class ScrapeMode(str, Enum):
+    SCRAPE = "scrape"   # landing page only, one request per URL
+    BATCH  = "batch"    # all URLs in a single batch-scrape job
+    CRAWL  = "crawl"    # bounded spider per URL (depth/page limits)
+
+
+@dataclass
+class CrawlBudget:
+    max_pages: int   = 3       # CRAWL only
+    max_depth: int   = 1       # CRAWL only
+    timeout:   float = 30.0    # seconds per URL (SCRAPE/CRAWL) or per batch (BATCH)
+
+
+@dataclass
+class ScrapeResult:
+    url:        str
+    ok:         bool
+    mode:       str
+    content:    str   = ""
+    pages:      int   = 0
+    elapsed_ms: float = 0.0
+    error:      str   = ""
+
+
+def _doc_markdown(doc: Any) -> str:
+    if isinstance(doc, dict):
+        return doc.get("markdown") or doc.get("content") or ""
+    return getattr(doc, "markdown", None) or getattr(doc, "content", None) or ""
+
+
+def _doc_source_url(doc: Any) -> str:
+    meta = doc.get("metadata") if isinstance(doc, dict) else getattr(doc, "metadata", None)
+    if meta is None:
+        return ""
+    if isinstance(meta, dict):
+        return meta.get("sourceURL") or meta.get("source_url") or meta.get("url") or ""
+    return getattr(meta, "source_url", None) or getattr(meta, "url", None) or ""
 
 
 class FirecrawlService:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, api_url: Optional[str] = None, max_workers: int = 6):
         """
         Initializes the Firecrawl connection once.
+        Single-page scrapes fall back to the REST API when firecrawl-py is not installed.
         """
         print("Initializing Firecrawl session...")
-        self.app = Firecrawl(api_key=api_key)
+        self.api_key     = api_key
+        self.api_url     = (api_url or DEFAULT_API_URL).rstrip("/")
+        self.max_workers = max_workers
+        self.app         = None
+        if HAS_FIRECRAWL_SDK:
+            from firecrawl import Firecrawl  #type: ignore
+            self.app = Firecrawl(api_key=api_key, api_url=self.api_url)
+
+    # ── single URL ───────────────────────────────────────────
+    def _scrape_one(self, url: str, budget: CrawlBudget) -> ScrapeResult:
+        if self.app is not None:
+            doc = self.app.scrape(
+                url, formats=["markdown"], only_main_content=True, timeout=int(budget.timeout * 1000),
+            )
+            return ScrapeResult(url=url, ok=True, mode=ScrapeMode.SCRAPE.value, content=_doc_markdown(doc), pages=1)
 
-    def scrape_links(self, url_list: List[str]) -> List[Dict[str, Any]]:
+        resp = requests.post(
+            f"{self.api_url}/v1/scrape",
+            json={"url": url, "formats": ["markdown"], "onlyMainContent": True},
+            headers={"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"},
+            timeout=budget.timeout,
+        )
+        if resp.status_code != 200:
+            return ScrapeResult(url=url, ok=False, mode=ScrapeMode.SCRAPE.value, error=f"HTTP {resp.status_code}")
+        return ScrapeResult(
+            url=url, ok=True, mode=ScrapeMode.SCRAPE.value,
+            content=_doc_markdown(resp.json().get("data", {})), pages=1,
+        )
+
+    def _crawl_one(self, url: str, budget: CrawlBudget) -> ScrapeResult:
+        job = self.app.crawl(
+            url,
+            limit=budget.max_pages,
+            max_discovery_depth=budget.max_depth,
+            poll_interval=1,
+            timeout=int(budget.timeout),
+        )
+        docs = getattr(job, "data", None) or []
+        return ScrapeResult(
+            url=url, ok=bool(docs), mode=ScrapeMode.CRAWL.value,
+            content="\n\n".join(_doc_markdown(d) for d in docs if _doc_markdown(d)),
+            pages=len(docs), error="" if docs else "crawl returned no pages",
+        )
+
+    def _timed(self, fn, url: str, budget: CrawlBudget, mode: ScrapeMode) -> ScrapeResult:
+        t0 = time.perf_counter()
+        with span("firecrawl.scrape", url=url, mode=mode.value) as sp:
+            try:
+                result = fn(url, budget)
+            except Exception as exc:
+                result = ScrapeResult(url=url, ok=False, mode=mode.value, error=f"{type(exc).__name__}: {exc}")
+            if not result.ok:
+                sp.error(result.error)
+            sp.set(bytes=len(result.content.encode("utf-8")), pages=result.pages)
+        result.elapsed_ms = round((time.perf_counter() - t0) * 1000, 1)
+        return result
+
+    # ── many URLs ────────────────────────────────────────────
+    def _batch(self, url_list: List[str], budget: CrawlBudget) -> List[ScrapeResult]:
+        t0 = time.perf_counter()
+        try:
+            job = self.app.batch_scrape(
+                url_list, formats=["markdown"], only_main_content=True,
+                poll_interval=1, wait_timeout=int(budget.timeout),
+            )
+            docs = getattr(job, "data", None) or []
+        except Exception as exc:
+            elapsed = round((time.perf_counter() - t0) * 1000, 1)
+            return [ScrapeResult(url=u, ok=False, mode=ScrapeMode.BATCH.value, elapsed_ms=elapsed,
+                                 error=f"{type(exc).__name__}: {exc}") for u in url_list]
+
+        elapsed = round((time.perf_counter() - t0) * 1000, 1)
+        by_url  = {}
+        for i, doc in enumerate(docs):
+            # Results normally carry their source URL; fall back to submission order.
+            key = _doc_source_url(doc) or (url_list[i] if i < len(url_list) else "")
+            by_url[key.rstrip("/")] = doc
+        results = []
+        for url in url_list:
+            doc = by_url.get(url.rstrip("/"))
+            if doc is None:
+                results.append(ScrapeResult(url=url, ok=False, mode=ScrapeMode.BATCH.value,
+                                            elapsed_ms=elapsed, error="missing from batch result"))
+            else:
+                results.append(ScrapeResult(url=url, ok=True, mode=ScrapeMode.BATCH.value,
+                                            content=_doc_markdown(doc), pages=1, elapsed_ms=elapsed))
+        return results
+
+    @traced("firecrawl.scrape_links")
+    def scrape_links(
+        self,
+        url_list: List[str],
+        mode: ScrapeMode = ScrapeMode.SCRAPE,
+        budget: Optional[CrawlBudget] = None,
+    ) -> List[Dict[str, Any]]:
         """
-        Reuses the existing app instance to scrape a list of URLs.
+        Scrape every URL under the given mode and budget. All URLs are submitted
+        concurrently; each result dict carries url, ok, mode, content, pages,
+        elapsed_ms and error (failure reason) so nothing is silently dropped.
         """
         if not url_list:
             print("No URLs provided for scraping.")
             return []
 
-        print(f"Scraping {len(url_list)} URLs...")
-        scrape_result = list()
-        for url in url_list:
-            try:
-                job = self.app.crawl(url, limit=5, poll_interval=1, timeout=120)
-                #result = filter_firecrawl_data(job)
-                scrape_result.append(job)
-            except Exception as e:
-                continue 
-        if scrape_result:
-            return scrape_result
+        budget = budget or CrawlBudget()
+        mode   = ScrapeMode(mode)
+        if mode is not ScrapeMode.SCRAPE and self.app is None:
+            print(f"firecrawl-py not installed — '{mode.value}' mode falls back to single-page scrape.")
+            mode = ScrapeMode.SCRAPE
+
+        print(f"Scraping {len(url_list)} URLs ({mode.value})...")
+        if mode is ScrapeMode.BATCH:
+            results = self._batch(url_list, budget)
         else:
-            print(f"Batch scrape failed: {scrape_result}")
-            return []
+            fn = self._crawl_one if mode is ScrapeMode.CRAWL else self._scrape_one
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(url_list))) as pool:
+                results = list(pool.map(in_context(lambda u: self._timed(fn, u, budget, mode)), url_list))
+
+        failed = [r for r in results if not r.ok]
+        if failed:
+            print(f"Scrape failed for {len(failed)}/{len(results)} URLs: "
+                  + "; ".join(f"{r.url} ({r.error})" for r in failed))
+        return [asdict(r) for r in results]
@@ -3,17 +3,19 @@ TalentOS · HR Recruitment Portal
 Job Board → Create Job → Candidate Reports
 
 Data layer: FastAPI backend via shared/api_client.py
-Theme:      Full TalentOS design system (tokens identical to talentos_theme.py)
+Theme:      Full TalentOS design system — static/theme/hr.css via theme.py
 Port:       8501  (default)
 """
 
 import streamlit as st
+import html
 import os
 import sys
 import importlib.util
 
 # ── Load api_client ────────────────────────────────────────────────────────────
 import api_client
+import theme
 
 list_jobs          = api_client.list_jobs
 get_job            = api_client.get_job
@@ -34,367 +36,9 @@ st.set_page_config(
 )
 
 # ─────────────────────────────────────────────────────────────
-# DESIGN SYSTEM CSS  (identical tokens to talentos_theme.py)
+# DESIGN SYSTEM — static/theme/hr.css, served by the API (theme.py)
 # ─────────────────────────────────────────────────────────────
-st.markdown("""
-<link rel="preconnect" href="https://fonts.googleapis.com">
-<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-<link href="https://fonts.googleapis.com/css2?family=Sora:wght@300;400;500;600;700;800&family=JetBrains+Mono:wght@400;500;600&display=swap" rel="stylesheet">
-
-<style>
-/* ═══ ROOT TOKENS ═══════════════════════════════════════════ */
-:root {
-  --bg-base:  #03050D;
-  --bg-card:  rgba(255,255,255,0.028);
-  --border:   rgba(255,255,255,0.07);
-  --blue:     #00A3FF;
-  --cyan:     #00E5C4;
-  --gold:     #F5C842;
-  --red:      #FF4D6A;
-  --violet:   #7B61FF;
-  --t1: #EDF0FA; --t2: #8B93B0; --t3: #4E566E;
-  --f-main: 'Sora', sans-serif;
-  --f-mono: 'JetBrains Mono', monospace;
-  --r-sm: 10px; --r-md: 16px; --r-lg: 24px; --r-xl: 32px;
-  --ease:   cubic-bezier(0.4, 0, 0.2, 1);
-  --spring: cubic-bezier(0.34, 1.56, 0.64, 1);
-  --t: 0.28s;
-}
-
-/* ═══ GLOBAL ════════════════════════════════════════════════ */
-*, *::before, *::after { box-sizing: border-box; }
-
-html, body,
-[data-testid="stAppViewContainer"],
-[data-testid="stApp"] {
-  background-color: var(--bg-base) !important;
-  font-family: var(--f-main) !important;
-  color: var(--t1) !important;
-}
-[data-testid="stMain"],
-[data-testid="stMainBlockContainer"],
-[data-testid="stVerticalBlock"] { background: transparent !important; }
-
-/* ═══ AMBIENT MESH ══════════════════════════════════════════ */
-[data-testid="stAppViewContainer"]::before {
-  content: '';
-  position: fixed; inset: 0;
-  background:
-    radial-gradient(ellipse 90% 70% at 5%   0%,  rgba(0,163,255,0.075) 0%, transparent 55%),
-    radial-gradient(ellipse 60% 55% at 95%  95%, rgba(0,229,196,0.065) 0%, transparent 50%),
-    radial-gradient(ellipse 50% 45% at 50%  50%, rgba(123,97,255,0.04)  0%, transparent 65%);
-  pointer-events: none; z-index: 0;
-  animation: ambientShift 18s ease-in-out infinite alternate;
-}
-@keyframes ambientShift {
-  0%   { opacity: 1;    transform: scale(1); }
-  100% { opacity: 0.75; transform: scale(1.04); }
-}
-
-/* ═══ HIDE CHROME ═══════════════════════════════════════════ */
-#MainMenu, footer, header,
-[data-testid="stDecoration"],
-[data-testid="stToolbar"],
-[data-testid="stSidebar"] { display: none !important; }
-
-/* ═══ CENTRE & MAX-WIDTH ════════════════════════════════════ */
-[data-testid="stMainBlockContainer"] {
-  max-width: 1100px !important;
-  margin: 0 auto !important;
-  padding: 0 24px 80px !important;
-}
-
-/* ═══ TOP NAV ═══════════════════════════════════════════════ */
-.topnav {
-  display: flex; align-items: center; justify-content: space-between;
-  padding: 22px 0 0;
-  margin-bottom: 28px;
-  animation: fadeDown 0.5s var(--ease) both;
-}
-.nav-brand { display: flex; align-items: center; gap: 12px; }
-.nav-hex {
-  width: 38px; height: 38px;
-  background: linear-gradient(135deg, var(--blue), var(--cyan));
-  clip-path: polygon(50% 0%,100% 25%,100% 75%,50% 100%,0% 75%,0% 25%);
-  display: flex; align-items: center; justify-content: center;
-  font-size: 14px; color: #fff;
-  animation: hexPulse 4s ease-in-out infinite;
-}
-@keyframes hexPulse {
-  0%,100% { box-shadow: 0 0 20px rgba(0,163,255,0.35); }
-  50%      { box-shadow: 0 0 44px rgba(0,229,196,0.5); }
-}
-.nav-title {
-  font-size: 1.15rem; font-weight: 800; letter-spacing: -0.03em;
-  background: linear-gradient(135deg, var(--t1) 40%, var(--blue));
-  -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-}
-.nav-sub {
-  font-size: 0.58rem; font-family: var(--f-mono); color: var(--t3);
-  letter-spacing: 0.2em; text-transform: uppercase; margin-top: 2px;
-}
-.nav-pills { display: flex; gap: 10px; align-items: center; }
-.nav-pill {
-  display: inline-flex; align-items: center; gap: 7px;
-  background: rgba(0,163,255,0.08); border: 1px solid rgba(0,163,255,0.22);
-  border-radius: 999px; padding: 6px 14px;
-  font-family: var(--f-mono); font-size: 0.68rem; color: var(--blue); letter-spacing: 0.1em;
-}
-.nav-pill.cyan {
-  background: rgba(0,229,196,0.07); border-color: rgba(0,229,196,0.22); color: var(--cyan);
-}
-.pill-dot {
-  width: 6px; height: 6px; border-radius: 50%; background: currentColor;
-  animation: dotPulse 2s ease infinite;
-}
-@keyframes dotPulse { 0%,100%{opacity:1;transform:scale(1);} 50%{opacity:0.4;transform:scale(0.7);} }
-
-/* ═══ API STATUS BANNER ════════════════════════════════════ */
-.api-banner {
-  display: flex; align-items: center; gap: 10px;
-  padding: 10px 18px;
-  border-radius: var(--r-sm);
-  font-family: var(--f-mono); font-size: 0.66rem; letter-spacing: 0.1em;
-  margin-bottom: 20px; animation: fadeUp 0.4s var(--ease) both;
-}
-.api-banner.ok  { background: rgba(0,229,196,0.05); border: 1px solid rgba(0,229,196,0.2); color: var(--cyan); }
-.api-banner.err { background: rgba(255,77,106,0.05); border: 1px solid rgba(255,77,106,0.2); color: var(--red); }
-
-/* ═══ NATIVE STREAMLIT TABS ════════════════════════════════ */
-[data-testid="stTabs"] [data-testid="stTabBar"] {
-  background: transparent !important;
-  border-bottom: 1px solid var(--border) !important;
-  gap: 4px !important;
-  padding-bottom: 0 !important;
-}
-[data-testid="stTabs"] button[data-baseweb="tab"] {
-  font-family: var(--f-mono) !important;
-  font-size: 0.7rem !important;
-  font-weight: 500 !important;
-  letter-spacing: 0.1em !important;
-  text-transform: uppercase !important;
-  color: var(--t3) !important;
-  background: transparent !important;
-  border: none !important;
-  border-radius: var(--r-sm) var(--r-sm) 0 0 !important;
-  padding: 10px 22px !important;
-  transition: all var(--t) var(--ease) !important;
-}
-[data-testid="stTabs"] button[data-baseweb="tab"]:hover {
-  color: var(--t2) !important;
-  background: rgba(255,255,255,0.03) !important;
-}
-[data-testid="stTabs"] button[aria-selected="true"] {
-  color: var(--blue) !important;
-  background: rgba(0,163,255,0.1) !important;
-  border-bottom: 2px solid var(--blue) !important;
-}
-[data-testid="stTabPanel"] {
-  padding: 28px 0 0 !important;
-  background: transparent !important;
-}
-
-/* ═══ SECTION HEADER ════════════════════════════════════════ */
-.sec-tag {
-  font-family: var(--f-mono); font-size: 0.62rem; color: var(--blue);
-  letter-spacing: 0.2em; text-transform: uppercase; margin-bottom: 8px;
-}
-.sec-title {
-  font-size: 1.8rem; font-weight: 800; letter-spacing: -0.04em;
-  color: var(--t1); line-height: 1.1; margin-bottom: 6px;
-}
-.sec-desc { font-size: 0.87rem; color: var(--t2); line-height: 1.6; margin-bottom: 24px; }
-
-/* ═══ JOB CARDS ═════════════════════════════════════════════ */
-.job-card {
-  background: var(--bg-card);
-  border: 1px solid var(--border);
-  border-radius: var(--r-lg);
-  padding: 22px 24px;
-  transition: all var(--t) var(--ease);
-  animation: fadeUp 0.5s var(--ease) both;
-  position: relative; overflow: hidden;
-}
-.job-card::before {
-  content: ''; position: absolute; top: 0; left: 0; right: 0; height: 2px;
-  background: linear-gradient(90deg, var(--blue), var(--cyan), var(--violet));
-}
-.job-card:hover {
-  border-color: rgba(0,163,255,0.3);
-  transform: translateY(-2px);
-  box-shadow: 0 8px 48px rgba(0,0,0,0.6), 0 0 60px rgba(0,163,255,0.08);
-}
-.jc-top { display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 10px; }
-.jc-company { font-family: var(--f-mono); font-size: 0.63rem; color: var(--blue); letter-spacing: 0.12em; text-transform: uppercase; }
-.jc-title   { font-size: 1.02rem; font-weight: 700; color: var(--t1); margin-bottom: 5px; }
-.jc-meta    { font-family: var(--f-mono); font-size: 0.62rem; color: var(--t3); letter-spacing: 0.06em; margin-bottom: 14px; }
-.skill-pill {
-  display: inline-block; margin: 2px; padding: 3px 9px;
-  background: rgba(0,163,255,0.07); border: 1px solid rgba(0,163,255,0.2);
-  border-radius: 999px; font-family: var(--f-mono); font-size: 0.6rem; color: var(--blue);
-}
-.jc-stats  { display: flex; gap: 8px; flex-wrap: wrap; margin: 12px 0; }
-.jc-stat   { display: inline-flex; align-items: center; gap: 5px; background: rgba(255,255,255,0.04); border: 1px solid var(--border); border-radius: 999px; padding: 4px 10px; font-family: var(--f-mono); font-size: 0.61rem; color: var(--t3); }
-.jc-stat-val { font-weight: 700; color: var(--t1); }
-.link-box {
-  margin-top: 12px; background: rgba(0,163,255,0.04); border: 1px solid rgba(0,163,255,0.18);
-  border-radius: var(--r-sm); padding: 9px 12px;
-  font-family: var(--f-mono); font-size: 0.59rem; color: var(--blue);
-  letter-spacing: 0.04em; word-break: break-all; display: flex; gap: 8px;
-}
-
-/* ═══ STATUS PILLS ══════════════════════════════════════════ */
-.pill { display: inline-flex; align-items: center; gap: 6px; padding: 4px 11px; border-radius: 999px; font-family: var(--f-mono); font-size: 0.63rem; font-weight: 500; white-space: nowrap; }
-.pill-live   { background: rgba(0,229,196,0.08);  border: 1px solid rgba(0,229,196,0.28); color: var(--cyan); }
-.pill-draft  { background: rgba(78,86,110,0.15);  border: 1px solid rgba(78,86,110,0.35); color: var(--t3); }
-.pill-closed { background: rgba(255,77,106,0.07); border: 1px solid rgba(255,77,106,0.25); color: var(--red); }
-
-/* ═══ FORM LABELS ═══════════════════════════════════════════ */
-.field-label { font-family: var(--f-mono); font-size: 0.63rem; color: var(--t3); letter-spacing: 0.16em; text-transform: uppercase; margin-bottom: 6px; display: flex; align-items: center; gap: 7px; }
-.field-dot { width: 5px; height: 5px; border-radius: 50%; background: var(--blue); }
-
-/* ═══ CREATED LINK BANNER ═══════════════════════════════════ */
-.link-banner { background: rgba(0,229,196,0.05); border: 1px solid rgba(0,229,196,0.22); border-radius: var(--r-md); padding: 18px 22px; margin-top: 16px; }
-.link-banner-label { font-family: var(--f-mono); font-size: 0.62rem; color: var(--cyan); letter-spacing: 0.12em; text-transform: uppercase; margin-bottom: 8px; }
-.link-banner-url   { font-family: var(--f-mono); font-size: 0.82rem; color: var(--t1); word-break: break-all; }
-
-/* ═══ REPORTS TABLE ═════════════════════════════════════════ */
-.rt-wrap { background: var(--bg-card); border: 1px solid var(--border); border-radius: var(--r-lg); overflow: hidden; animation: fadeUp 0.5s var(--ease) both; }
-.rt-wrap table { width: 100%; border-collapse: collapse; }
-.rt-wrap thead th { font-family: var(--f-mono); font-size: 0.6rem; color: var(--t3); letter-spacing: 0.14em; text-transform: uppercase; padding: 12px 16px; border-bottom: 1px solid var(--border); text-align: left; }
-.rt-wrap tbody td { font-size: 0.84rem; color: var(--t2); padding: 13px 16px; border-bottom: 1px solid rgba(255,255,255,0.03); vertical-align: middle; }
-.rt-wrap tbody tr:last-child td { border-bottom: none; }
-.rt-wrap tbody tr:hover td { background: rgba(0,163,255,0.03); color: var(--t1); }
-.score-badge { display: inline-block; padding: 3px 10px; border-radius: 999px; font-family: var(--f-mono); font-size: 0.63rem; font-weight: 700; }
-.badge-green { background: rgba(0,229,196,0.1);   color: var(--cyan);  border: 1px solid rgba(0,229,196,0.25); }
-.badge-blue  { background: rgba(0,163,255,0.1);   color: var(--blue);  border: 1px solid rgba(0,163,255,0.25); }
-.badge-gold  { background: rgba(245,200,66,0.1);  color: var(--gold);  border: 1px solid rgba(245,200,66,0.25); }
-.badge-red   { background: rgba(255,77,106,0.08); color: var(--red);   border: 1px solid rgba(255,77,106,0.22); }
-
-/* ═══ STAT CHIPS ════════════════════════════════════════════ */
-.stat-row { display: flex; gap: 14px; flex-wrap: wrap; margin: 20px 0 4px; }
-.stat-chip { flex: 1; min-width: 130px; padding: 18px 20px; background: var(--bg-card); border: 1px solid var(--border); border-radius: var(--r-md); animation: fadeUp 0.5s var(--ease) both; }
-.stat-chip.hi { background: linear-gradient(135deg,rgba(0,229,196,0.07),rgba(0,163,255,0.04)); border-color: rgba(0,229,196,0.2); }
-.stat-val { font-size: 1.6rem; font-weight: 800; letter-spacing: -0.04em; line-height: 1; }
-.stat-lbl { font-family: var(--f-mono); font-size: 0.6rem; color: var(--t3); letter-spacing: 0.14em; text-transform: uppercase; margin-top: 6px; }
-
-/* ═══ FOLDER HEADER ═════════════════════════════════════════ */
-.folder-header { display: flex; align-items: center; gap: 14px; padding: 14px 20px; margin-bottom: 20px; background: var(--bg-card); border: 1px solid var(--border); border-radius: var(--r-md); animation: fadeUp 0.45s var(--ease) both; }
-.folder-title { font-size: 0.92rem; font-weight: 700; color: var(--t1); }
-.folder-meta  { font-family: var(--f-mono); font-size: 0.62rem; color: var(--t3); letter-spacing: 0.07em; }
-
-/* ═══ REPORT FULL TEXT ══════════════════════════════════════ */
-.report-full {
-  background: var(--bg-card); border: 1px solid var(--border);
-  border-radius: var(--r-md); padding: 22px 26px;
-  font-size: 0.86rem; color: var(--t2); line-height: 1.85;
-  max-height: 420px; overflow-y: auto;
-}
-.report-full h2 {
-  font-size: 0.78rem; font-family: var(--f-mono); color: var(--blue);
-  letter-spacing: 0.18em; text-transform: uppercase; margin: 18px 0 8px;
-  border-bottom: 1px solid var(--border); padding-bottom: 6px;
-}
-
-/* ═══ INPUTS ════════════════════════════════════════════════ */
-[data-testid="stTextArea"] textarea,
-[data-testid="stTextInput"] input {
-  background: rgba(255,255,255,0.028) !important;
-  border: 1px solid var(--border) !important;
-  border-radius: var(--r-sm) !important;
-  color: var(--t1) !important;
-  font-family: var(--f-main) !important;
-  font-size: 0.88rem !important;
-  padding: 11px 15px !important;
-  transition: all var(--t) var(--ease) !important;
-}
-[data-testid="stTextArea"] textarea:focus,
-[data-testid="stTextInput"] input:focus {
-  border-color: rgba(0,163,255,0.5) !important;
-  box-shadow: 0 0 0 4px rgba(0,163,255,0.09) !important;
-}
-[data-testid="stTextArea"] textarea::placeholder,
-[data-testid="stTextInput"] input::placeholder { color: var(--t3) !important; }
-
-[data-testid="stSelectbox"] > div > div {
-  background: rgba(255,255,255,0.028) !important;
-  border: 1px solid var(--border) !important;
-  border-radius: var(--r-sm) !important;
-  color: var(--t1) !important;
-  font-family: var(--f-main) !important;
-}
-
-/* ═══ BUTTONS ═══════════════════════════════════════════════ */
-[data-testid="stButton"] > button {
-  font-family: var(--f-main) !important;
-  font-weight: 700 !important; font-size: 0.82rem !important;
-  letter-spacing: 0.06em !important; text-transform: uppercase !important;
-  border-radius: var(--r-sm) !important;
-  transition: all 0.24s var(--spring) !important;
-}
-[data-testid="stButton"] > button[kind="primary"] {
-  background: linear-gradient(135deg, #0070D8, var(--blue), #00C8FF) !important;
-  background-size: 200% 200% !important;
-  border: none !important; color: #fff !important;
-  box-shadow: 0 4px 24px rgba(0,163,255,0.4) !important;
-  padding: 12px 24px !important;
-  animation: btnShimmer 4s ease infinite !important;
-}
-@keyframes btnShimmer { 0%{background-position:0% 50%;} 50%{background-position:100% 50%;} 100%{background-position:0% 50%;} }
-[data-testid="stButton"] > button[kind="primary"]:hover {
-  box-shadow: 0 6px 36px rgba(0,163,255,0.6) !important;
-  transform: translateY(-2px) scale(1.01) !important;
-}
-[data-testid="stButton"] > button:not([kind="primary"]) {
-  background: rgba(255,255,255,0.04) !important;
-  border: 1px solid var(--border) !important; color: var(--t2) !important;
-}
-[data-testid="stButton"] > button:not([kind="primary"]):hover {
-  background: rgba(255,255,255,0.08) !important;
-  border-color: rgba(255,255,255,0.16) !important; color: var(--t1) !important;
-  transform: translateY(-1px) !important;
-}
-
-/* ═══ DOWNLOAD BUTTON ═══════════════════════════════════════ */
-[data-testid="stDownloadButton"] > button {
-  background: linear-gradient(135deg, rgba(245,200,66,0.12), rgba(245,200,66,0.06)) !important;
-  border: 1px solid rgba(245,200,66,0.32) !important; color: var(--gold) !important;
-  font-family: var(--f-main) !important; font-weight: 700 !important;
-  font-size: 0.78rem !important; letter-spacing: 0.06em !important;
-  text-transform: uppercase !important; border-radius: var(--r-sm) !important;
-  padding: 11px 18px !important; transition: all 0.22s var(--ease) !important;
-}
-[data-testid="stDownloadButton"] > button:hover {
-  background: linear-gradient(135deg, rgba(245,200,66,0.22), rgba(245,200,66,0.12)) !important;
-  box-shadow: 0 4px 24px rgba(245,200,66,0.2) !important;
-  transform: translateY(-1px) !important;
-}
-
-/* ═══ EXPANDER ══════════════════════════════════════════════ */
-[data-testid="stExpander"] { background: var(--bg-card) !important; border: 1px solid var(--border) !important; border-radius: var(--r-md) !important; }
-[data-testid="stExpander"] summary { font-family: var(--f-main) !important; font-size: 0.8rem !important; font-weight: 500 !important; color: var(--t2) !important; }
-[data-testid="stExpander"] summary:hover { color: var(--t1) !important; }
-
-[data-testid="stWidgetLabel"] p, label { font-family: var(--f-main) !important; font-size: 0.76rem !important; font-weight: 500 !important; color: var(--t2) !important; letter-spacing: 0.04em !important; text-transform: uppercase !important; }
-
-[data-testid="stAlert"] { background: var(--bg-card) !important; border: 1px solid var(--border) !important; border-radius: var(--r-md) !important; font-family: var(--f-main) !important; }
-div[data-testid="stAlert"][kind="success"] { border-left: 3px solid var(--cyan) !important; }
-div[data-testid="stAlert"][kind="warning"] { border-left: 3px solid var(--gold) !important; }
-div[data-testid="stAlert"][kind="info"]    { border-left: 3px solid var(--blue) !important; }
-
-.divider-label { display: flex; align-items: center; gap: 14px; margin: 24px 0 18px; font-family: var(--f-mono); font-size: 0.62rem; color: var(--t3); letter-spacing: 0.16em; text-transform: uppercase; }
-.divider-label::before { content:''; flex:1; height:1px; background:linear-gradient(90deg,transparent,var(--border)); }
-.divider-label::after  { content:''; flex:1; height:1px; background:linear-gradient(270deg,transparent,var(--border)); }
-
-::-webkit-scrollbar { width: 5px; }
-::-webkit-scrollbar-track { background: var(--bg-base); }
-::-webkit-scrollbar-thumb { background: rgba(255,255,255,0.08); border-radius: 99px; }
-::-webkit-scrollbar-thumb:hover { background: rgba(255,255,255,0.16); }
-
-@keyframes fadeUp   { from{opacity:0;transform:translateY(18px);} to{opacity:1;transform:translateY(0);} }
-@keyframes fadeDown { from{opacity:0;transform:translateY(-14px);} to{opacity:1;transform:translateY(0);} }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(theme.head_html("hr", api_client.asset_base_url()), unsafe_allow_html=True)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -460,6 +104,18 @@ def score_badge(score: int) -> str:
     return f'<span class="score-badge {cls}">{score}%</span>'
 
 
+def skill_rows(breakdown: list[dict]) -> str:
+    """One row per job skill: credit badge, required/nice tag and the resume sentence behind it."""
+    return "".join(f"""
+    <div style="display:flex;gap:10px;align-items:baseline;padding:6px 0;border-bottom:1px solid var(--border);">
+      <span style="min-width:58px;">{score_badge(int(round(item.get("credit", 0) * 100)))}</span>
+      <span style="min-width:150px;font-weight:600;color:var(--t1);">{html.escape(item.get("skill", ""))}
+        <span style="font-family:var(--f-mono);font-size:.58rem;color:var(--t3);">
+          {"REQ" if item.get("kind") == "required" else "NICE"}</span></span>
+      <span style="font-size:.8rem;color:var(--t2);">{html.escape(item.get("evidence") or "— no evidence found")}</span>
+    </div>""" for item in breakdown)
+
+
 def rec_badge(rec: str) -> str:
     cls = {
         "Proceed": "badge-green",
@@ -823,6 +479,8 @@ with tab_reports:
         for r in reports:
             with st.expander(
                 f"  {r['candidate_name']}  ·  {r['recommendation']}  ·  ATS {r['ats_score']}%"
+                + ("  ·  ↻ re-applied" if r.get("supersedes") else "")
+                + ("  ·  ⚠ near-duplicate resume" if r.get("similar_to") else "")
             ):
                 info_col, dl_col = st.columns([2, 1], gap="medium")
 
@@ -848,6 +506,11 @@ with tab_reports:
                             unsafe_allow_html=True,
                         )
 
+                    # Deterministic skill match (transformer_service.skill_match)
+                    if r.get("skill_breakdown"):
+                        with st.expander("◈ Skill Breakdown"):
+                            st.markdown(skill_rows(r["skill_breakdown"]), unsafe_allow_html=True)
+
                     # Interview transcript
                     if r.get("transcript"):
                         with st.expander("◎ Interview Transcript"):
@@ -886,8 +549,14 @@ with tab_reports:
                         f"Submitted      : {r['submitted_at']}\n"
                         f"{'='*52}\n\n"
                         f"{r.get('final_report','')}\n\n"
-                        f"{'─'*52}\nInterview Transcript\n{'─'*52}\n"
                     )
+                    if r.get("skill_breakdown"):
+                        report_txt += f"{'─'*52}\nSkill Breakdown\n{'─'*52}\n" + "".join(
+                            f"{round(item.get('credit', 0) * 100):>3}%  {item.get('skill', '')} "
+                            f"({item.get('kind', '')}) — {item.get('evidence') or 'no evidence found'}\n"
+                            for item in r["skill_breakdown"]
+                        ) + "\n"
+                    report_txt += f"{'─'*52}\nInterview Transcript\n{'─'*52}\n"
                     if r.get("transcript"):
                         report_txt += "\n".join(
                             f"Q{i+1}: {qa.get('question','')}\n"
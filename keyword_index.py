@@ -0,0 +1,152 @@
+"""
+TalentOS · Keyword Index
+BM25 scoring of candidate text against a job's terms, for the exact
+keyword hits ("Kubernetes", "JAX") that embedding similarity blurs.
+
+The job side is built once per job (build_job_index) into a small table
+of weighted terms: unigrams from every field plus the bigrams of
+multi-word skills, weighted by field boost × IDF over all jobs. Scoring a
+candidate is one tokenisation pass and one dict lookup per job term, so it
+is linear in the resume length and needs no model.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Sequence
+
+K1             = 1.2
+B              = 0.75
+AVG_DOC_TOKENS = 400      # typical resume/profile length when no batch is available
+MAX_TERMS      = 64       # strongest job terms kept; the rest is filler
+
+FIELD_BOOSTS = {
+    "required_skills":  3.0,
+    "title":            2.0,
+    "nice_to_have":     1.5,
+    "description":      1.0,
+    "responsibilities": 1.0,
+}
+
+# Words may contain + # . - inside (c++, c#, node.js, scikit-learn) but never end in . or -.
+_WORD_RE   = re.compile(r"[a-z0-9](?:[a-z0-9+#.\-]*[a-z0-9+#])?")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have i in is it its of on or our that the "
+    "this to was we were will with you your my me he she they them his her their "
+    "about across all also any can who what when where which into over own per than "
+    "ability able experience experienced years year strong work working team teams "
+    "including using use well plus etc role join help build building new".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased words; keeps c++, c#, node.js, ci/cd halves, drops trailing punctuation."""
+    return _WORD_RE.findall((text or "").lower())
+
+
+def _field_terms(field_name: str, value) -> list[str]:
+    if isinstance(value, (list, tuple)):
+        terms = []
+        for skill in value:
+            toks = tokenize(str(skill))
+            # Multi-word skills match as phrases ("machine learning"), single words as themselves.
+            terms += toks if len(toks) == 1 else [f"{a} {b}" for a, b in zip(toks, toks[1:])]
+        return terms
+    return [t for t in tokenize(str(value or "")) if len(t) > 1 and t not in _STOPWORDS]
+
+
+def _job_term_counts(job: dict) -> dict[str, tuple[float, int]]:
+    """term → (highest field boost, occurrences) over every indexed field."""
+    out: dict[str, tuple[float, int]] = {}
+    for field_name, boost in FIELD_BOOSTS.items():
+        for term in _field_terms(field_name, job.get(field_name)):
+            best, n = out.get(term, (0.0, 0))
+            out[term] = (max(best, boost), n + 1)
+    return out
+
+
+@dataclass
+class JobIndex:
+    job_id: str
+    terms:  dict[str, float]                  # term → query weight
+    avgdl:  float = AVG_DOC_TOKENS
+    k1:     float = K1
+    b:      float = B
+    _weight_sum:    float     = field(init=False, repr=False)
+    _bigram_firsts: frozenset = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._weight_sum    = sum(self.terms.values()) or 1.0
+        self._bigram_firsts = frozenset(t.split(" ", 1)[0] for t in self.terms if " " in t)
+
+    # ── persistence ──────────────────────────────────────────
+    def to_json(self) -> str:
+        return json.dumps({
+            "job_id": self.job_id, "terms": self.terms, "avgdl": self.avgdl, "k1": self.k1, "b": self.b,
+        }, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "JobIndex":
+        data = json.loads(raw)
+        return cls(data["job_id"], data["terms"], data.get("avgdl", AVG_DOC_TOKENS),
+                   data.get("k1", K1), data.get("b", B))
+
+    # ── scoring ──────────────────────────────────────────────
+    def _counts(self, text: str) -> tuple[Counter, int]:
+        tokens = tokenize(text)
+        counts = Counter(tokens)
+        if self._bigram_firsts:
+            # Only pairs that can start a phrase term — keeps the pass cheap.
+            firsts = self._bigram_firsts
+            counts.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]) if a in firsts)
+        return counts, len(tokens)
+
+    def _score_counts(self, counts: Counter, dl: int, avgdl: float) -> float:
+        norm  = self.k1 * (1 - self.b + self.b * dl / max(avgdl, 1.0))
+        total = 0.0
+        for term, weight in self.terms.items():
+            tf = counts.get(term)
+            if tf:
+                # BM25 saturation, capped at 1: one mention in an average-length
+                # document is full credit; longer documents need more mentions.
+                total += weight * min(1.0, tf * (self.k1 + 1) / (tf + norm))
+        return 100.0 * total / self._weight_sum
+
+    def score(self, text: str, avgdl: Optional[float] = None) -> float:
+        """0–100: weighted share of the job's terms the text covers."""
+        counts, dl = self._counts(text)
+        return self._score_counts(counts, dl, avgdl or self.avgdl)
+
+    def score_many(self, texts: Sequence[str]) -> list[float]:
+        """Score a batch; document lengths are normalised against the batch's own average."""
+        docs  = [self._counts(t) for t in texts]
+        avgdl = (sum(dl for _, dl in docs) / len(docs)) if docs else self.avgdl
+        return [self._score_counts(counts, dl, avgdl or self.avgdl) for counts, dl in docs]
+
+    def matched_terms(self, text: str) -> list[str]:
+        """Job terms present in the text, strongest first."""
+        counts, _ = self._counts(text)
+        return [t for t in sorted(self.terms, key=self.terms.get, reverse=True) if counts.get(t)]
+
+
+def build_job_index(job: dict, corpus: Iterable[dict] = ()) -> JobIndex:
+    """
+    Index one job. corpus is every job (this one included or not); terms
+    that appear in many jobs' postings get a lower IDF weight.
+    """
+    own  = _job_term_counts(job)
+    docs = [set(_job_term_counts(other)) for other in corpus if other.get("id") != job.get("id")]
+    docs.append(set(own))
+    n    = len(docs)
+    df   = Counter(t for terms in docs for t in terms)
+
+    weights = {}
+    for term, (boost, occurrences) in own.items():
+        idf = math.log(1 + (n - df[term] + 0.5) / (df[term] + 0.5))
+        weights[term] = round(boost * (1 + math.log(occurrences)) * idf, 4)
+    top = sorted(weights, key=weights.get, reverse=True)[:MAX_TERMS]
+    return JobIndex(job.get("id", ""), {t: weights[t] for t in top})
@@ -0,0 +1,70 @@
+"""
+TalentOS · Lazy Imports
+Keeps heavy integrations (openai, sentence-transformers/torch, firecrawl,
+gTTS, plotly) off the import path of the Streamlit apps and services.
+
+  has_module(*names)   — are these importable? find_spec only, nothing is
+                         executed, so HAS_* flags cost microseconds
+  warm_up(*tasks)      — once per process, run imports/loaders in a daemon
+                         thread so the first real use finds them ready
+
+Modules guarded this way import their dependency inside the function that
+needs it; Python's module cache makes every call after the first free.
+Set TALENTOS_WARMUP=0 to skip background warm-up (e.g. in benchmarks).
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import os
+import threading
+from typing import Callable, Union
+
+from tracing import span
+
+WARMUP_ENABLED = os.getenv("TALENTOS_WARMUP", "1") != "0"
+
+_warm_lock    = threading.Lock()
+_warm_started: set[str] = set()
+
+
+def has_module(*names: str) -> bool:
+    """True when every named module can be imported (without importing it)."""
+    for name in names:
+        try:
+            if importlib.util.find_spec(name) is None:
+                return False
+        except (ImportError, ValueError):     # missing parent package / broken __spec__
+            return False
+    return True
+
+
+def _run(task: Union[str, Callable[[], object]]) -> None:
+    label = task if isinstance(task, str) else getattr(task, "__name__", "task")
+    with span("app.warmup", task=label) as sp:
+        try:
+            importlib.import_module(task) if isinstance(task, str) else task()
+        except Exception as exc:
+            sp.error(str(exc))     # first real use surfaces the error properly
+
+
+def warm_up(*tasks: Union[str, Callable[[], object]], name: str = "default") -> bool:
+    """
+    Start a daemon thread that imports each module name / calls each loader
+    in order. Runs once per process per name; returns False if it was
+    already started or warm-up is disabled.
+    """
+    if not WARMUP_ENABLED:
+        return False
+    with _warm_lock:
+        if name in _warm_started:
+            return False
+        _warm_started.add(name)
+
+    def worker() -> None:
+        for task in tasks:
+            _run(task)
+
+    threading.Thread(target=worker, name=f"warmup-{name}", daemon=True).start()
+    return True
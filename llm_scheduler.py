@@ -0,0 +1,236 @@
+"""
+TalentOS · LLM Scheduler
+Process-wide admission control for OpenRouter calls.
+
+Every completion request goes through LLMScheduler.call(), which
+  - bounds in-flight requests with a concurrency limit,
+  - meters requests/minute and tokens/minute with token buckets,
+  - admits waiters strictly by priority (interactive before deferrable),
+  - retries 429 / 5xx / connection errors with full-jitter backoff and,
+    on 429, pauses all admissions for the backoff window.
+
+Env vars:
+  TALENTOS_LLM_CONCURRENCY  — max in-flight requests      (default: 4)
+  TALENTOS_LLM_RPM          — requests per minute, 0 = off (default: 20)
+  TALENTOS_LLM_TPM          — tokens per minute, 0 = off   (default: 0)
+  TALENTOS_LLM_MAX_RETRIES  — retries per request          (default: 4)
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import os
+import random
+import threading
+import time
+from enum import IntEnum
+from typing import Any, Callable, Optional
+
+from tracing import current_span
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0   # candidate is blocked on the result (profile, questions)
+    BACKGROUND  = 1   # runs while the candidate keeps going (per-answer evals)
+    DEFERRABLE  = 2   # end-of-flow work that can absorb queueing (report)
+
+
+# ─────────────────────────────────────────────────────────────
+# TOKEN BUCKET
+# ─────────────────────────────────────────────────────────────
+
+class TokenBucket:
+    """Classic token bucket. Not thread-safe — the scheduler holds the lock."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate     = per_minute / 60.0
+        self.tokens   = float(per_minute)
+        self.updated  = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens  = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` is available (0 if available now)."""
+        self._refill()
+        # A single request larger than the bucket only has to wait for a full bucket.
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self.tokens -= amount   # may go negative: debt is repaid by refill
+
+
+# ─────────────────────────────────────────────────────────────
+# SCHEDULER
+# ─────────────────────────────────────────────────────────────
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    code = getattr(exc, "status_code", None)
+    if code is None:
+        response = getattr(exc, "response", None)
+        code = getattr(response, "status_code", None)
+    return code if isinstance(code, int) else None
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    code = _status_code(exc)
+    if code is not None:
+        return code == 429 or code >= 500
+    name = type(exc).__name__
+    return "Timeout" in name or "Connection" in name
+
+
+class LLMScheduler:
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        requests_per_minute: float = 20,
+        tokens_per_minute: float = 0,
+        max_retries: int = 4,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.req_bucket      = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.tok_bucket      = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self.max_retries     = max_retries
+        self.base_delay      = base_delay
+        self.max_delay       = max_delay
+
+        self._cond           = threading.Condition()
+        self._waiters: list  = []   # heap of (priority, seq)
+        self._seq            = itertools.count()
+        self._in_flight      = 0
+        self._cooldown_until = 0.0
+
+    # ── admission ────────────────────────────────────────────
+    def _wait_needed(self, est_tokens: int) -> float:
+        """Seconds before the head waiter could be admitted; 0 = admit now."""
+        if self._in_flight >= self.max_concurrency:
+            return float("inf")
+        wait = max(0.0, self._cooldown_until - time.monotonic())
+        if self.req_bucket:
+            wait = max(wait, self.req_bucket.wait_time(1))
+        if self.tok_bucket:
+            wait = max(wait, self.tok_bucket.wait_time(est_tokens))
+        return wait
+
+    def _acquire(self, priority: Priority, est_tokens: int) -> None:
+        with self._cond:
+            ticket = (int(priority), next(self._seq))
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    if self._waiters[0] == ticket:
+                        wait = self._wait_needed(est_tokens)
+                        if wait == 0.0:
+                            break
+                        self._cond.wait(None if wait == float("inf") else wait)
+                    else:
+                        self._cond.wait()
+                heapq.heappop(self._waiters)
+                self._in_flight += 1
+                if self.req_bucket:
+                    self.req_bucket.take(1)
+                if self.tok_bucket:
+                    self.tok_bucket.take(est_tokens)
+            except BaseException:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                raise
+            finally:
+                self._cond.notify_all()
+
+    def _release(self, est_tokens: int, used_tokens: Optional[int]) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            if self.tok_bucket and used_tokens is not None:
+                self.tok_bucket.take(used_tokens - est_tokens)
+            self._cond.notify_all()
+
+    def _backoff(self, attempt: int, exc: BaseException) -> float:
+        delay = _retry_after(exc)
+        if delay is None:
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        if _status_code(exc) == 429:
+            # The provider is saturated: hold everyone back, not just this caller.
+            with self._cond:
+                self._cooldown_until = max(self._cooldown_until, time.monotonic() + delay)
+                self._cond.notify_all()
+        return delay
+
+    # ── public API ───────────────────────────────────────────
+    def call(
+        self,
+        fn: Callable[[], Any],
+        priority: Priority = Priority.INTERACTIVE,
+        est_tokens: int = 1000,
+    ) -> Any:
+        """
+        Run fn() under admission control, retrying transient failures.
+        If the result carries .usage.total_tokens the token bucket is
+        corrected to the actual spend.
+        """
+        sp        = current_span()
+        queued_ms = 0.0
+        attempt   = 0
+        while True:
+            t0 = time.perf_counter()
+            self._acquire(priority, est_tokens)
+            queued_ms += (time.perf_counter() - t0) * 1000
+            used = None
+            try:
+                result = fn()
+                used   = getattr(getattr(result, "usage", None), "total_tokens", None)
+                if sp is not None:
+                    sp.set(queue_ms=round(queued_ms, 1), retries=attempt, priority=priority.name)
+                return result
+            except Exception as exc:
+                if attempt >= self.max_retries or not _is_retryable(exc):
+                    if sp is not None:
+                        sp.set(queue_ms=round(queued_ms, 1), retries=attempt, priority=priority.name)
+                    raise
+                delay = self._backoff(attempt, exc)
+            finally:
+                self._release(est_tokens, used)
+            attempt += 1
+            time.sleep(delay)
+
+
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> LLMScheduler:
+    """Process-wide scheduler shared by every session and worker thread."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = LLMScheduler(
+                max_concurrency     = int(os.getenv("TALENTOS_LLM_CONCURRENCY", "4")),
+                requests_per_minute = float(os.getenv("TALENTOS_LLM_RPM", "20")),
+                tokens_per_minute   = float(os.getenv("TALENTOS_LLM_TPM", "0")),
+                max_retries         = int(os.getenv("TALENTOS_LLM_MAX_RETRIES", "4")),
+            )
+        return _scheduler
+
+
+def estimate_tokens(*texts: str, completion: int = 1000) -> int:
+    """Rough prompt size (≈4 chars/token) plus an allowance for the completion."""
+    return sum(len(t) for t in texts) // 4 + completion
@@ -2,24 +2,58 @@
 TalentOS · FastAPI Backend
 Decoupled data layer between HR portal and Candidate assessment.
 
-Storage: Local JSON files under ./data/
-  jobs.json    — job listings keyed by job_id
-  reports.json — candidate reports keyed by job_id → list[Report]
+Storage: Local JSON files under ./data/ (override with TALENTOS_DATA_DIR)
+  jobs.json        — job listings keyed by job_id
+  reports.json     — candidate reports keyed by job_id → list[Report]
+  assessments.json — resume pipeline jobs keyed by assessment_id
+  job_vectors/     — <job_id>.f32 JD embedding (+ .json metadata)
+  job_terms/       — <job_id>.json keyword (BM25) index of the job text
+  resume_signatures.jsonl — MinHash of every assessed resume (resume_dedup.py)
+  candidate_vectors/ — profile embeddings of submitted reports (vector_store.py)
 """
 
 from __future__ import annotations
 
+import base64
+import binascii
 import json
+import threading
+import time
 import uuid
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
+import theme
+import tracing
+from keyword_index import JobIndex, build_job_index
+
+# ── Optional imports (graceful fallback) ─────────────────────────────────────
+try:
+    from assessment_service import run_assessment
+    HAS_PIPELINE = True
+except ImportError:
+    HAS_PIPELINE = False
+
+try:
+    from vector_store import open_store
+    HAS_VECTOR_STORE = True
+except ImportError:
+    HAS_VECTOR_STORE = False
+
+try:
+    from resume_dedup import ResumeIndex, resume_text, same_candidate, signature
+    HAS_DEDUP = True
+except ImportError:
+    HAS_DEDUP = False
+
 # ─────────────────────────────────────────────────────────────
 # APP BOOTSTRAP
 # ─────────────────────────────────────────────────────────────
@@ -43,9 +77,17 @@ app.add_middleware(
 # ─────────────────────────────────────────────────────────────
 # LOCAL FILE STORE
 # ─────────────────────────────────────────────────────────────
-_BASE_DIR     = Path(__file__).parent / "data"
+_BASE_DIR     = Path(os.getenv("TALENTOS_DATA_DIR") or Path(__file__).parent / "data")
 _JOBS_FILE    = _BASE_DIR / "jobs.json"
 _REPORTS_FILE = _BASE_DIR / "reports.json"
+_ASSESSMENTS_FILE = _BASE_DIR / "assessments.json"      # pre-split store, migrated on startup
+_ASSESSMENTS_DIR  = _BASE_DIR / "assessments"           # one <id>.json per assessment
+_ASSESSMENT_TTL_S = float(os.getenv("TALENTOS_ASSESSMENT_TTL_DAYS", "7")) * 86400
+
+# In-flight assessments live in memory (progress ticks never touch disk);
+# the lock only guards this dict.
+_ASSESSMENTS_LOCK = threading.Lock()
+_LIVE_ASSESSMENTS: dict[str, dict] = {}
 
 
 def _ensure_data_dir() -> None:
@@ -97,6 +139,10 @@ class ReportCreate(BaseModel):
     skill_match_score: int = Field(ge=0, le=100)
     final_report:      str = ""
     transcript:        List[dict] = Field(default_factory=list)
+    profile_text:      str = ""     # indexed for POST /search/candidates
+    skill_breakdown:   List[dict] = Field(default_factory=list)   # transformer_service.skill_match
+    assessment_id:     str = ""     # links re-applications to the report they replace
+    candidate_email:   str = ""
 
 
 class ReportOut(ReportCreate):
@@ -104,12 +150,90 @@ class ReportOut(ReportCreate):
     job_id:         str
     recommendation: str
     submitted_at:   str
+    supersedes:     str = ""        # earlier report of the same candidate (near-duplicate resume)
+    superseded_by:  str = ""
+    similar_to:     str = ""        # another candidate's report with a near-duplicate resume (flag only)
 
 
 class JobStatusUpdate(BaseModel):
     status: str
 
 
+class CandidateSearch(BaseModel):
+    query:  str = ""               # free text, or …
+    job_id: str = ""               # … rank against this job's description
+    k:      int = Field(default=10, ge=1, le=100)
+
+
+class CandidateHit(BaseModel):
+    report_id:      str
+    job_id:         str
+    candidate_name: str
+    recommendation: str = ""
+    submitted_at:   str = ""
+    score:          float           # cosine similarity × 100
+
+
+class JobEmbeddingOut(BaseModel):
+    job_id:     str
+    model:      str
+    dim:        int
+    dtype:      str = "float32"
+    vector_b64: str            # little-endian float32, unit length
+
+
+class RankRequest(BaseModel):
+    texts: List[str] = Field(min_length=1, max_length=5000)
+    ids:   List[str] = Field(default_factory=list)     # defaults to "0", "1", …
+    top_k: Optional[int] = Field(default=None, ge=1)
+
+
+class RankedCandidate(BaseModel):
+    id:       str
+    index:    int
+    score:    float                 # hybrid ATS score, 0–100
+    semantic: Optional[float] = None
+    lexical:  float
+
+
+class EmbedRequest(BaseModel):
+    texts: List[str] = Field(min_length=1, max_length=1024)
+
+
+class EmbedOut(BaseModel):
+    model:       str
+    count:       int
+    dim:         int
+    dtype:       str = "float32"
+    vectors_b64: str           # little-endian float32, row-major (count × dim)
+
+
+class AssessmentCreate(BaseModel):
+    job_id:         str
+    candidate_name:  str = "Candidate"
+    candidate_email: str = ""
+    resume_b64:      str
+    content_type:    str = ""
+    links:           List[str] = Field(default_factory=list)
+    # Opt-in: reuse the result of the same candidate's earlier near-duplicate
+    # application (same email on both; a name match alone never counts).
+    reuse_duplicate: bool = False
+
+
+class AssessmentOut(BaseModel):
+    id:             str
+    job_id:         str
+    candidate_name: str
+    candidate_email: str = ""
+    status:         str            # queued | running | done | error
+    stage:          str = ""
+    stages:         List[dict] = Field(default_factory=list)
+    result:         Optional[dict] = None
+    error:          str = ""
+    created_at:     str
+    updated_at:     str
+
+
 # ─────────────────────────────────────────────────────────────
 # RECOMMENDATION HELPER
 # ─────────────────────────────────────────────────────────────
@@ -244,6 +368,12 @@ def _seed_if_empty() -> None:
 @app.on_event("startup")
 async def on_startup() -> None:
     _seed_if_empty()
+    _migrate_assessments_file()
+    _fail_interrupted_assessments()
+    threading.Thread(target=_expire_assessments_periodically, name="assessment-expiry", daemon=True).start()
+    _PIPELINE_WORKERS.submit(tracing.in_context(_backfill_job_terms))
+    _PIPELINE_WORKERS.submit(tracing.in_context(_backfill_job_embeddings))
+    _PIPELINE_WORKERS.submit(tracing.in_context(_backfill_candidate_vectors))
 
 
 # ─────────────────────────────────────────────────────────────
@@ -255,6 +385,21 @@ def health() -> dict:
     return {"status": "ok", "service": "TalentOS API", "version": "1.0.0"}
 
 
+@app.get("/theme/{filename}", tags=["meta"])
+def theme_stylesheet(filename: str) -> Response:
+    """Content-hashed design-system CSS for the Streamlit apps; the URL changes when the CSS does."""
+    css = theme.read_asset(filename)
+    if css is None:
+        raise HTTPException(status_code=404, detail="Unknown or stale stylesheet")
+    return Response(css, media_type="text/css", headers={"Cache-Control": "public, max-age=31536000, immutable"})
+
+
+@app.get("/traces/summary", response_model=dict, tags=["meta"])
+def trace_summary():
+    """p50/p95 latency per span name from the local trace file."""
+    return tracing.summarize()
+
+
 # ─────────────────────────────────────────────────────────────
 # JOBS — CRUD
 # ─────────────────────────────────────────────────────────────
@@ -287,6 +432,9 @@ def create_job(payload: JobCreate):
     }
     jobs[job_id] = job_record
     _save(_JOBS_FILE, jobs)
+    _index_job_terms(job_record, jobs.values())
+    # Encode the JD once, off the request path; candidates reuse the stored vector.
+    _PIPELINE_WORKERS.submit(tracing.in_context(_embed_job), job_record)
     return job_record
 
 
@@ -309,6 +457,8 @@ def delete_job(job_id: str):
         raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found.")
     del jobs[job_id]
     _save(_JOBS_FILE, jobs)
+    for path in (*_job_vector_paths(job_id), _job_terms_path(job_id)):
+        path.unlink(missing_ok=True)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -329,6 +479,10 @@ def submit_report(job_id: str, payload: ReportCreate):
     reports   = _load(_REPORTS_FILE)
     report_id = str(uuid.uuid4())
     now       = datetime.now().strftime("%Y-%m-%d %H:%M")
+    earlier, same = _earlier_report(reports.get(job_id, []), payload.assessment_id)
+    if same and not same_candidate(payload.model_dump(), earlier):
+        same = False      # the report under that assessment names someone else
+    replaced  = earlier if same else None
 
     rec = ReportOut(
         **payload.model_dump(),
@@ -338,28 +492,605 @@ def submit_report(job_id: str, payload: ReportCreate):
             payload.ats_score, payload.interview_score, payload.skill_match_score
         ),
         submitted_at=now,
+        supersedes=replaced["id"] if replaced else "",
+        similar_to=earlier["id"] if earlier and not same else "",
     )
 
     if job_id not in reports:
         reports[job_id] = []
+    if replaced:
+        replaced["superseded_by"] = report_id
     reports[job_id].append(rec.model_dump())
     _save(_REPORTS_FILE, reports)
 
-    jobs[job_id]["candidates"] = jobs[job_id].get("candidates", 0) + 1
-    _save(_JOBS_FILE, jobs)
+    if not replaced:      # a re-application is not a new candidate
+        jobs[job_id]["candidates"] = jobs[job_id].get("candidates", 0) + 1
+        _save(_JOBS_FILE, jobs)
 
+    _PIPELINE_WORKERS.submit(tracing.in_context(_index_report), rec.model_dump())
     return rec
 
 
+def _earlier_report(job_reports: list[dict], assessment_id: str) -> tuple[Optional[dict], bool]:
+    """
+    (live report of the earlier near-duplicate application, same candidate?).
+    Only a same-candidate match supersedes; anything else is just flagged.
+    """
+    if not assessment_id:
+        return None, False
+    rec = _read_assessment(assessment_id) or {}
+    dup      = (rec.get("result") or {}).get("duplicate_of") or {}
+    previous = dup.get("assessment_id")
+    if not previous:
+        return None, False
+    by_id  = {r["id"]: r for r in job_reports}
+    report = next((r for r in job_reports if r.get("assessment_id") == previous), None)
+    while report is not None and report.get("superseded_by"):
+        report = by_id.get(report["superseded_by"])
+    return report, bool(report and dup.get("same_candidate"))
+
+
 @app.get("/reports", response_model=dict, tags=["reports"])
-def list_all_reports():
-    return _load(_REPORTS_FILE)
+def list_all_reports(include_superseded: bool = False):
+    reports = _load(_REPORTS_FILE)
+    if include_superseded:
+        return reports
+    return {jid: [r for r in rs if not r.get("superseded_by")] for jid, rs in reports.items()}
 
 
 @app.get("/reports/{job_id}", response_model=List[ReportOut], tags=["reports"])
-def get_reports_for_job(job_id: str):
+def get_reports_for_job(job_id: str, include_superseded: bool = False):
     jobs = _load(_JOBS_FILE)
     if job_id not in jobs:
         raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found.")
-    reports = _load(_REPORTS_FILE)
-    return reports.get(job_id, [])
+    reports = _load(_REPORTS_FILE).get(job_id, [])
+    return reports if include_superseded else [r for r in reports if not r.get("superseded_by")]
+
+
+# ─────────────────────────────────────────────────────────────
+# ASSESSMENTS — BACKGROUND PIPELINE JOBS
+# ─────────────────────────────────────────────────────────────
+_PIPELINE_WORKERS = ThreadPoolExecutor(
+    max_workers=int(os.getenv("TALENTOS_PIPELINE_WORKERS", "4")),
+    thread_name_prefix="assessment",
+)
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _assessment_path(assessment_id: str) -> Path:
+    return _ASSESSMENTS_DIR / f"{assessment_id}.json"
+
+
+def _write_assessment(rec: dict) -> None:
+    _ASSESSMENTS_DIR.mkdir(parents=True, exist_ok=True)
+    path = _assessment_path(rec["id"])
+    tmp  = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(rec, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(path)
+
+
+def _read_assessment(assessment_id: str) -> Optional[dict]:
+    """Live record (a copy) while queued/running, the persisted one afterwards."""
+    with _ASSESSMENTS_LOCK:
+        rec = _LIVE_ASSESSMENTS.get(assessment_id)
+        if rec is not None:
+            return json.loads(json.dumps(rec))
+    try:
+        uuid.UUID(assessment_id)          # ids are uuid4 — never a path
+        return json.loads(_assessment_path(assessment_id).read_text(encoding="utf-8"))
+    except (ValueError, OSError):
+        return None
+
+
+def _update_assessment(assessment_id: str, mutate) -> None:
+    """Apply a progress update in memory; the record is written once it is done or failed."""
+    with _ASSESSMENTS_LOCK:
+        rec = _LIVE_ASSESSMENTS.get(assessment_id)
+        if rec is None:
+            return
+        mutate(rec)
+        rec["updated_at"] = _now()
+        finished = rec["status"] in ("done", "error")
+        if finished:
+            del _LIVE_ASSESSMENTS[assessment_id]
+    if finished:
+        _write_assessment(rec)
+
+
+def _close_running_stage(rec: dict, stage_status: str) -> None:
+    for stage in rec["stages"]:
+        if stage["status"] == "running":
+            stage["status"]      = stage_status
+            stage["finished_at"] = _now()
+
+
+def _migrate_assessments_file() -> None:
+    """Split the old single assessments.json into per-assessment files."""
+    if not _ASSESSMENTS_FILE.exists():
+        return
+    for rec in _load(_ASSESSMENTS_FILE).values():
+        if not _assessment_path(rec["id"]).exists():
+            _write_assessment(rec)
+    _ASSESSMENTS_FILE.rename(_ASSESSMENTS_FILE.with_suffix(".json.migrated"))
+
+
+def _fail_interrupted_assessments() -> None:
+    """Jobs that were queued/running when the process died will never finish."""
+    if not _ASSESSMENTS_DIR.exists():
+        return
+    for path in _ASSESSMENTS_DIR.glob("*.json"):
+        try:
+            rec = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if rec["status"] in ("queued", "running"):
+            _close_running_stage(rec, "error")
+            rec["status"]     = "error"
+            rec["error"]      = "Interrupted by server restart."
+            rec["updated_at"] = _now()
+            _write_assessment(rec)
+
+
+def _expire_assessments() -> int:
+    """Delete finished assessment records older than TALENTOS_ASSESSMENT_TTL_DAYS."""
+    if not _ASSESSMENTS_DIR.exists():
+        return 0
+    cutoff  = time.time() - _ASSESSMENT_TTL_S
+    removed = 0
+    for path in _ASSESSMENTS_DIR.glob("*.json"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
+
+
+def _expire_assessments_periodically(interval_s: float = 3600) -> None:
+    while True:
+        try:
+            _expire_assessments()
+        except OSError as exc:
+            print(f"Assessment expiry failed: {exc}")
+        time.sleep(interval_s)
+
+
+def _get_ats_model():
+    try:
+        from transformer_service import load_model
+        return load_model()
+    except Exception:
+        return None
+
+
+# ── Near-duplicate resumes (resume_dedup.py) ────────────────
+_RESUME_INDEX_FILE = _BASE_DIR / "resume_signatures.jsonl"
+_resume_index_obj  = None
+_resume_index_lock = threading.Lock()
+
+
+def _resume_index():
+    global _resume_index_obj
+    if not HAS_DEDUP:
+        return None
+    with _resume_index_lock:
+        if _resume_index_obj is None:
+            _resume_index_obj = ResumeIndex(_RESUME_INDEX_FILE)
+        return _resume_index_obj
+
+
+def _resume_signature(resume_bytes: bytes, content_type: str):
+    if _resume_index() is None:
+        return None
+    with tracing.span("dedup.signature", bytes=len(resume_bytes)):
+        return signature(resume_text(resume_bytes, content_type))
+
+
+def _find_duplicate(sig, job_id: str, identity: dict) -> Optional[tuple[dict, dict, bool]]:
+    """
+    (LSH hit, assessment record, same candidate?) of the closest earlier
+    finished application to this job; the same candidate's is preferred.
+    """
+    if sig is None:
+        return None
+    hits = _resume_index().query(sig, job_id=job_id)
+    if not hits:
+        return None
+    found = [
+        (hit, rec, same_candidate(identity, hit))
+        for hit in hits
+        if (rec := _read_assessment(hit["id"])) and rec.get("status") == "done" and rec.get("result")
+    ]
+    if not found:
+        return None
+    return next((f for f in found if f[2]), found[0])
+
+
+def _run_assessment_job(
+    assessment_id: str, resume_bytes: bytes, content_type: str, links: list[str], job: dict,
+    candidate_name: str = "", reuse_duplicate: bool = False, candidate_email: str = "",
+) -> None:
+    def progress(stage: str, message: str) -> None:
+        def mutate(rec: dict) -> None:
+            _close_running_stage(rec, "done")
+            rec["stages"].append({
+                "name": stage, "message": message, "status": "running", "started_at": _now(),
+            })
+            rec["stage"]  = stage
+            rec["status"] = "running"
+        _update_assessment(assessment_id, mutate)
+
+    try:
+        sig = _resume_signature(resume_bytes, content_type)
+        identity = {"candidate_name": candidate_name, "candidate_email": candidate_email}
+        dup      = _find_duplicate(sig, job["id"], identity)
+        reused   = bool(dup and dup[2] and reuse_duplicate)
+        if reused:
+            hit, prev, _ = dup
+            progress("dedup", f"♻ Stage 1 · Matches an earlier application ({hit['similarity']:.0%} similar) "
+                              "— reusing its profile and questions…")
+            result = dict(prev["result"])
+        else:
+            result = run_assessment(
+                resume_bytes, content_type, links, job,
+                ats_model=_get_ats_model(), progress=progress, jd_embedding=_job_embedding(job),
+                job_index=_job_index(job),
+            )
+        result.pop("duplicate_of", None)
+        if dup:
+            hit, prev, same = dup
+            result["duplicate_of"] = {
+                "assessment_id":  prev["id"],
+                "candidate_name": prev.get("candidate_name", ""),
+                "similarity":     hit["similarity"],
+                "same_candidate": same,
+                "reused":         reused,
+            }
+        if sig is not None:
+            _resume_index().add(assessment_id, sig, job_id=job["id"], candidate_name=candidate_name,
+                                candidate_email=candidate_email, created_at=_now())
+    except Exception as exc:
+        def fail(rec: dict) -> None:
+            _close_running_stage(rec, "error")
+            rec["status"] = "error"
+            rec["error"]  = str(exc)
+        _update_assessment(assessment_id, fail)
+        return
+
+    def finish(rec: dict) -> None:
+        _close_running_stage(rec, "done")
+        rec["status"] = "done"
+        rec["result"] = result
+    _update_assessment(assessment_id, finish)
+
+
+@app.post(
+    "/assessments",
+    response_model=AssessmentOut,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["assessments"],
+)
+def create_assessment(payload: AssessmentCreate):
+    if not HAS_PIPELINE:
+        raise HTTPException(status_code=503, detail="Assessment pipeline is not available.")
+    jobs = _load(_JOBS_FILE)
+    if payload.job_id not in jobs:
+        raise HTTPException(status_code=404, detail=f"Job '{payload.job_id}' not found.")
+    try:
+        resume_bytes = base64.b64decode(payload.resume_b64, validate=True)
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=422, detail="resume_b64 is not valid base64.")
+
+    assessment_id = str(uuid.uuid4())
+    now = _now()
+    rec = AssessmentOut(
+        id=assessment_id,
+        job_id=payload.job_id,
+        candidate_name=payload.candidate_name,
+        candidate_email=payload.candidate_email,
+        status="queued",
+        created_at=now,
+        updated_at=now,
+    )
+    # Persisted as queued (a restart then marks it interrupted), progressed in memory.
+    _write_assessment(rec.model_dump())
+    with _ASSESSMENTS_LOCK:
+        _LIVE_ASSESSMENTS[assessment_id] = rec.model_dump()
+
+    _PIPELINE_WORKERS.submit(
+        tracing.in_context(_run_assessment_job), assessment_id, resume_bytes,
+        payload.content_type, payload.links, jobs[payload.job_id],
+        payload.candidate_name, payload.reuse_duplicate, payload.candidate_email,
+    )
+    return rec
+
+
+@app.get("/assessments/{assessment_id}", response_model=AssessmentOut, tags=["assessments"])
+def get_assessment(assessment_id: str):
+    rec = _read_assessment(assessment_id)
+    if rec is None:
+        raise HTTPException(status_code=404, detail=f"Assessment '{assessment_id}' not found.")
+    return rec
+
+
+# ─────────────────────────────────────────────────────────────
+# JOB EMBEDDINGS — full JD text encoded once per job
+# ─────────────────────────────────────────────────────────────
+_JOB_VECTORS_DIR = _BASE_DIR / "job_vectors"
+
+
+def _job_vector_paths(job_id: str) -> tuple[Path, Path]:
+    return _JOB_VECTORS_DIR / f"{job_id}.f32", _JOB_VECTORS_DIR / f"{job_id}.json"
+
+
+def _embed_job(job: dict) -> Optional[bytes]:
+    """Encode the job and store it as float32; None when no model is available."""
+    model = _get_ats_model()
+    if model is None:
+        return None
+    try:
+        from transformer_service import DEFAULT_MODEL, embed_job, vector_to_bytes
+        with tracing.span("jobs.embed", job_id=job["id"]):
+            buf = vector_to_bytes(embed_job(job, model))
+    except Exception as exc:
+        print(f"Embedding job {job.get('id')} failed: {exc}")
+        return None
+
+    vec_path, meta_path = _job_vector_paths(job["id"])
+    _JOB_VECTORS_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = vec_path.with_suffix(".tmp")
+    tmp.write_bytes(buf)
+    tmp.replace(vec_path)     # readers never see a half-written vector
+    meta_path.write_text(json.dumps({
+        "model": DEFAULT_MODEL, "dim": len(buf) // 4, "created_at": _now(),
+    }), encoding="utf-8")
+    return buf
+
+
+def _job_embedding(job: dict):
+    """Stored JD vector for the pipeline (embedding it now if missing), or None."""
+    vec_path, _ = _job_vector_paths(job.get("id", ""))
+    buf = vec_path.read_bytes() if vec_path.exists() else _embed_job(job)
+    if buf is None:
+        return None
+    from transformer_service import vector_from_bytes
+    return vector_from_bytes(buf)
+
+
+def _backfill_job_embeddings() -> None:
+    """Jobs created before embeddings existed (or while no model was loaded)."""
+    if _get_ats_model() is None:
+        return
+    for job in _load(_JOBS_FILE).values():
+        if not _job_vector_paths(job["id"])[0].exists():
+            _embed_job(job)
+
+
+@app.get("/jobs/{job_id}/embedding", response_model=JobEmbeddingOut, tags=["jobs"])
+def get_job_embedding(job_id: str):
+    jobs = _load(_JOBS_FILE)
+    if job_id not in jobs:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found.")
+    vec_path, meta_path = _job_vector_paths(job_id)
+    if not vec_path.exists():
+        raise HTTPException(status_code=404, detail=f"Embedding for job '{job_id}' is not computed yet.")
+    buf  = vec_path.read_bytes()
+    meta = json.loads(meta_path.read_text(encoding="utf-8")) if meta_path.exists() else {}
+    return JobEmbeddingOut(
+        job_id=job_id,
+        model=meta.get("model", ""),
+        dim=len(buf) // 4,
+        vector_b64=base64.b64encode(buf).decode("ascii"),
+    )
+
+
+# ─────────────────────────────────────────────────────────────
+# JOB KEYWORD INDEXES — BM25 side of the hybrid ATS score
+# ─────────────────────────────────────────────────────────────
+_JOB_TERMS_DIR = _BASE_DIR / "job_terms"
+
+
+def _job_terms_path(job_id: str) -> Path:
+    return _JOB_TERMS_DIR / f"{job_id}.json"
+
+
+def _index_job_terms(job: dict, corpus) -> JobIndex:
+    index = build_job_index(job, corpus)
+    _JOB_TERMS_DIR.mkdir(parents=True, exist_ok=True)
+    path = _job_terms_path(job["id"])
+    tmp  = path.with_suffix(".tmp")
+    tmp.write_text(index.to_json(), encoding="utf-8")
+    tmp.replace(path)
+    return index
+
+
+def _job_index(job: dict) -> JobIndex:
+    """Stored keyword index for the job, building it now if missing."""
+    path = _job_terms_path(job.get("id", ""))
+    if path.exists():
+        try:
+            return JobIndex.from_json(path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, KeyError):
+            pass
+    return _index_job_terms(job, _load(_JOBS_FILE).values())
+
+
+def _backfill_job_terms() -> None:
+    jobs = _load(_JOBS_FILE)
+    for job in jobs.values():
+        if not _job_terms_path(job["id"]).exists():
+            _index_job_terms(job, jobs.values())
+
+
+@app.post("/jobs/{job_id}/rank", response_model=List[RankedCandidate], tags=["jobs"])
+def rank_for_job(job_id: str, payload: RankRequest):
+    """Rank many resumes/profiles against one job with the hybrid ATS score."""
+    jobs = _load(_JOBS_FILE)
+    if job_id not in jobs:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found.")
+    if payload.ids and len(payload.ids) != len(payload.texts):
+        raise HTTPException(status_code=422, detail="ids must have the same length as texts.")
+    from transformer_service import rank_hybrid
+    job   = jobs[job_id]
+    model = _get_ats_model()
+    return rank_hybrid(
+        payload.texts, job, model,
+        index=_job_index(job),
+        jd_embedding=_job_embedding(job) if model is not None else None,
+        ids=payload.ids or None,
+        top_k=payload.top_k,
+    )
+
+
+# ─────────────────────────────────────────────────────────────
+# EMBEDDING SERVICE — UI processes encode here instead of loading the model
+# ─────────────────────────────────────────────────────────────
+_embed_batcher_obj  = None
+_embed_batcher_lock = threading.Lock()
+
+
+def _embed_batcher():
+    global _embed_batcher_obj
+    model = _get_ats_model()
+    if model is None:
+        return None
+    with _embed_batcher_lock:
+        if _embed_batcher_obj is None:
+            from transformer_service import MicroBatcher
+            _embed_batcher_obj = MicroBatcher(model)
+        return _embed_batcher_obj
+
+
+@app.get("/embed/info", response_model=dict, tags=["embeddings"])
+def embed_info():
+    batcher = _embed_batcher()
+    if batcher is None:
+        raise HTTPException(status_code=503, detail="Embedding model is not available.")
+    from transformer_service import DEFAULT_MODEL
+    return {
+        "model":          DEFAULT_MODEL,
+        "backend":        type(batcher.model).__name__,
+        "max_seq_length": batcher.max_seq_length,
+        "max_batch":      batcher.max_batch,
+        "window_ms":      batcher.window * 1000,
+        "batches":        batcher.batches,
+        "requests":       batcher.requests,
+    }
+
+
+@app.get("/embed/tokenizer", tags=["embeddings"])
+def embed_tokenizer() -> Response:
+    """tokenizer.json of the served model, so remote clients chunk by its WordPiece counts."""
+    batcher = _embed_batcher()
+    if batcher is None:
+        raise HTTPException(status_code=503, detail="Embedding model is not available.")
+    from transformer_service import tokenizer_json
+    body = tokenizer_json(batcher)
+    if body is None:
+        raise HTTPException(status_code=404, detail="The embedding model has no exportable tokenizer.")
+    return Response(body, media_type="application/json", headers={"Cache-Control": "public, max-age=86400"})
+
+
+@app.post("/embed", response_model=EmbedOut, tags=["embeddings"])
+def embed(payload: EmbedRequest):
+    """Raw model embeddings; concurrent requests share micro-batches."""
+    batcher = _embed_batcher()
+    if batcher is None:
+        raise HTTPException(status_code=503, detail="Embedding model is not available.")
+    from transformer_service import DEFAULT_MODEL, vector_to_bytes
+    vecs = batcher.submit(payload.texts).result()
+    return EmbedOut(
+        model=DEFAULT_MODEL,
+        count=vecs.shape[0],
+        dim=vecs.shape[1],
+        vectors_b64=base64.b64encode(vector_to_bytes(vecs)).decode("ascii"),
+    )
+
+
+# ─────────────────────────────────────────────────────────────
+# CANDIDATE SEARCH — every submitted profile, searchable by JD
+# ─────────────────────────────────────────────────────────────
+_CANDIDATE_VECTORS_DIR = _BASE_DIR / "candidate_vectors"
+_candidate_store_obj   = None
+_candidate_store_lock  = threading.Lock()
+
+
+def _candidate_store():
+    global _candidate_store_obj
+    if not HAS_VECTOR_STORE:
+        return None
+    with _candidate_store_lock:
+        if _candidate_store_obj is None:
+            from transformer_service import DEFAULT_MODEL
+            _candidate_store_obj = open_store(_CANDIDATE_VECTORS_DIR, model=DEFAULT_MODEL)
+        return _candidate_store_obj
+
+
+def _index_report(report: dict) -> None:
+    model = _get_ats_model()
+    store = _candidate_store() if model is not None else None
+    if store is None or report["id"] in store:
+        return
+    text = report.get("profile_text") or report.get("final_report") or ""
+    if not text.strip():
+        return
+    try:
+        from transformer_service import embed_documents
+        with tracing.span("search.index_report", report_id=report["id"]):
+            store.add(
+                report["id"], embed_documents([text], model)[0],
+                job_id=report.get("job_id", ""),
+                candidate_name=report.get("candidate_name", ""),
+                recommendation=report.get("recommendation", ""),
+                submitted_at=report.get("submitted_at", ""),
+            )
+    except Exception as exc:
+        print(f"Indexing report {report.get('id')} failed: {exc}")
+
+
+def _backfill_candidate_vectors() -> None:
+    if _get_ats_model() is None:
+        return
+    for job_reports in _load(_REPORTS_FILE).values():
+        for report in job_reports:
+            _index_report(report)
+
+
+@app.post("/search/candidates", response_model=List[CandidateHit], tags=["search"])
+def search_candidates(payload: CandidateSearch):
+    """Past applicants closest to free text or to a job's description."""
+    if not payload.query.strip() and not payload.job_id:
+        raise HTTPException(status_code=422, detail="Provide a query or a job_id.")
+    model = _get_ats_model()
+    store = _candidate_store() if model is not None else None
+    if store is None:
+        raise HTTPException(status_code=503, detail="Embedding model or vector store is not available.")
+
+    if payload.job_id:
+        jobs = _load(_JOBS_FILE)
+        if payload.job_id not in jobs:
+            raise HTTPException(status_code=404, detail=f"Job '{payload.job_id}' not found.")
+        query_vec = _job_embedding(jobs[payload.job_id])
+        if query_vec is None:
+            raise HTTPException(status_code=503, detail=f"Embedding for job '{payload.job_id}' is unavailable.")
+    else:
+        from transformer_service import embed_documents
+        query_vec = embed_documents([payload.query], model)[0]
+
+    with tracing.span("search.candidates", k=payload.k, rows=len(store)):
+        hits = store.search(query_vec, k=payload.k)
+    return [
+        CandidateHit(
+            report_id=h["id"],
+            job_id=h.get("job_id", ""),
+            candidate_name=h.get("candidate_name", ""),
+            recommendation=h.get("recommendation", ""),
+            submitted_at=h.get("submitted_at", ""),
+            score=round(h["score"] * 100, 2),
+        )
+        for h in hits
+    ]
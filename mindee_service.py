@@ -8,15 +8,42 @@ MODEL_ID = "271392a7-da72-4c28-bcd8-ca6157cdecdf"
 
 from mindee import ClientV2, InferenceParameters, PathInput #type: ignore
 from typing import Dict, Any, Optional
+from tracing import traced
 
 # Your specific Model ID
 MODEL_ID = "271392a7-da72-4c28-bcd8-ca6157cdecdf"
 
-def parse_resume_with_mindee(file_path: str, mindee_client: ClientV2) -> Optional[Dict[str, Any]]:
+
+def get_mindee_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> ClientV2:
+    """
+    The one place a ClientV2 is built. api_key and base_url default to
+    Config.MINDEE_API_KEY / Config.MINDEE_API_URL; a non-empty base_url
+    points this client at another host (e.g. the fake_services stand-in).
+    The URL is set on the client's API object, not in os.environ, so other
+    clients in the process keep their own host.
+    """
+    if api_key is None or base_url is None:
+        from config import Config
+        api_key  = Config.MINDEE_API_KEY if api_key is None else api_key
+        base_url = Config.MINDEE_API_URL if base_url is None else base_url
+    client = ClientV2(api_key)
+    if base_url:
+        api = getattr(client, "mindee_api", None)
+        if api is None or not hasattr(api, "url_root"):
+            raise RuntimeError("This mindee SDK version does not expose its base URL; upgrade mindee to use MINDEE_API_URL.")
+        api.url_root = base_url.rstrip("/")
+    return client
+
+
+@traced("mindee.parse_resume")
+def parse_resume_with_mindee(file_path: str, mindee_client: Optional[ClientV2] = None) -> Optional[Dict[str, Any]]:
     """
     Parses a resume using Mindee ClientV2 and extracts data from Mindee Field objects.
+    Without a client, one is built from Config by get_mindee_client().
     """
     try:
+        mindee_client = mindee_client or get_mindee_client()
+
         # 1. Set inference parameters
         params = InferenceParameters(
             model_id=MODEL_ID,
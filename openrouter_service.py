@@ -1,25 +1,44 @@
 from typing import Any
 from config import Config 
-from openai import OpenAI #type: ignore
+from tracing import span
+from llm_scheduler import Priority, estimate_tokens, get_scheduler
+
+
+def _record_usage(sp, response) -> None:
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        sp.set(
+            prompt_tokens=getattr(usage, "prompt_tokens", None),
+            completion_tokens=getattr(usage, "completion_tokens", None),
+        )
 
 def chat_with_reasoning_followup(
     client, 
     initial_prompt: str, 
     follow_up_prompt: str, 
-    model: str = "arcee-ai/trinity-large-preview:free"
+    model: str = "arcee-ai/trinity-large-preview:free",
+    priority: Priority = Priority.INTERACTIVE,
 ) -> Any:
     """
     Executes a two-turn conversation while preserving reasoning tokens 
     to maintain context and logical consistency.
+    Both turns are admitted through the shared LLM scheduler at `priority`.
     """
+    scheduler = get_scheduler()
     
     # 1. Initial Request
     # We enable reasoning via the extra_body parameter
-    response1 = client.chat.completions.create(
-        model=model,
-        messages=[{"role": "user", "content": initial_prompt}],
-        extra_body={"reasoning": {"enabled": True}}
-    )
+    with span("openrouter.completion", model=model, turn=1) as sp:
+        response1 = scheduler.call(
+            lambda: client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": initial_prompt}],
+                extra_body={"reasoning": {"enabled": True}}
+            ),
+            priority=priority,
+            est_tokens=estimate_tokens(initial_prompt),
+        )
+        _record_usage(sp, response1)
 
     assistant_msg = response1.choices[0].message
 
@@ -37,11 +56,17 @@ def chat_with_reasoning_followup(
 
     # 3. Follow-up Request
     # The model now sees its previous reasoning chain
-    response2 = client.chat.completions.create(
-        model=model,
-        messages=messages,
-        extra_body={"reasoning": {"enabled": True}}
-    )
+    with span("openrouter.completion", model=model, turn=2) as sp:
+        response2 = scheduler.call(
+            lambda: client.chat.completions.create(
+                model=model,
+                messages=messages,
+                extra_body={"reasoning": {"enabled": True}}
+            ),
+            priority=priority,
+            est_tokens=estimate_tokens(initial_prompt, assistant_msg.content or "", follow_up_prompt),
+        )
+        _record_usage(sp, response2)
 
     return response2.choices[0].message
 
@@ -1,6 +1,16 @@
-import fitz  # PyMuPDF #type: ignore
-from typing import List, Dict, Any
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional
+from urllib.parse import urlsplit, urlunsplit
 
+from lazy_imports import has_module
+from tracing import traced
+
+HAS_FITZ = has_module("fitz")   # PyMuPDF, imported where it is used
+
+@traced("pdf.extract_hyperlinks")
 def extract_hyperlinks(pdf_path: str) -> List[Dict[str, Any]]:
     """
     Extracts external HTTP/HTTPS hyperlinks from a PDF.
@@ -8,27 +18,233 @@ def extract_hyperlinks(pdf_path: str) -> List[Dict[str, Any]]:
     """
     found_links = []
 
+    if not HAS_FITZ:
+        print("PyMuPDF not installed — skipping hyperlink extraction.")
+        return []
+
     try:
+        import fitz  # PyMuPDF #type: ignore
         # Use context manager to ensure the document closes automatically
         with fitz.open(pdf_path) as doc:
             # Iterate over each page
             for page_num, page in enumerate(doc):
                 # get_links() returns a list of dictionaries representing links
                 links = page.get_links()
-                
+
                 for link in links:
                     # We are interested in the 'uri' key
                     if "uri" in link:
                         url = link["uri"]
-                        
+
                         # FILTER: strict check for http or https
                         if url.lower().startswith(("http://", "https://")):
                             found_links.append(url)
-                            
+
     except Exception as e:
         print(f"Error extracting hyperlinks from PDF: {e}")
         return []
-    
+
     return found_links
 
 
+@traced("pdf.extract_text")
+def extract_text(pdf_bytes: bytes) -> str:
+    """Plain text of every page, or "" when PyMuPDF is missing or the file is unreadable."""
+    if not HAS_FITZ:
+        return ""
+    try:
+        import fitz  # PyMuPDF #type: ignore
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            return "\n".join(page.get_text() for page in doc)
+    except Exception as e:
+        print(f"Error extracting text from PDF: {e}")
+        return ""
+
+
+# ─────────────────────────────────────────────────────────────
+# LINK TRIAGE — canonicalize, classify, apply domain policy, rank
+# ─────────────────────────────────────────────────────────────
+
+# Crawl policy per domain: skip | landing (single page) | deep (bounded crawl).
+# Override or extend with TALENTOS_LINK_POLICY='{"example.com": "deep"}'.
+DEFAULT_LINK_POLICY: Dict[str, str] = {
+    "linkedin.com":     "skip",      # login wall — scrapes always fail
+    "twitter.com":      "skip",
+    "x.com":            "skip",
+    "facebook.com":     "skip",
+    "instagram.com":    "skip",
+    "mail.google.com":  "skip",
+    "outlook.live.com": "skip",
+    "calendly.com":     "skip",
+    "github.com":       "landing",
+    "gitlab.com":       "landing",
+    "kaggle.com":       "landing",
+    "leetcode.com":     "landing",
+    "medium.com":       "landing",
+    "dev.to":           "landing",
+    "stackoverflow.com": "landing",
+    "*":                "landing",   # anything else (portfolios, blogs)
+}
+
+# Expected value of crawling each link category (higher = crawl first).
+CATEGORY_VALUE: Dict[str, float] = {
+    "github_profile": 1.0,
+    "github_repo":    0.8,
+    "portfolio":      0.7,
+    "code_host":      0.7,
+    "competitive":    0.55,
+    "writing":        0.5,
+    "qa":             0.45,
+    "document":       0.3,
+    "social":         0.1,
+    "other":          0.4,
+}
+
+MAX_REPOS_PER_OWNER = 2
+
+_TRACKING_HOSTS = {"lnkd.in", "bit.ly", "t.co"}
+_SCHEME_ONLY_RE = re.compile(r"^[a-z][a-z0-9+.\-]*:(?!\d)", re.IGNORECASE)
+_DOC_EXT_RE     = re.compile(r"\.(pdf|docx?|pptx?|png|jpe?g|gif|zip)$", re.IGNORECASE)
+_GITHUB_RESERVED = {
+    "about", "features", "pricing", "orgs", "settings", "marketplace", "explore",
+    "topics", "login", "join", "sponsors", "apps", "collections", "trending",
+}
+
+
+@dataclass
+class LinkPlan:
+    url:      str
+    category: str
+    mode:     str      # landing | deep
+    score:    float
+
+
+def load_link_policy() -> Dict[str, str]:
+    policy = dict(DEFAULT_LINK_POLICY)
+    raw = os.getenv("TALENTOS_LINK_POLICY", "")
+    if raw:
+        try:
+            policy.update({k.lower(): v for k, v in json.loads(raw).items()})
+        except (json.JSONDecodeError, AttributeError):
+            print("Ignoring malformed TALENTOS_LINK_POLICY.")
+    return policy
+
+
+def canonicalize_url(url: str) -> Optional[str]:
+    """
+    Normalise a link so trivially different spellings crawl once:
+    https scheme, lower-case host without www./default port, no query or
+    fragment, no trailing slash. GitHub repo sub-pages collapse to the repo.
+    Returns None for anything that is not an http(s) URL.
+    """
+    url = (url or "").strip()
+    if not url:
+        return None
+    if "://" not in url:
+        if _SCHEME_ONLY_RE.match(url):
+            return None      # mailto:, tel:, javascript: …
+        url = "https://" + url
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return None
+    if parts.scheme.lower() not in ("http", "https") or not parts.hostname:
+        return None
+
+    host = parts.hostname.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    path = re.sub(r"/{2,}", "/", parts.path or "").rstrip("/")
+    if host == "github.com":
+        # GitHub owners/repos are case-insensitive.
+        segs = [s for s in path.lower().split("/") if s]
+        path = "/" + "/".join(segs[:2]) if segs else ""
+    return urlunsplit(("https", host, path, "", ""))
+
+
+def _domain_of(host: str) -> str:
+    return host.split(":")[0]
+
+
+def classify_link(url: str) -> str:
+    parts = urlsplit(url)
+    host  = _domain_of(parts.netloc)
+    segs  = [s for s in parts.path.split("/") if s]
+    if _DOC_EXT_RE.search(parts.path):
+        return "document"
+    if host == "github.com":
+        if not segs or segs[0].lower() in _GITHUB_RESERVED:
+            return "other"
+        return "github_profile" if len(segs) == 1 else "github_repo"
+    if host.endswith("github.io"):
+        return "portfolio"
+    if host in ("gitlab.com", "bitbucket.org", "huggingface.co"):
+        return "code_host"
+    if host in ("kaggle.com", "leetcode.com", "codeforces.com", "hackerrank.com"):
+        return "competitive"
+    if host in ("medium.com", "dev.to", "hashnode.com", "substack.com") or host.endswith(
+        (".medium.com", ".substack.com", ".hashnode.dev")
+    ):
+        return "writing"
+    if host in ("stackoverflow.com", "stackexchange.com"):
+        return "qa"
+    if host in ("linkedin.com", "twitter.com", "x.com", "facebook.com", "instagram.com") \
+            or host.endswith(".linkedin.com") or host in _TRACKING_HOSTS:
+        return "social"
+    if len(segs) <= 1:
+        return "portfolio"   # bare personal domains are usually portfolios
+    return "other"
+
+
+def _policy_for(host: str, policy: Dict[str, str]) -> str:
+    host = _domain_of(host)
+    labels = host.split(".")
+    # Most specific suffix wins: a.b.example.com → b.example.com → example.com
+    for i in range(len(labels) - 1):
+        mode = policy.get(".".join(labels[i:]))
+        if mode:
+            return mode
+    return policy.get("*", "landing")
+
+
+@traced("pdf.triage_links")
+def triage_links(
+    links: List[str], limit: int = 6, policy: Optional[Dict[str, str]] = None,
+) -> List[LinkPlan]:
+    """
+    Canonicalize, dedupe, drop skip-policy domains and return the top `limit`
+    links ranked by expected value, each with its crawl mode.
+    """
+    policy = policy or load_link_policy()
+    seen:   set = set()
+    repos_per_owner: Dict[str, int] = {}
+    plans:  List[LinkPlan] = []
+
+    candidates = []
+    for raw in links:
+        url = canonicalize_url(raw)
+        if not url or url in seen:
+            continue
+        seen.add(url)
+        mode = _policy_for(urlsplit(url).netloc, policy)
+        if mode == "skip":
+            continue
+        category = classify_link(url)
+        candidates.append(LinkPlan(url=url, category=category, mode=mode,
+                                   score=CATEGORY_VALUE.get(category, CATEGORY_VALUE["other"])))
+
+    # Stable sort keeps the resume's own ordering among equal-value links.
+    candidates.sort(key=lambda p: p.score, reverse=True)
+    for plan in candidates:
+        if plan.category == "github_repo":
+            owner = urlsplit(plan.url).path.split("/")[1].lower()
+            if repos_per_owner.get(owner, 0) >= MAX_REPOS_PER_OWNER:
+                continue
+            repos_per_owner[owner] = repos_per_owner.get(owner, 0) + 1
+        plans.append(plan)
+        if len(plans) >= limit:
+            break
+    return plans
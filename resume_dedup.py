@@ -0,0 +1,160 @@
+"""
+TalentOS · Resume Dedup
+MinHash signatures of resume text and an LSH index over them, used to spot
+candidates re-applying with the same or a lightly edited resume.
+
+  signature(text)      — NUM_PERM min-hashes of the text's word 5-shingles
+  similarity(a, b)     — estimated Jaccard similarity of two signatures
+  ResumeIndex(path)    — append-only JSONL of signatures + metadata, banded
+                         into LSH buckets in memory; query() returns every
+                         stored resume at or above the threshold, optionally
+                         restricted to one job
+  same_candidate(a, b) — do two applications come from the same person?
+
+A similar resume alone is not an identity: shared templates and copied
+resumes from different people land above the threshold too. Callers only
+treat a hit as a re-application when same_candidate() also agrees.
+
+With BANDS × ROWS = 16 × 8, pairs above ~0.7 Jaccard almost always share a
+bucket; candidates from the buckets are then checked against the exact
+signature similarity.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+from pdf_service import extract_text as extract_pdf_text
+
+NUM_PERM      = 128
+BANDS         = 16
+ROWS          = NUM_PERM // BANDS
+SHINGLE_SIZE  = 5
+DUP_THRESHOLD = float(os.getenv("TALENTOS_DEDUP_THRESHOLD", "0.85"))
+
+_PRIME   = (1 << 31) - 1          # a·h + b stays below 2**63 for 32-bit h
+_rng     = np.random.default_rng(20240611)
+_PERM_A  = _rng.integers(1, _PRIME, size=NUM_PERM, dtype=np.uint64)
+_PERM_B  = _rng.integers(0, _PRIME, size=NUM_PERM, dtype=np.uint64)
+_WORD_RE = re.compile(r"\w+")
+
+
+def _email(value: str) -> str:
+    return (value or "").strip().casefold()
+
+
+def same_candidate(a: dict, b: dict) -> bool:
+    """
+    Both applications carry the same email. Names are never enough: two
+    people called "Alex Rivera" with similar resumes are different candidates.
+    """
+    email_a, email_b = _email(a.get("candidate_email", "")), _email(b.get("candidate_email", ""))
+    return bool(email_a) and email_a == email_b
+
+
+def resume_text(resume_bytes: bytes, content_type: str = "") -> str:
+    """Text to fingerprint: PDF text when it can be extracted, the raw bytes otherwise."""
+    if content_type == "application/pdf" or resume_bytes[:5] == b"%PDF-":
+        text = extract_pdf_text(resume_bytes)
+        if text.strip():
+            return text
+    return resume_bytes.decode("utf-8", errors="replace")
+
+
+def _shingle_hashes(text: str) -> np.ndarray:
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        grams = [" ".join(words)] if words else []
+    else:
+        grams = {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+    return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64)
+
+
+def signature(text: str) -> Optional[np.ndarray]:
+    """(NUM_PERM,) uint32 MinHash signature; None for text without words."""
+    hashes = _shingle_hashes(text)
+    if hashes.size == 0:
+        return None
+    # One (NUM_PERM, n_shingles) matrix of permuted hashes, min over shingles.
+    return ((_PERM_A[:, None] * hashes[None, :] + _PERM_B[:, None]) % _PRIME).min(axis=1).astype(np.uint32)
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.mean(a == b))
+
+
+def _band_keys(sig: np.ndarray) -> list[bytes]:
+    return [
+        hashlib.blake2b(sig[i * ROWS:(i + 1) * ROWS].tobytes(), digest_size=8, person=bytes([i])).digest()
+        for i in range(BANDS)
+    ]
+
+
+class ResumeIndex:
+    def __init__(self, path: str | Path):
+        self.path     = Path(path)
+        self._lock    = threading.Lock()
+        self._sigs:    dict[str, np.ndarray] = {}
+        self._meta:    dict[str, dict]       = {}
+        self._buckets: dict[bytes, list[str]] = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        rec = json.loads(line)
+                    except json.JSONDecodeError:
+                        break     # torn final write
+                    sig = np.frombuffer(base64.b64decode(rec.pop("sig")), dtype="<u4").astype(np.uint32)
+                    self._insert(rec.pop("id"), sig, rec)
+
+    def __len__(self) -> int:
+        return len(self._sigs)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._sigs
+
+    def _insert(self, item_id: str, sig: np.ndarray, meta: dict) -> None:
+        self._sigs[item_id] = sig
+        self._meta[item_id] = meta
+        for key in _band_keys(sig):
+            self._buckets.setdefault(key, []).append(item_id)
+
+    def add(self, item_id: str, sig: np.ndarray, **metadata: Any) -> bool:
+        """Store a signature; returns False if item_id is already indexed."""
+        with self._lock:
+            if item_id in self._sigs:
+                return False
+            with self.path.open("a", encoding="utf-8") as fh:
+                fh.write(json.dumps({
+                    "id": item_id, "sig": base64.b64encode(sig.astype("<u4").tobytes()).decode("ascii"), **metadata,
+                }, ensure_ascii=False) + "\n")
+            self._insert(item_id, sig, metadata)
+            return True
+
+    def query(
+        self, sig: np.ndarray, job_id: Optional[str] = None, threshold: float = DUP_THRESHOLD,
+    ) -> list[dict]:
+        """Stored resumes with similarity ≥ threshold, most similar first: [{"id", "similarity", **metadata}]."""
+        with self._lock:
+            candidates = {i for key in _band_keys(sig) for i in self._buckets.get(key, ())}
+            hits = []
+            for item_id in candidates:
+                meta = self._meta[item_id]
+                if job_id is not None and meta.get("job_id") != job_id:
+                    continue
+                sim = similarity(sig, self._sigs[item_id])
+                if sim >= threshold:
+                    hits.append({"id": item_id, "similarity": round(sim, 3), **meta})
+        hits.sort(key=lambda h: -h["similarity"])
+        return hits
@@ -0,0 +1,97 @@
+"""
+Export the sentence-transformer used for ATS scoring to an int8-quantized
+ONNX model for transformer_service's onnx backend.
+
+  python scripts/export_onnx_model.py                       # all-MiniLM-L6-v2 → models/all-MiniLM-L6-v2-onnx-int8/
+  python scripts/export_onnx_model.py --model <name|path> --out <dir> [--keep-fp32]
+
+Writes model.onnx (int8 dynamic quantization of the transformer; pooling
+and normalisation run in numpy), tokenizer.json and export.json.
+Export-time only requirements: torch, sentence-transformers, onnx, onnxruntime.
+Verify with benchmarks/embedding_backends.py before deploying.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from transformer_service import DEFAULT_MODEL, onnx_model_dir  # noqa: E402
+
+
+def export(model_name: str, out_dir: Path, keep_fp32: bool = False, opset: int = 17) -> Path:
+    import torch  #type: ignore
+    from onnxruntime.quantization import QuantType, quantize_dynamic  #type: ignore
+    from sentence_transformers import SentenceTransformer  #type: ignore
+
+    st        = SentenceTransformer(model_name, device="cpu")
+    hf_model  = st[0].auto_model.eval()
+    tokenizer = st.tokenizer
+    pooling   = getattr(st[1], "get_pooling_mode_str", lambda: "mean")() if len(st) > 1 else "mean"
+    if pooling != "mean":
+        raise SystemExit(f"{model_name} uses '{pooling}' pooling; OnnxEmbedder only implements mean pooling.")
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    fp32_path = out_dir / "model.fp32.onnx"
+    int8_path = out_dir / "model.onnx"
+
+    sample = tokenizer(["TalentOS export sample sentence."], return_tensors="pt")
+    names  = [n for n in ("input_ids", "attention_mask", "token_type_ids") if n in sample]
+    axes   = {n: {0: "batch", 1: "sequence"} for n in names}
+    axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    class _Encoder(torch.nn.Module):
+        """Positional inputs → last_hidden_state only."""
+
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, *inputs):
+            return self.model(**dict(zip(names, inputs))).last_hidden_state
+
+    with torch.no_grad():
+        torch.onnx.export(
+            _Encoder(hf_model), tuple(sample[n] for n in names), str(fp32_path),
+            input_names=names, output_names=["last_hidden_state"],
+            dynamic_axes=axes, opset_version=opset, dynamo=False,
+        )
+    quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8)
+    if not keep_fp32:
+        fp32_path.unlink()
+
+    tokenizer.backend_tokenizer.save(str(out_dir / "tokenizer.json"))
+    normalize = any(type(m).__name__ == "Normalize" for m in st)
+    dim_fn    = getattr(st, "get_embedding_dimension", None) or st.get_sentence_embedding_dimension
+    (out_dir / "export.json").write_text(json.dumps({
+        "model":          model_name,
+        "max_seq_length": st.max_seq_length,
+        "dim":            dim_fn(),
+        "pooling":        "mean",
+        "normalize":      normalize,
+        "quantization":   "int8-dynamic",
+        "opset":          opset,
+    }, indent=2), encoding="utf-8")
+    return int8_path
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--model", default=DEFAULT_MODEL)
+    ap.add_argument("--out", type=Path, help="output directory (default: TALENTOS_ONNX_MODEL_DIR or models/<name>-onnx-int8)")
+    ap.add_argument("--keep-fp32", action="store_true", help="keep the unquantized model.fp32.onnx too")
+    ap.add_argument("--opset", type=int, default=17)
+    args = ap.parse_args()
+
+    out  = args.out or onnx_model_dir(Path(args.model).name)
+    path = export(args.model, out, args.keep_fp32, args.opset)
+    print(f"wrote {path} ({path.stat().st_size / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
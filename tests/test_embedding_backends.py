@@ -0,0 +1,48 @@
+"""
+fp32 (sentence-transformers) ↔ int8 ONNX parity, with the thresholds of
+benchmarks/embedding_backends.py. Skipped unless an export exists at
+TALENTOS_ONNX_MODEL_DIR (or models/<name>-onnx-int8) and both runtimes are
+installed. The fp32 side is the model named in the export's export.json.
+"""
+
+import json
+
+import pytest
+
+import transformer_service as ts
+from benchmarks.embedding_backends import (
+    MAX_SCORE_DIFF, MIN_COSINE, MIN_NEIGHBOUR_AGREE, compare, parity_outputs,
+)
+
+MODEL_DIR = ts.onnx_model_dir()
+
+
+@pytest.fixture(scope="module")
+def parity() -> dict:
+    if not (MODEL_DIR / "model.onnx").exists():
+        pytest.skip(f"no ONNX export at {MODEL_DIR} (run scripts/export_onnx_model.py)")
+    if not ts.HAS_ONNX:
+        pytest.skip("onnxruntime/tokenizers not installed")
+    st = pytest.importorskip("sentence_transformers")
+
+    meta   = MODEL_DIR / "export.json"
+    source = json.loads(meta.read_text(encoding="utf-8")).get("model") if meta.exists() else None
+    fp32   = st.SentenceTransformer(source or ts.DEFAULT_MODEL)
+    int8   = ts.OnnxEmbedder(MODEL_DIR)
+    return compare(parity_outputs(fp32), parity_outputs(int8))
+
+
+def test_embeddings_match(parity):
+    assert parity["min_cosine"] >= MIN_COSINE
+
+
+def test_match_scores_match(parity):
+    assert parity["max_score_diff"] <= MAX_SCORE_DIFF
+
+
+def test_nearest_neighbours_agree(parity):
+    assert parity["neighbour_agree"] >= MIN_NEIGHBOUR_AGREE
+
+
+def test_parity_passes(parity):
+    assert parity["passed"], parity
@@ -0,0 +1,39 @@
+"""
+The heavy integrations (benchmarks/import_profile.DEFAULT_FORBID: torch,
+sentence-transformers, onnxruntime, openai, PyMuPDF, …) must stay off the
+start-up import path of the entry modules. Each check runs in a fresh
+interpreter, so modules already imported by the test run do not count.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.import_profile import DEFAULT_APPS, DEFAULT_FORBID, ROOT, profile, top_level_imports
+
+
+def _forbidden(modules: set[str]) -> list[str]:
+    return sorted({m.split(".", 1)[0] for m in modules} & set(DEFAULT_FORBID))
+
+
+@pytest.mark.parametrize("app", DEFAULT_APPS)
+def test_top_level_imports_skip_heavy_packages(app):
+    _, loaded = profile(top_level_imports(ROOT / f"{app}.py"))
+    assert not _forbidden(loaded), f"{app} imports eagerly: {_forbidden(loaded)}"
+
+
+def test_importing_main_skips_heavy_packages(tmp_path):
+    """main.py is importable as a module, so check the real thing, not just its import lines."""
+    pytest.importorskip("fastapi")
+    env = dict(os.environ, TALENTOS_TRACING="0", TALENTOS_WARMUP="0",
+               TALENTOS_DATA_DIR=str(tmp_path), PYTHONPATH=str(ROOT))
+    out = subprocess.run(
+        [sys.executable, "-c", "import json, sys, main; print(json.dumps(sorted(sys.modules)))"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=False,
+    )
+    assert out.returncode == 0, out.stderr[-2000:]
+    loaded = set(json.loads(out.stdout.strip().splitlines()[-1]))
+    assert not _forbidden(loaded), f"main imports eagerly: {_forbidden(loaded)}"
@@ -0,0 +1,29 @@
+"""Literal skill credit (transformer_service._mentions) — short skills must not match ordinary prose."""
+
+import pytest
+
+from transformer_service import _mentions
+
+
+@pytest.mark.parametrize("skill, sentence", [
+    ("Go", "I had to go back and rewrite the scheduler."),
+    ("Go", "Go-to person for on-call escalations."),
+    ("AI", "We said our goodbyes and ai-ai-ai'd at the party."),
+    ("R", "Led R&D for the payments team."),
+    ("C", "Finished the course with a C average."),
+    ("SQL", "Wrote sql-like filters by hand."),
+])
+def test_short_skills_ignore_prose(skill, sentence):
+    assert not _mentions(skill, sentence)
+
+
+@pytest.mark.parametrize("skill, sentence", [
+    ("Go", "Built the ingest service in Go and Python."),
+    ("AI", "AI platform team lead for three years."),
+    ("C++", "Ported the renderer from C++ to Rust."),
+    ("SQL", "Tuned SQL queries on PostgreSQL."),
+    ("Kubernetes", "operated kubernetes clusters at scale."),
+    ("Python", "Python, Go and Rust."),
+])
+def test_skills_mentioned(skill, sentence):
+    assert _mentions(skill, sentence)
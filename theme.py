@@ -0,0 +1,70 @@
+"""
+TalentOS · Theme
+The design-system stylesheets shared by hr_app.py and candidate_app.py,
+served once as cacheable static files instead of being re-sent through
+st.markdown on every rerun.
+
+  static/theme/<name>.css   — the stylesheets (candidate, hr)
+  asset_name(name)          — "<name>.<hash>.css", content-hashed so the
+                              URL changes whenever the CSS does
+  read_asset(filename)      — CSS for a hashed filename (main.py serves it
+                              at GET /theme/<filename>, cached immutable)
+  head_html(name, base)     — font links + <link> to base/theme/<hashed>;
+                              the full <style> inline when base is empty
+                              (the default: api_client.asset_base_url() is
+                              only set by TALENTOS_ASSET_URL)
+
+Streamlit's own static serving is not used: it serves .css as text/plain
+with nosniff, which browsers refuse to apply as a stylesheet.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+THEME_DIR = Path(__file__).parent / "static" / "theme"
+
+_FONT_FAMILIES = {
+    "candidate": "family=Sora:wght@300;400;500;600;700;800&family=JetBrains+Mono:wght@400;500;600&family=Instrument+Serif:ital@0;1",
+    "hr":        "family=Sora:wght@300;400;500;600;700;800&family=JetBrains+Mono:wght@400;500;600",
+}
+_ASSET_RE = re.compile(r"^([a-z]+)\.([0-9a-f]{12})\.css$")
+
+
+@lru_cache(maxsize=None)
+def stylesheet(name: str) -> str:
+    return (THEME_DIR / f"{name}.css").read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=None)
+def asset_name(name: str) -> str:
+    digest = hashlib.sha256(stylesheet(name).encode("utf-8")).hexdigest()[:12]
+    return f"{name}.{digest}.css"
+
+
+def read_asset(filename: str) -> Optional[str]:
+    """CSS for a current hashed asset name; None for unknown names or stale hashes."""
+    m = _ASSET_RE.match(filename)
+    if not m or m.group(1) not in _FONT_FAMILIES or asset_name(m.group(1)) != filename:
+        return None
+    return stylesheet(m.group(1))
+
+
+def _font_links(name: str) -> str:
+    return (
+        '<link rel="preconnect" href="https://fonts.googleapis.com">\n'
+        '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>\n'
+        f'<link href="https://fonts.googleapis.com/css2?{_FONT_FAMILIES[name]}&display=swap" rel="stylesheet">\n'
+    )
+
+
+@lru_cache(maxsize=None)
+def head_html(name: str, base_url: str = "") -> str:
+    """Markup to emit on each rerun: a few hundred bytes when base_url serves the theme."""
+    if not base_url:
+        return f"{_font_links(name)}\n<style>\n{stylesheet(name)}</style>\n"
+    return f'{_font_links(name)}<link rel="stylesheet" href="{base_url.rstrip("/")}/theme/{asset_name(name)}">\n'
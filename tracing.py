@@ -0,0 +1,286 @@
+"""
+TalentOS · Tracing
+Span timing for pipeline stages and external calls (Firecrawl, Mindee,
+OpenRouter, gTTS, Whisper, embedding model).
+
+Spans are appended to a JSONL file, one span per line, using
+OpenTelemetry-style field names (trace_id, span_id, parent_span_id,
+start_time_unix_nano, end_time_unix_nano, status, attributes).
+
+Finished spans go into an in-memory buffer that a daemon thread writes out
+in batches, so the request path never opens the file. When the file grows
+past TALENTOS_TRACE_MAX_MB it is rotated to <file>.1 (one generation kept).
+
+Worker threads do not inherit the submitting thread's context: wrap the
+callable with in_context(fn) when handing it to a pool so its spans keep
+their parent.
+
+Env vars:
+  TALENTOS_TRACE_FILE    — output path (default: ./data/traces.jsonl)
+  TALENTOS_TRACING       — set to "0" to disable export
+  TALENTOS_SERVICE_NAME  — resource service.name (default: talentos)
+  TALENTOS_TRACE_MAX_MB  — rotate the file above this size (default: 50)
+  TALENTOS_TRACE_FLUSH_S — buffer flush interval (default: 1)
+
+Summary (p50/p95 per span name):
+  python tracing.py [path/to/traces.jsonl]
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextvars
+import functools
+import json
+import math
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+_TRACE_FILE = Path(
+    os.getenv("TALENTOS_TRACE_FILE", str(Path(__file__).parent / "data" / "traces.jsonl"))
+)
+_ENABLED      = os.getenv("TALENTOS_TRACING", "1") != "0"
+_SERVICE_NAME = os.getenv("TALENTOS_SERVICE_NAME", "talentos")
+_MAX_BYTES    = int(float(os.getenv("TALENTOS_TRACE_MAX_MB", "50")) * 1024 * 1024)
+_FLUSH_S      = float(os.getenv("TALENTOS_TRACE_FLUSH_S", "1"))
+_FLUSH_LINES  = 512       # wake the flusher early once this many spans wait
+_BUFFER_MAX   = 20_000    # spans beyond this are dropped, not queued
+
+_write_lock   = threading.Lock()
+_buffer_cond  = threading.Condition()
+_buffer: list[str] = []
+_dropped      = 0
+_flusher_pid  = 0
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "talentos_current_span", default=None
+)
+
+
+# ─────────────────────────────────────────────────────────────
+# SPANS
+# ─────────────────────────────────────────────────────────────
+
+class Span:
+    __slots__ = ("name", "trace_id", "span_id", "parent_span_id",
+                 "start_ns", "attributes", "status", "status_message")
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: dict):
+        self.name           = name
+        self.trace_id       = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id        = secrets.token_hex(8)
+        self.parent_span_id = parent.span_id if parent else ""
+        self.start_ns       = time.time_ns()
+        self.attributes     = dict(attributes)
+        self.status         = "OK"
+        self.status_message = ""
+
+    def set(self, **attributes: Any) -> None:
+        """Attach attributes (tokens, bytes, cache_hit, http.status_code, …)."""
+        self.attributes.update(attributes)
+
+    def error(self, message: str) -> None:
+        self.status         = "ERROR"
+        self.status_message = message
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """
+    Time a block. Nested spans share the trace_id of the enclosing span.
+    Exceptions mark the span as ERROR and are re-raised.
+    """
+    parent = _current_span.get()
+    sp     = Span(name, parent, attributes)
+    token  = _current_span.set(sp)
+    t0     = time.perf_counter()
+    try:
+        yield sp
+    except BaseException as exc:
+        sp.error(f"{type(exc).__name__}: {exc}")
+        raise
+    finally:
+        duration_ms = (time.perf_counter() - t0) * 1000
+        _current_span.reset(token)
+        _export(sp, duration_ms)
+
+
+def traced(name: Optional[str] = None, **attributes: Any) -> Callable:
+    """Decorator form of span(); defaults the span name to module.function."""
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or f"{fn.__module__}.{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(span_name, **attributes):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def in_context(fn: Callable) -> Callable:
+    """
+    Bind fn to the caller's context (and so its current span) for running
+    on another thread: pool.submit(in_context(fn), ...) or
+    pool.map(in_context(fn), items). Each call runs in its own copy, so
+    concurrent workers never share one Context.
+    """
+    ctx = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        return ctx.copy().run(fn, *args, **kwargs)
+    return wrapper
+
+
+# ─────────────────────────────────────────────────────────────
+# EXPORT
+# ─────────────────────────────────────────────────────────────
+
+def _export(sp: Span, duration_ms: float) -> None:
+    if not _ENABLED:
+        return
+    record = {
+        "trace_id":             sp.trace_id,
+        "span_id":              sp.span_id,
+        "parent_span_id":       sp.parent_span_id,
+        "name":                 sp.name,
+        "start_time_unix_nano": sp.start_ns,
+        "end_time_unix_nano":   sp.start_ns + int(duration_ms * 1_000_000),
+        "duration_ms":          round(duration_ms, 3),
+        "status":               {"code": sp.status, "message": sp.status_message},
+        "attributes":           sp.attributes,
+        "resource":             {"service.name": _SERVICE_NAME, "process.pid": os.getpid()},
+    }
+    line = json.dumps(record, ensure_ascii=False, default=str)
+    global _dropped
+    with _buffer_cond:
+        if len(_buffer) >= _BUFFER_MAX:
+            _dropped += 1
+            return
+        _buffer.append(line)
+        if _flusher_pid != os.getpid():
+            _start_flusher()
+        if len(_buffer) >= _FLUSH_LINES:
+            _buffer_cond.notify()
+
+
+def _start_flusher() -> None:
+    """Start this process's flush thread. Caller holds _buffer_cond."""
+    global _flusher_pid
+    _flusher_pid = os.getpid()     # a forked worker starts its own
+
+    def loop() -> None:
+        while True:
+            with _buffer_cond:
+                _buffer_cond.wait(timeout=_FLUSH_S)
+            flush()
+
+    threading.Thread(target=loop, name="trace-flusher", daemon=True).start()
+
+
+def _rotate() -> None:
+    try:
+        if _TRACE_FILE.stat().st_size >= _MAX_BYTES:
+            _TRACE_FILE.replace(_TRACE_FILE.with_name(_TRACE_FILE.name + ".1"))
+    except FileNotFoundError:
+        pass
+
+
+def flush() -> int:
+    """Write buffered spans to the trace file; returns how many were written."""
+    global _dropped
+    with _write_lock:
+        with _buffer_cond:
+            lines = _buffer[:]
+            _buffer.clear()
+            dropped, _dropped = _dropped, 0
+        if not lines:
+            return 0
+        if dropped:
+            print(f"Tracing buffer full: dropped {dropped} spans")
+        try:
+            _TRACE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _rotate()
+            with _TRACE_FILE.open("a", encoding="utf-8") as fh:
+                fh.write("\n".join(lines) + "\n")
+        except OSError:
+            pass   # tracing must never break the request path
+        return len(lines)
+
+
+atexit.register(flush)
+
+
+# ─────────────────────────────────────────────────────────────
+# SUMMARY
+# ─────────────────────────────────────────────────────────────
+
+def _percentile(sorted_vals: list[float], pct: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    # Nearest-rank percentile — no interpolation, always an observed value.
+    rank = max(0, min(len(sorted_vals) - 1, math.ceil(pct / 100 * len(sorted_vals)) - 1))
+    return sorted_vals[rank]
+
+
+def summarize(path: Optional[str | Path] = None) -> dict[str, dict]:
+    """
+    Return {span_name: {count, errors, p50_ms, p95_ms, max_ms, total_ms}}
+    over the current trace file (at most TALENTOS_TRACE_MAX_MB; rotated
+    generations are not read).
+    """
+    if path is None:
+        flush()
+    trace_path = Path(path) if path else _TRACE_FILE
+    durations: dict[str, list[float]] = {}
+    errors:    dict[str, int]         = {}
+    if not trace_path.exists():
+        return {}
+    with trace_path.open(encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            name = rec.get("name", "?")
+            durations.setdefault(name, []).append(float(rec.get("duration_ms", 0.0)))
+            if rec.get("status", {}).get("code") == "ERROR":
+                errors[name] = errors.get(name, 0) + 1
+
+    summary = {}
+    for name, vals in durations.items():
+        vals.sort()
+        summary[name] = {
+            "count":    len(vals),
+            "errors":   errors.get(name, 0),
+            "p50_ms":   round(_percentile(vals, 50), 1),
+            "p95_ms":   round(_percentile(vals, 95), 1),
+            "max_ms":   round(vals[-1], 1),
+            "total_ms": round(sum(vals), 1),
+        }
+    return dict(sorted(summary.items(), key=lambda kv: kv[1]["total_ms"], reverse=True))
+
+
+def format_summary(summary: dict[str, dict]) -> str:
+    header = f"{'span':<36} {'count':>6} {'err':>5} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10} {'total s':>9}"
+    lines  = [header, "─" * len(header)]
+    for name, s in summary.items():
+        lines.append(
+            f"{name:<36} {s['count']:>6} {s['errors']:>5} {s['p50_ms']:>10.1f} "
+            f"{s['p95_ms']:>10.1f} {s['max_ms']:>10.1f} {s['total_ms'] / 1000:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import sys
+    print(format_summary(summarize(sys.argv[1] if len(sys.argv) > 1 else None)))
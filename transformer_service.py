@@ -1,20 +1,745 @@
-from sentence_transformers import util  #type: ignore
+import contextvars
+import hashlib
+import importlib.util
+import json
+import os
+import queue
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Sequence, Union
 
-def calculate_match_score(user_summary: str, jd_summary: str,model) -> float:
-    
-    # 2. Encode the texts into embeddings (vectors)
-    # convert_to_tensor=True ensures we get PyTorch tensors for efficient calculation
-    embedding_profile = model.encode(user_summary, convert_to_tensor=True)
-    embedding_jd = model.encode(jd_summary, convert_to_tensor=True)
+import numpy as np
+from context_packing import count_tokens, split_sentences
+from keyword_index import JobIndex, build_job_index
+from tracing import span, traced
 
-    # 3. Compute Cosine Similarity
-    # This measures the cosine of the angle between the two vectors.
-    # 1.0 means the vectors point in the exact same direction (identical meaning).
-    cosine_score = util.cos_sim(embedding_profile, embedding_jd)
+DEFAULT_MODEL      = "all-MiniLM-L6-v2"
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_POOLING    = os.getenv("TALENTOS_EMBED_POOLING", "mean")   # mean | max | topk
+CHUNK_TOKENS       = int(os.getenv("TALENTOS_EMBED_CHUNK_TOKENS", "240"))
+FALLBACK_BUDGET_RATIO = 0.6   # chunk budget share when only count_tokens is available
+CHUNK_CACHE_SIZE   = int(os.getenv("TALENTOS_EMBED_CACHE_SIZE", "8192"))
+TOPK_POOL          = 3
+LEXICAL_WEIGHT     = float(os.getenv("TALENTOS_ATS_LEXICAL_WEIGHT", "0.3"))   # BM25 share of the ATS score
 
-    # 4. Extract the scalar value and convert to percentage
-    # .item() pulls the float value out of the tensor
-    score_percentage = cosine_score.item() * 100
+# torch (sentence-transformers) or onnx (int8 export, see scripts/export_onnx_model.py)
+EMBED_BACKEND  = os.getenv("TALENTOS_EMBED_BACKEND", "torch")
+ONNX_MODEL_DIR = os.getenv("TALENTOS_ONNX_MODEL_DIR", "")
+MODELS_DIR     = Path(__file__).parent / "models"
 
-    return round(score_percentage, 2)
+# Shared embedding service (POST /embed on main.py); empty = load the model in-process
+EMBED_URL        = os.getenv("TALENTOS_EMBED_URL", "").rstrip("/")
+EMBED_WINDOW_MS  = float(os.getenv("TALENTOS_EMBED_WINDOW_MS", "5"))
+EMBED_MAX_BATCH  = int(os.getenv("TALENTOS_EMBED_MAX_BATCH", str(DEFAULT_BATCH_SIZE)))
+EMBED_TIMEOUT    = 10     # seconds per /embed request
+EMBED_RETRY_S    = 30     # after a failed request, stay on the in-process model this long
 
+# Checked without importing: onnxruntime/torch imports are a large share of cold start.
+HAS_ONNX       = all(importlib.util.find_spec(m) is not None for m in ("onnxruntime", "tokenizers"))
+HAS_TOKENIZERS = importlib.util.find_spec("tokenizers") is not None
+
+
+def onnx_model_dir(name: str = DEFAULT_MODEL) -> Path:
+    return Path(ONNX_MODEL_DIR) if ONNX_MODEL_DIR else MODELS_DIR / f"{name}-onnx-int8"
+
+
+@lru_cache(maxsize=None)
+@traced("embedding.load_model")
+def load_model(name: str = DEFAULT_MODEL, backend: Optional[str] = None):
+    """Load the embedding model once per process on the configured backend."""
+    backend = backend or EMBED_BACKEND
+    if backend == "onnx":
+        model_dir = onnx_model_dir(name)
+        if HAS_ONNX and (model_dir / "model.onnx").exists():
+            return OnnxEmbedder(model_dir)
+        reason = f"{model_dir / 'model.onnx'} not found" if HAS_ONNX else "onnxruntime/tokenizers not installed"
+        print(f"ONNX backend unavailable ({reason}) — falling back to sentence-transformers.")
+    from sentence_transformers import SentenceTransformer  #type: ignore
+    return SentenceTransformer(name)
+
+
+# ─────────────────────────────────────────────────────────────
+# ONNX BACKEND — int8 export of the same model, no torch at runtime
+# ─────────────────────────────────────────────────────────────
+class _TokenCounter:
+    """tokenizer.tokenize() for _token_counter(), without truncation."""
+
+    def __init__(self, tokenizer):
+        tokenizer.no_padding()        # a served tokenizer.json may carry padding/truncation settings
+        tokenizer.no_truncation()
+        self._tok = tokenizer
+
+    def tokenize(self, text: str) -> list[str]:
+        return self._tok.encode(text, add_special_tokens=False).tokens
+
+
+class OnnxEmbedder:
+    """
+    The subset of SentenceTransformer this module uses — encode(),
+    max_seq_length, tokenizer — over an ONNX export: WordPiece tokenizer →
+    transformer → attention-masked mean pooling → optional L2 normalisation.
+    """
+
+    def __init__(self, model_dir: str | Path, threads: int = 0):
+        import onnxruntime as ort  #type: ignore
+        from tokenizers import Tokenizer  #type: ignore
+
+        model_dir = Path(model_dir)
+        meta      = json.loads((model_dir / "export.json").read_text(encoding="utf-8")) \
+            if (model_dir / "export.json").exists() else {}
+        self.model_dir      = model_dir
+        self.name           = meta.get("model", model_dir.name)
+        self.max_seq_length = int(meta.get("max_seq_length", 256))
+        self.normalize      = bool(meta.get("normalize", True))
+
+        self._tok = Tokenizer.from_file(str(model_dir / "tokenizer.json"))
+        self._tok.no_padding()
+        self._tok.enable_truncation(max_length=self.max_seq_length)
+        self.tokenizer = _TokenCounter(Tokenizer.from_file(str(model_dir / "tokenizer.json")))
+
+        opts = ort.SessionOptions()
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        opts.intra_op_num_threads     = threads or int(os.getenv("TALENTOS_ONNX_THREADS", "0"))
+        self.session = ort.InferenceSession(
+            str(model_dir / "model.onnx"), opts, providers=["CPUExecutionProvider"],
+        )
+        self._inputs = {i.name for i in self.session.get_inputs()}
+
+    def _encode_batch(self, texts: list[str]) -> np.ndarray:
+        encs  = self._tok.encode_batch(texts)
+        width = max(len(e.ids) for e in encs)
+        ids   = np.zeros((len(encs), width), dtype=np.int64)
+        mask  = np.zeros_like(ids)
+        types = np.zeros_like(ids)
+        for r, e in enumerate(encs):
+            n = len(e.ids)
+            ids[r, :n], mask[r, :n], types[r, :n] = e.ids, e.attention_mask, e.type_ids
+        feeds  = {"input_ids": ids, "attention_mask": mask, "token_type_ids": types}
+        hidden = self.session.run(None, {k: v for k, v in feeds.items() if k in self._inputs})[0]
+        m      = mask[..., None].astype(np.float32)
+        return (hidden * m).sum(axis=1) / np.maximum(m.sum(axis=1), 1e-9)
+
+    def encode(
+        self, sentences, batch_size: int = 32, convert_to_numpy: bool = True,
+        show_progress_bar: bool = False, **_: object,
+    ) -> np.ndarray:
+        single = isinstance(sentences, str)
+        texts  = [sentences] if single else list(sentences)
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        # Longest first so each batch pads to similar lengths (as SentenceTransformer does).
+        order  = sorted(range(len(texts)), key=lambda i: -len(texts[i]))
+        out    = None
+        for start in range(0, len(texts), batch_size):
+            idx    = order[start:start + batch_size]
+            pooled = self._encode_batch([texts[i] for i in idx])
+            if out is None:
+                out = np.empty((len(texts), pooled.shape[1]), dtype=np.float32)
+            out[idx] = pooled
+        if self.normalize:
+            out /= np.maximum(np.linalg.norm(out, axis=1, keepdims=True), 1e-12)
+        return out[0] if single else out
+
+
+# ─────────────────────────────────────────────────────────────
+# SHARED SERVICE — one model per host, concurrent requests batched
+# ─────────────────────────────────────────────────────────────
+class MicroBatcher:
+    """
+    Coalesces concurrent encode calls into shared model batches. The first
+    queued request opens a window of window_ms; everything that arrives
+    before it closes (up to max_batch texts) is encoded in one call.
+    The batch span is recorded under the first request's trace.
+    """
+
+    def __init__(self, model, max_batch: int = EMBED_MAX_BATCH, window_ms: float = EMBED_WINDOW_MS):
+        self.model     = model
+        self.max_batch = max_batch
+        self.window    = window_ms / 1000
+        self.batches   = 0
+        self.requests  = 0
+        self._queue: "queue.Queue[tuple[list[str], Future, contextvars.Context]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="embed-batcher", daemon=True)
+        self._thread.start()
+
+    @property
+    def max_seq_length(self) -> int:
+        return getattr(self.model, "max_seq_length", 256)
+
+    @property
+    def tokenizer(self):
+        return getattr(self.model, "tokenizer", None)
+
+    def submit(self, texts: Sequence[str]) -> "Future[np.ndarray]":
+        fut: Future = Future()
+        if not texts:
+            fut.set_result(np.zeros((0, 0), dtype=np.float32))
+        else:
+            self._queue.put((list(texts), fut, contextvars.copy_context()))
+        return fut
+
+    def encode(self, sentences, batch_size: int = DEFAULT_BATCH_SIZE, **_: object) -> np.ndarray:
+        single = isinstance(sentences, str)
+        vecs   = self.submit([sentences] if single else list(sentences)).result()
+        return vecs[0] if single else vecs
+
+    def _collect(self) -> list[tuple[list[str], Future, contextvars.Context]]:
+        pending  = [self._queue.get()]
+        size     = len(pending[0][0])
+        deadline = time.monotonic() + self.window
+        while size < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            pending.append(item)
+            size += len(item[0])
+        return pending
+
+    def _encode(self, pending: list, texts: list[str]) -> np.ndarray:
+        with span("embedding.microbatch", requests=len(pending), texts=len(texts)):
+            return np.asarray(self.model.encode(
+                texts, batch_size=self.max_batch, convert_to_numpy=True, show_progress_bar=False,
+            ), dtype=np.float32)
+
+    def _run(self) -> None:
+        while True:
+            pending = self._collect()
+            texts   = [t for batch, _, _ in pending for t in batch]
+            try:
+                vecs = pending[0][2].run(self._encode, pending, texts)
+            except Exception as exc:
+                for _, fut, _ in pending:
+                    fut.set_exception(exc)
+                continue
+            self.batches  += 1
+            self.requests += len(pending)
+            start = 0
+            for batch, fut, _ in pending:
+                fut.set_result(vecs[start:start + len(batch)])
+                start += len(batch)
+
+
+class RemoteEmbedder:
+    """
+    encode() over the embedding service. Requests that fail are served by
+    an in-process model (loaded on first failure) for EMBED_RETRY_S.
+    """
+
+    def __init__(self, url: str, name: str = DEFAULT_MODEL, timeout: float = EMBED_TIMEOUT, request_size: int = 256):
+        import requests
+
+        self.url          = url.rstrip("/")
+        self.name         = name
+        self.timeout      = timeout
+        self.request_size = request_size
+        self._http        = requests.Session()
+        self._local       = None
+        self._down_until  = 0.0
+
+        r = self._http.get(f"{self.url}/embed/info", timeout=timeout)
+        r.raise_for_status()
+        info = r.json()
+        if info.get("model") != name:
+            raise ValueError(f"service embeds with '{info.get('model')}', not '{name}'")
+        self.max_seq_length = int(info.get("max_seq_length") or 256)
+        self.tokenizer      = self._load_tokenizer()
+
+    def _load_tokenizer(self) -> Optional[_TokenCounter]:
+        """
+        Chunking counts WordPiece tokens: the exported tokenizer when it is on
+        disk, else the service's (GET /embed/tokenizer). None leaves chunking
+        on count_tokens with a reduced budget (see _chunk_budget).
+        """
+        if not HAS_TOKENIZERS:
+            return None
+        from tokenizers import Tokenizer  #type: ignore
+        tok_path = onnx_model_dir(self.name) / "tokenizer.json"
+        if tok_path.exists():
+            return _TokenCounter(Tokenizer.from_file(str(tok_path)))
+        try:
+            r = self._http.get(f"{self.url}/embed/tokenizer", timeout=self.timeout)
+            r.raise_for_status()
+            return _TokenCounter(Tokenizer.from_str(r.text))
+        except Exception as exc:
+            print(f"Embedding service tokenizer unavailable ({exc}) — chunking with approximate counts.")
+            return None
+
+    def _post(self, texts: list[str]) -> np.ndarray:
+        import base64
+        r = self._http.post(f"{self.url}/embed", json={"texts": texts}, timeout=self.timeout)
+        r.raise_for_status()
+        body = r.json()
+        return vector_from_bytes(base64.b64decode(body["vectors_b64"])).reshape(body["count"], body["dim"])
+
+    def encode(self, sentences, batch_size: int = DEFAULT_BATCH_SIZE, **kwargs: object) -> np.ndarray:
+        single = isinstance(sentences, str)
+        texts  = [sentences] if single else list(sentences)
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        if time.monotonic() >= self._down_until:
+            try:
+                with span("embedding.remote", texts=len(texts)):
+                    vecs = np.vstack([
+                        self._post(texts[i:i + self.request_size])
+                        for i in range(0, len(texts), self.request_size)
+                    ])
+                return vecs[0] if single else vecs
+            except Exception as exc:
+                print(f"Embedding service {self.url} failed ({exc}) — encoding in-process for {EMBED_RETRY_S}s.")
+                self._down_until = time.monotonic() + EMBED_RETRY_S
+        if self._local is None:
+            self._local = load_model(self.name)
+        return self._local.encode(sentences, batch_size=batch_size, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def load_embedder(name: str = DEFAULT_MODEL):
+    """The shared service's client when TALENTOS_EMBED_URL is set and reachable, else load_model()."""
+    if EMBED_URL:
+        try:
+            return RemoteEmbedder(EMBED_URL, name)
+        except Exception as exc:
+            print(f"Embedding service {EMBED_URL} unavailable ({exc}) — loading the model in-process.")
+    return load_model(name)
+
+
+# ─────────────────────────────────────────────────────────────
+# CHUNKING — the model truncates at max_seq_length word pieces
+# ─────────────────────────────────────────────────────────────
+def _has_tokenizer(model) -> bool:
+    return hasattr(getattr(model, "tokenizer", None), "tokenize")
+
+
+def _chunk_budget(model) -> int:
+    # [CLS] and [SEP] take two positions of the model's window.
+    budget = min(CHUNK_TOKENS, int(getattr(model, "max_seq_length", 256) or 256) - 2)
+    if not _has_tokenizer(model):
+        # count_tokens (cl100k) undercounts WordPiece; leave room so chunks are not truncated.
+        budget = int(budget * FALLBACK_BUDGET_RATIO)
+    return max(16, budget)
+
+
+def _token_counter(model):
+    if _has_tokenizer(model):
+        tokenizer = model.tokenizer
+        return lambda text: len(tokenizer.tokenize(text))
+    return count_tokens
+
+
+def tokenizer_json(model) -> Optional[str]:
+    """The model's WordPiece tokenizer as tokenizer.json text (served at GET /embed/tokenizer), if it has one."""
+    if isinstance(model, MicroBatcher):
+        model = model.model
+    if isinstance(model, OnnxEmbedder):
+        return (model.model_dir / "tokenizer.json").read_text(encoding="utf-8")
+    backend = getattr(getattr(model, "tokenizer", None), "backend_tokenizer", None)   # HF fast tokenizer
+    return backend.to_str() if backend is not None else None
+
+
+def chunk_text(text: str, max_tokens: int, count=count_tokens) -> list[str]:
+    """
+    Split on sentence boundaries into chunks of at most max_tokens, carrying
+    the previous sentence over for context. Over-long sentences are split
+    on words.
+    """
+    text = (text or "").strip()
+    if not text:
+        return [""]
+    if count(text) <= max_tokens:
+        return [text]
+
+    pieces: list[tuple[str, int]] = []
+    for sent in split_sentences(text):
+        n = count(sent)
+        if n <= max_tokens:
+            pieces.append((sent, n))
+            continue
+        cur, used = [], 0
+        for w in sent.split():
+            wn = count(w)
+            if cur and used + wn > max_tokens:
+                pieces.append((" ".join(cur), used))
+                cur, used = [], 0
+            cur.append(w)
+            used += wn
+        if cur:
+            pieces.append((" ".join(cur), used))
+
+    chunks: list[str] = []
+    cur, used = [], 0
+    for sent, n in pieces:
+        if cur and used + n > max_tokens:
+            chunks.append(" ".join(s for s, _ in cur))
+            overlap = cur[-1] if cur[-1][1] + n <= max_tokens else None
+            cur, used = ([overlap] if overlap else []), (overlap[1] if overlap else 0)
+        cur.append((sent, n))
+        used += n
+    if cur:
+        chunks.append(" ".join(s for s, _ in cur))
+    return chunks
+
+
+class ChunkCache:
+    """Thread-safe LRU of chunk embeddings keyed by (model, sha1(chunk))."""
+
+    def __init__(self, maxsize: int = CHUNK_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._lock   = threading.Lock()
+        self.hits    = 0
+        self.misses  = 0
+
+    @staticmethod
+    def key(model, chunk: str) -> tuple:
+        return id(model), hashlib.sha1(chunk.encode("utf-8")).digest()
+
+    def get(self, key: tuple) -> Optional[np.ndarray]:
+        with self._lock:
+            vec = self._data.get(key)
+            if vec is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return vec
+
+    def put(self, key: tuple, vec: np.ndarray) -> None:
+        with self._lock:
+            self._data[key] = vec
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_chunk_cache = ChunkCache()
+
+
+def embed_chunks(
+    texts: Sequence[str], model, batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list[np.ndarray]:
+    """
+    Chunk every text and return one (n_chunks, dim) unit-vector matrix per
+    text. Chunks not already cached are encoded together in one batched call.
+    """
+    budget = _chunk_budget(model)
+    count  = _token_counter(model)
+    per_text = [chunk_text(t, budget, count) for t in texts]
+
+    keys    = [[ChunkCache.key(model, c) for c in chunks] for chunks in per_text]
+    vectors = [[_chunk_cache.get(k) for k in ks] for ks in keys]
+    missing = {}
+    for chunks, ks, vs in zip(per_text, keys, vectors):
+        for c, k, v in zip(chunks, ks, vs):
+            if v is None:
+                missing.setdefault(k, c)
+
+    if missing:
+        encoded = encode_normalized(list(missing.values()), model, batch_size)
+        fresh   = dict(zip(missing.keys(), encoded))
+        for k, v in fresh.items():
+            _chunk_cache.put(k, v)
+        vectors = [[v if v is not None else fresh[k] for k, v in zip(ks, vs)] for ks, vs in zip(keys, vectors)]
+    return [np.vstack(vs) for vs in vectors]
+
+
+def _unit(vec: np.ndarray) -> np.ndarray:
+    return vec / max(float(np.linalg.norm(vec)), 1e-12)
+
+
+def pool_similarity(a: np.ndarray, b: np.ndarray, pooling: str = DEFAULT_POOLING, k: int = TOPK_POOL) -> float:
+    """
+    Similarity of two chunked documents (rows are unit chunk vectors):
+      mean — cosine of the mean-pooled document vectors
+      max  — best single chunk pair
+      topk — average of the k best chunk pairs
+    """
+    if pooling == "mean":
+        return float(_unit(a.mean(axis=0)) @ _unit(b.mean(axis=0)))
+    sims = (a @ b.T).ravel()
+    if pooling == "max":
+        return float(sims.max())
+    if pooling == "topk":
+        k = min(k, sims.size)
+        return float(np.partition(sims, -k)[-k:].mean())
+    raise ValueError(f"unknown pooling '{pooling}' (mean | max | topk)")
+
+
+def embed_documents(texts: Sequence[str], model, batch_size: int = DEFAULT_BATCH_SIZE) -> np.ndarray:
+    """One mean-pooled unit vector per text, covering the whole text."""
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+    return np.vstack([_unit(m.mean(axis=0)) for m in embed_chunks(texts, model, batch_size)]).astype(np.float32)
+
+
+def calculate_match_score(
+    user_summary: str, jd_summary: str, model, jd_embedding=None, pooling: str = DEFAULT_POOLING,
+) -> float:
+    """
+    Resume-to-JD similarity as a percentage. jd_embedding (the job's stored
+    mean-pooled vector, see embed_job) is only used with mean pooling: max
+    and topk compare chunk pairs and need the JD's own chunks, so they
+    encode jd_summary whatever is passed.
+    """
+    # 1. Chunk both texts on sentence boundaries and encode every chunk in one
+    #    batch — the model only sees the first max_seq_length word pieces of each input
+    with span("embedding.match", chars=len(user_summary) + len(jd_summary), pooling=pooling) as sp:
+        jd_chunks = None
+        if jd_embedding is not None and pooling == "mean":
+            # 2. Reuse the job's precomputed (mean-pooled) vector (see embed_job)
+            profile_chunks = embed_chunks([user_summary], model)[0]
+            jd_vec = np.asarray(jd_embedding, dtype=np.float32).reshape(1, -1)
+            if jd_vec.shape[1] == profile_chunks.shape[1]:    # otherwise another model's vector
+                jd_chunks = jd_vec / max(float(np.linalg.norm(jd_vec)), 1e-12)
+        if jd_chunks is None:
+            profile_chunks, jd_chunks = embed_chunks([user_summary, jd_summary], model)
+        sp.set(profile_chunks=len(profile_chunks), jd_chunks=len(jd_chunks))
+
+        # 3. Pool chunk similarities into one cosine score
+        # 1.0 means the vectors point in the exact same direction (identical meaning).
+        cosine_score = pool_similarity(profile_chunks, jd_chunks, pooling)
+
+    # 4. Convert to percentage
+    return round(cosine_score * 100, 2)
+
+
+# ─────────────────────────────────────────────────────────────
+# BATCHED SCORING — many profiles × one or more JDs
+# ─────────────────────────────────────────────────────────────
+def encode_normalized(texts: Sequence[str], model, batch_size: int = DEFAULT_BATCH_SIZE) -> np.ndarray:
+    """Encode in batches and L2-normalise once; rows are unit vectors (float32)."""
+    with span("embedding.encode", texts=len(texts), chars=sum(len(t) for t in texts), batch_size=batch_size):
+        vecs = np.asarray(
+            model.encode(list(texts), batch_size=batch_size, convert_to_numpy=True, show_progress_bar=False),
+            dtype=np.float32,
+        )
+    norms = np.linalg.norm(vecs, axis=1, keepdims=True)
+    return vecs / np.maximum(norms, 1e-12)
+
+
+def score_matrix(
+    profiles: Sequence[str], jds: Sequence[str], model, batch_size: int = DEFAULT_BATCH_SIZE,
+) -> np.ndarray:
+    """Cosine similarity × 100 as a (len(profiles), len(jds)) matrix."""
+    if not profiles or not jds:
+        return np.zeros((len(profiles), len(jds)), dtype=np.float32)
+    profile_vecs = embed_documents(profiles, model, batch_size)
+    jd_vecs      = embed_documents(jds, model, batch_size)
+    return profile_vecs @ jd_vecs.T * 100
+
+
+def rank_profiles(
+    profiles: Sequence[str],
+    jds: Union[str, Sequence[str]],
+    model,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    ids: Optional[Sequence[str]] = None,
+    top_k: Optional[int] = None,
+) -> Union[list[dict], list[list[dict]]]:
+    """
+    Rank every profile against each JD, best first. Each entry is
+    {"id", "index", "score"} with score on the same 0–100 scale as
+    calculate_match_score(). A single JD string returns one ranked list;
+    a list of JDs returns one ranked list per JD.
+    """
+    single = isinstance(jds, str)
+    jd_list = [jds] if single else list(jds)
+    ids = list(ids) if ids is not None else [str(i) for i in range(len(profiles))]
+    if len(ids) != len(profiles):
+        raise ValueError("ids must have the same length as profiles")
+
+    scores = score_matrix(profiles, jd_list, model, batch_size)
+    k      = len(profiles) if top_k is None else min(top_k, len(profiles))
+    ranked = []
+    for j in range(len(jd_list)):
+        order = np.argsort(-scores[:, j], kind="stable")[:k]
+        ranked.append([
+            {"id": ids[i], "index": int(i), "score": round(float(scores[i, j]), 2)} for i in order
+        ])
+    return ranked[0] if single else ranked
+
+
+# ─────────────────────────────────────────────────────────────
+# HYBRID SCORING — embedding cosine fused with BM25 keyword coverage
+# ─────────────────────────────────────────────────────────────
+def fuse_scores(semantic: Optional[float], lexical: float, lexical_weight: float = LEXICAL_WEIGHT) -> float:
+    """Weighted blend on the 0–100 scale; lexical alone when there is no model."""
+    if semantic is None:
+        return lexical
+    return (1 - lexical_weight) * semantic + lexical_weight * lexical
+
+
+def rank_hybrid(
+    profiles: Sequence[str],
+    job: dict,
+    model=None,
+    index: Optional[JobIndex] = None,
+    jd_embedding=None,
+    ids: Optional[Sequence[str]] = None,
+    top_k: Optional[int] = None,
+    lexical_weight: float = LEXICAL_WEIGHT,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list[dict]:
+    """
+    Rank many candidate texts against one job, best first:
+    [{"id", "index", "score", "semantic", "lexical"}]. The semantic part is
+    the mean-pooled cosine of calculate_match_score() (None without a model).
+    """
+    ids = list(ids) if ids is not None else [str(i) for i in range(len(profiles))]
+    if len(ids) != len(profiles):
+        raise ValueError("ids must have the same length as profiles")
+    if not profiles:
+        return []
+    index = index or build_job_index(job)
+
+    with span("embedding.rank_hybrid", profiles=len(profiles), model_loaded=model is not None):
+        lexical  = index.score_many(profiles)
+        semantic = [None] * len(profiles)
+        if model is not None:
+            jd_vec = None if jd_embedding is None else _unit(np.asarray(jd_embedding, dtype=np.float32).ravel())
+            vecs   = embed_documents(profiles, model, batch_size)
+            if jd_vec is None or jd_vec.shape[0] != vecs.shape[1]:
+                jd_vec = embed_job(job, model)
+            semantic = (vecs @ jd_vec * 100).tolist()
+
+    rows = [
+        {
+            "id":       ids[i],
+            "index":    i,
+            "score":    round(fuse_scores(semantic[i], lexical[i], lexical_weight), 2),
+            "semantic": None if semantic[i] is None else round(semantic[i], 2),
+            "lexical":  round(lexical[i], 2),
+        }
+        for i in range(len(profiles))
+    ]
+    rows.sort(key=lambda r: -r["score"])
+    return rows if top_k is None else rows[:top_k]
+
+
+# ─────────────────────────────────────────────────────────────
+# SKILL MATCH — every job skill against every resume sentence
+# ─────────────────────────────────────────────────────────────
+SKILL_WEIGHTS       = {"required": 1.0, "nice_to_have": 0.5}
+SKILL_SIM_FLOOR     = float(os.getenv("TALENTOS_SKILL_SIM_FLOOR", "0.30"))   # no credit below
+SKILL_SIM_FULL      = float(os.getenv("TALENTOS_SKILL_SIM_FULL", "0.55"))    # full credit at/above
+LITERAL_MIN_LEN     = 4      # shorter skills ("Go", "AI") need their exact casing for literal credit
+SKILL_MAX_SENTENCES = 400
+EVIDENCE_CHARS      = 200
+
+
+def _job_skills(job: dict) -> list[tuple[str, str]]:
+    """(skill, kind) pairs, deduplicated case-insensitively; required wins."""
+    seen, out = set(), []
+    for kind, field in (("required", "required_skills"), ("nice_to_have", "nice_to_have")):
+        for skill in job.get(field) or []:
+            skill = str(skill).strip()
+            if skill and skill.lower() not in seen:
+                seen.add(skill.lower())
+                out.append((skill, kind))
+    return out
+
+
+def _mentions(skill: str, sentence: str) -> bool:
+    """
+    Whole-word literal mention. Short skills and acronyms are also ordinary
+    words ("go back", "a C grade"), so they only count with the job's exact
+    casing, and a title-case short skill opening the sentence ("Go back…")
+    does not count at all. Single letters ("R", "C") never match literally.
+    Skills that fail here are left to the similarity path.
+    """
+    skill = skill.strip()
+    if len(skill) < 2:
+        return False
+    if len(skill) >= LITERAL_MIN_LEN and not skill.isupper():
+        return re.search(rf"(?<!\w){re.escape(skill.lower())}(?!\w)", sentence.lower()) is not None
+    first = next((i for i, ch in enumerate(sentence) if ch.isalnum()), 0)
+    return any(
+        m.start() != first or skill.isupper()
+        for m in re.finditer(rf"(?<!\w){re.escape(skill)}(?!\w)", sentence)
+    )
+
+
+def skill_match(
+    job: dict, candidate_text: str, model, batch_size: int = DEFAULT_BATCH_SIZE,
+) -> dict:
+    """
+    Deterministic skill coverage of a candidate against a job.
+
+    Every required / nice-to-have skill is compared with every sentence of
+    the candidate text in one similarity matrix. A skill's credit is its
+    best sentence similarity mapped linearly from SKILL_SIM_FLOOR (0) to
+    SKILL_SIM_FULL (1); a literal mention (see _mentions) is full credit.
+    The score is the SKILL_WEIGHTS-weighted mean credit × 100.
+
+    Returns {"score": int | None, "skills": [{"skill", "kind", "similarity",
+    "credit", "evidence"}]}; score is None when the job lists no skills or
+    there is no candidate text.
+    """
+    skills    = _job_skills(job)
+    sentences = split_sentences(candidate_text or "")[:SKILL_MAX_SENTENCES]
+    if not skills or not sentences:
+        return {"score": None, "skills": []}
+
+    with span("embedding.skill_match", skills=len(skills), sentences=len(sentences)):
+        skill_vecs = embed_documents([s for s, _ in skills], model, batch_size)
+        sent_vecs  = embed_documents(sentences, model, batch_size)
+        sims       = skill_vecs @ sent_vecs.T                     # (skills, sentences)
+        best       = sims.argmax(axis=1)
+        best_sim   = sims[np.arange(len(skills)), best]
+        credit     = np.clip((best_sim - SKILL_SIM_FLOOR) / (SKILL_SIM_FULL - SKILL_SIM_FLOOR), 0.0, 1.0)
+
+    breakdown, total, weight = [], 0.0, 0.0
+    for i, (skill, kind) in enumerate(skills):
+        literal  = next((s for s in sentences if _mentions(skill, s)), None)
+        c        = 1.0 if literal is not None else float(credit[i])
+        evidence = literal if literal is not None else (sentences[best[i]] if c > 0 else "")
+        breakdown.append({
+            "skill":      skill,
+            "kind":       kind,
+            "similarity": round(float(best_sim[i]), 3),
+            "credit":     round(c, 2),
+            "evidence":   evidence[:EVIDENCE_CHARS],
+        })
+        total  += SKILL_WEIGHTS[kind] * c
+        weight += SKILL_WEIGHTS[kind]
+    return {"score": int(round(100 * total / weight)), "skills": breakdown}
+
+
+# ─────────────────────────────────────────────────────────────
+# JOB DESCRIPTION VECTORS — computed once per job, stored as float32
+# ─────────────────────────────────────────────────────────────
+def compose_job_text(job: dict) -> str:
+    """Everything the ATS score should see about a job, not just its title."""
+    parts = [job.get("title", ""), job.get("description", "")]
+    if job.get("required_skills"):
+        parts.append("Required skills: " + ", ".join(job["required_skills"]))
+    if job.get("nice_to_have"):
+        parts.append("Nice to have: " + ", ".join(job["nice_to_have"]))
+    if job.get("responsibilities"):
+        parts.append("Responsibilities: " + job["responsibilities"])
+    return "\n".join(p.strip() for p in parts if p and p.strip())
+
+
+def embed_job(job: dict, model) -> np.ndarray:
+    return embed_documents([compose_job_text(job)], model)[0]
+
+
+def vector_to_bytes(vec) -> bytes:
+    """Little-endian float32 — 4 bytes per dimension, no header."""
+    return np.asarray(vec, dtype="<f4").ravel().tobytes()
+
+
+def vector_from_bytes(buf: bytes) -> np.ndarray:
+    return np.frombuffer(buf, dtype="<f4").astype(np.float32)
@@ -0,0 +1,265 @@
+"""
+TalentOS · Vector Store
+Append-only store of unit-length float32 vectors with an id/metadata map,
+used to search past applicants by profile similarity.
+
+  <dir>/vectors.f32  — row-major little-endian float32, one row per item
+  <dir>/items.jsonl  — one JSON object per row: {"id", ...metadata}
+  <dir>/meta.json    — {"dim", "model"}
+  <dir>/ivf.npz      — optional IVF index (centroids + row assignments)
+  <dir>/hnsw.bin     — optional HNSW index (requires hnswlib)
+
+Search is an exact, vectorised cosine top-k over a memmap of all rows by
+default. With index="ivf" only the nprobe closest clusters are scanned;
+with index="hnsw" hnswlib's graph is used. Both fall back to the exact
+scan until the store has enough rows to be worth indexing.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+try:
+    import hnswlib  #type: ignore
+    HAS_HNSWLIB = True
+except ImportError:
+    HAS_HNSWLIB = False
+
+INDEX_MIN_ROWS = 2000     # below this the exact scan is already sub-millisecond
+IVF_ITERATIONS = 10
+HNSW_M         = 16
+HNSW_EF        = 200
+
+
+def _normalize(vec) -> np.ndarray:
+    v = np.asarray(vec, dtype=np.float32).ravel()
+    return v / max(float(np.linalg.norm(v)), 1e-12)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest scores, best first, without a full sort."""
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    part = np.argpartition(-scores, k)[:k]
+    return part[np.argsort(-scores[part], kind="stable")]
+
+
+def _spherical_kmeans(x: np.ndarray, k: int, iters: int = IVF_ITERATIONS, seed: int = 0):
+    rng       = np.random.default_rng(seed)
+    centroids = x[rng.choice(len(x), size=k, replace=False)].copy()
+    for _ in range(iters):
+        assign = np.argmax(x @ centroids.T, axis=1)
+        sums   = np.zeros_like(centroids)
+        np.add.at(sums, assign, x)
+        norms  = np.linalg.norm(sums, axis=1, keepdims=True)
+        # Empty clusters keep their previous centroid.
+        centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+    return centroids.astype(np.float32), np.argmax(x @ centroids.T, axis=1).astype(np.int32)
+
+
+class VectorStore:
+    def __init__(
+        self,
+        directory: str | Path,
+        index: str = "flat",
+        model: str = "",
+        nprobe: int = 8,
+    ):
+        if index not in ("flat", "ivf", "hnsw"):
+            raise ValueError(f"unknown index '{index}' (flat | ivf | hnsw)")
+        if index == "hnsw" and not HAS_HNSWLIB:
+            print("hnswlib not installed — vector store falls back to exact search.")
+            index = "flat"
+        self.dir        = Path(directory)
+        self.index_kind = index
+        self.nprobe     = nprobe
+        self._lock      = threading.Lock()
+        self._vec_path  = self.dir / "vectors.f32"
+        self._item_path = self.dir / "items.jsonl"
+        self._meta_path = self.dir / "meta.json"
+
+        self.dir.mkdir(parents=True, exist_ok=True)
+        meta        = json.loads(self._meta_path.read_text(encoding="utf-8")) if self._meta_path.exists() else {}
+        self.dim    = meta.get("dim")
+        self.model  = meta.get("model", model)
+        self._items = self._read_items()
+        self._ids   = {item["id"] for item in self._items}
+        self._mmap: Optional[np.memmap] = None
+
+        self._centroids: Optional[np.ndarray] = None
+        self._assign:    Optional[np.ndarray] = None
+        self._hnsw = None
+        self._built_rows = 0
+        self._load_index()
+
+    # ── persistence ──────────────────────────────────────────
+    def _read_items(self) -> list[dict]:
+        if not self._item_path.exists():
+            return []
+        items = []
+        with self._item_path.open(encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    items.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break     # torn final write — rows past it are ignored
+        if self.dim and self._vec_path.exists():
+            # vectors.f32 is written first, so it may hold one row more after a crash.
+            items = items[: self._vec_path.stat().st_size // (4 * self.dim)]
+        return items
+
+    def _matrix(self) -> np.ndarray:
+        n = len(self._items)
+        if n == 0:
+            return np.zeros((0, self.dim or 0), dtype=np.float32)
+        if self._mmap is None or self._mmap.shape[0] != n:
+            self._mmap = np.memmap(self._vec_path, dtype="<f4", mode="r", shape=(n, self.dim))
+        return self._mmap
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._ids
+
+    # ── writes ───────────────────────────────────────────────
+    def add(self, item_id: str, vector, **metadata: Any) -> bool:
+        """Append one vector; returns False if item_id is already stored."""
+        vec = _normalize(vector)
+        with self._lock:
+            if item_id in self._ids:
+                return False
+            if self.dim is None:
+                self.dim = int(vec.shape[0])
+                self._meta_path.write_text(json.dumps({"dim": self.dim, "model": self.model}), encoding="utf-8")
+            elif vec.shape[0] != self.dim:
+                raise ValueError(f"vector has {vec.shape[0]} dims, store expects {self.dim}")
+
+            with self._vec_path.open("ab") as fh:
+                fh.write(vec.astype("<f4").tobytes())
+            with self._item_path.open("a", encoding="utf-8") as fh:
+                fh.write(json.dumps({"id": item_id, **metadata}, ensure_ascii=False) + "\n")
+            row = len(self._items)
+            self._items.append({"id": item_id, **metadata})
+            self._ids.add(item_id)
+
+            if self._assign is not None:
+                cluster = np.argmax(self._centroids @ vec).astype(np.int32)
+                self._assign = np.append(self._assign, cluster)
+            if self._hnsw is not None:
+                if row >= self._hnsw.get_max_elements():
+                    self._hnsw.resize_index(2 * (row + 1))
+                self._hnsw.add_items(vec[None, :], np.array([row]))
+            # IVF centroids go stale as the store grows — retrain at every doubling.
+            # HNSW is incremental and only needs its initial build.
+            n = row + 1
+            rebuild = (self.index_kind == "ivf" and n >= max(INDEX_MIN_ROWS, 2 * self._built_rows)) or \
+                      (self.index_kind == "hnsw" and self._hnsw is None and n >= INDEX_MIN_ROWS)
+        if rebuild:
+            self.build_index()
+        return True
+
+    # ── indexes ──────────────────────────────────────────────
+    def _load_index(self) -> None:
+        n = len(self._items)
+        if self.index_kind == "ivf" and (self.dir / "ivf.npz").exists():
+            data = np.load(self.dir / "ivf.npz")
+            self._centroids, self._assign = data["centroids"], data["assign"][:n]
+            self._built_rows = len(self._assign)
+            if len(self._assign) < n:     # rows appended after the index was saved
+                tail = self._matrix()[len(self._assign):]
+                self._assign = np.concatenate([self._assign, np.argmax(tail @ self._centroids.T, axis=1)])
+        elif self.index_kind == "hnsw" and (self.dir / "hnsw.bin").exists():
+            self._hnsw = hnswlib.Index(space="ip", dim=self.dim)
+            self._hnsw.load_index(str(self.dir / "hnsw.bin"), max_elements=max(n, 1) * 2)
+            indexed = self._hnsw.get_current_count()
+            self._built_rows = indexed
+            if indexed < n:
+                self._hnsw.add_items(np.asarray(self._matrix()[indexed:]), np.arange(indexed, n))
+
+    def build_index(self) -> None:
+        """(Re)build the configured index from every stored row and save it."""
+        with self._lock:
+            n = len(self._items)
+            if self.index_kind == "flat" or n < INDEX_MIN_ROWS:
+                return
+            mat = np.asarray(self._matrix())
+            self._built_rows = n
+            if self.index_kind == "ivf":
+                nlist = max(8, int(math.sqrt(n)))
+                self._centroids, self._assign = _spherical_kmeans(mat, nlist)
+                np.savez(self.dir / "ivf.npz", centroids=self._centroids, assign=self._assign)
+            else:
+                index = hnswlib.Index(space="ip", dim=self.dim)
+                index.init_index(max_elements=2 * n, ef_construction=HNSW_EF, M=HNSW_M)
+                index.add_items(mat, np.arange(n))
+                index.save_index(str(self.dir / "hnsw.bin"))
+                self._hnsw = index
+
+    # ── reads ────────────────────────────────────────────────
+    def search(
+        self, query, k: int = 10, where: Optional[Callable[[dict], bool]] = None,
+    ) -> list[dict]:
+        """
+        Top-k items by cosine similarity: [{"id", "score", **metadata}],
+        best first. `where` filters on metadata (applied before ranking for
+        the exact scan, after for the indexes, which over-fetch to compensate).
+        """
+        if not self._items or k <= 0:
+            return []
+        q = _normalize(query)
+        if q.shape[0] != self.dim:
+            raise ValueError(f"query has {q.shape[0]} dims, store expects {self.dim}")
+
+        with self._lock:
+            items = list(self._items)
+            mat   = self._matrix()
+            assign, centroids, hnsw = self._assign, self._centroids, self._hnsw
+
+        fetch = k if where is None else 4 * k
+        if hnsw is not None:
+            hnsw.set_ef(max(HNSW_EF, fetch))
+            labels, dists = hnsw.knn_query(q, k=min(fetch, hnsw.get_current_count()))
+            rows, scores = labels[0], 1.0 - dists[0]
+        elif assign is not None:
+            probe  = np.argsort(-(centroids @ q))[: self.nprobe]
+            cand   = np.flatnonzero(np.isin(assign, probe))
+            sims   = np.asarray(mat[cand]) @ q
+            best   = _top_k(sims, fetch)
+            rows, scores = cand[best], sims[best]
+        else:
+            rows = np.arange(len(items))
+            if where is not None:
+                rows = np.array([i for i in rows if where(items[i])], dtype=np.int64)
+                if not len(rows):
+                    return []
+            sims = (np.asarray(mat) @ q) if where is None else (np.asarray(mat[rows]) @ q)
+            best = _top_k(sims, k)
+            rows, scores = rows[best], sims[best]
+
+        hits = []
+        for row, score in zip(rows, scores):
+            item = items[int(row)]
+            if where is not None and not where(item):
+                continue
+            hits.append({**item, "score": round(float(score), 4)})
+            if len(hits) >= k:
+                break
+        return hits
+
+
+def open_store(directory: str | Path, model: str = "") -> VectorStore:
+    """Store configured by TALENTOS_VECTOR_INDEX (flat | ivf | hnsw) and TALENTOS_VECTOR_NPROBE."""
+    return VectorStore(
+        directory,
+        index=os.getenv("TALENTOS_VECTOR_INDEX", "flat"),
+        model=model,
+        nprobe=int(os.getenv("TALENTOS_VECTOR_NPROBE", "8")),
+    )